@@ -5,7 +5,12 @@ import sys
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
-import requests
+import os
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from http_client import http_get
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -62,7 +67,7 @@ def check_etf(symbol):
     params = {"interval": "1d", "range": "5d"}
 
     try:
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = http_get(url, params=params, headers=HEADERS, timeout=10)
         data = response.json()
         result = data.get("chart", {}).get("result", [])
 
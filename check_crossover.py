@@ -1,12 +1,18 @@
 """Check TQQQ crossover history"""
-import requests
+import os
+import sys
 from datetime import datetime
 
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from http_client import http_get
+
 url = 'https://query1.finance.yahoo.com/v8/finance/chart/TQQQ'
 params = {'interval': '1d', 'range': '2y'}
 headers = {'User-Agent': 'Mozilla/5.0'}
 
-response = requests.get(url, params=params, headers=headers, timeout=15)
+response = http_get(url, params=params, headers=headers, timeout=15)
 data = response.json()
 result = data['chart']['result'][0]
 
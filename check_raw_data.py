@@ -1,8 +1,14 @@
 """
 Yahoo Finance API 원본 데이터 확인 스크립트
 """
-import requests
 import json
+import os
+import sys
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from http_client import http_get
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -17,7 +23,7 @@ def check_symbol(symbol, name):
     params = {"interval": "1d", "range": "5d"}
 
     try:
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = http_get(url, params=params, headers=HEADERS, timeout=10)
         data = response.json()
         result = data.get("chart", {}).get("result", [{}])[0]
 
@@ -5,21 +5,20 @@ import sys
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
-import requests
+import os
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from symbol_registry import get_registry
+from http_client import http_get
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 }
 
-# 현재 목록
-CURRENT_LIST = [
-    "TQQQ", "UPRO", "SPXL", "UDOW", "TNA", "MIDU", "HIBL",
-    "SOXL", "TECL", "FNGU", "BULZ", "WEBL", "UBOT",
-    "FAS", "DPST", "LABU", "CURE", "PILL",
-    "NAIL", "DFEN", "DUSL", "TPOR", "RETL", "WANT", "DRN", "UTSL",
-    "ERX", "GUSH", "NUGT",
-    "TMF", "TYD"
-]
+# 현재 목록 (python/ 레지스트리의 3배 레버리지 유니버스)
+CURRENT_LIST = get_registry().symbols('leveraged_3x')
 
 # 추가로 확인할 3배 Bull ETF 후보
 CANDIDATES = [
@@ -63,7 +62,7 @@ def check_etf(symbol):
     url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
     params = {"interval": "1d", "range": "5d"}
     try:
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = http_get(url, params=params, headers=HEADERS, timeout=10)
         data = response.json()
         result = data.get("chart", {}).get("result", [])
         if result:
@@ -88,6 +88,20 @@ async def trigger_earnings(request):
     return web.Response(text="Scheduler not ready", status=503)
 
 
+async def status_breakers(request):
+    """데이터 소스별 서킷 브레이커 / 호스트 제한 / 시세 소스 상태"""
+    from http_client import get_http_client
+
+    client = get_http_client()
+    status = {
+        'breakers': client.breaker_stats(),
+        'hosts': client.stats(),
+    }
+    if _scheduler_instance:
+        status['quotes'] = _scheduler_instance.stock_monitor.quotes.stats()
+    return web.json_response(status)
+
+
 async def send_test_briefing():
     """시작 시 테스트 브리핑 발송"""
     from fear_greed_tracker import FearGreedTracker, NaverFinanceTracker
@@ -157,6 +171,7 @@ async def main():
     app.router.add_get('/trigger/fg', trigger_fg)
     app.router.add_get('/trigger/dividend', trigger_dividend)
     app.router.add_get('/trigger/earnings', trigger_earnings)
+    app.router.add_get('/status/breakers', status_breakers)
 
     port = int(os.environ.get('PORT', 10000))
     logger.info(f"HTTP 서버 시작 (포트: {port})")
@@ -0,0 +1,58 @@
+"""
+주가 변동 알림 합치기 버퍼
+
+- 최소 발송 간격(10분) 안에 새로 돌파한 레벨을 버리지 않고 보관
+- 같은 종목은 마지막 돌파(최신 레벨/가격)로 합침
+- 간격이 열리는 시각에 버퍼 전체를 한 메시지로 발송 (스케줄러 date job)
+"""
+import logging
+import time
+from typing import Dict, List, Optional
+
+from stock_monitor import PriceChange
+
+logger = logging.getLogger(__name__)
+
+
+class AlertBuffer:
+    """종목별 최신 알림만 유지하는 발송 대기 버퍼 (삽입 순서 유지)"""
+
+    def __init__(self):
+        self._alerts: Dict[str, PriceChange] = {}
+        self._levels: Dict[str, int] = {}
+        self._since: Optional[float] = None  # 가장 오래된 대기 알림 시각 (epoch)
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def add(self, alert: PriceChange, level: int):
+        """
+        알림 추가 (같은 종목이 이미 대기 중이면 최신 알림으로 교체)
+
+        Args:
+            alert: 주가 변동 정보
+            level: 돌파한 임계값 레벨 (하락은 음수)
+        """
+        previous = self._levels.get(alert.symbol)
+        if previous is not None and previous != level:
+            logger.info(f"대기 알림 갱신: {alert.symbol} 레벨 {previous} → {level}")
+        self._alerts[alert.symbol] = alert
+        self._levels[alert.symbol] = level
+        if self._since is None:
+            self._since = time.time()
+
+    def level_of(self, symbol: str) -> Optional[int]:
+        """대기 중인 종목의 레벨 (없으면 None)"""
+        return self._levels.get(symbol)
+
+    def waiting_seconds(self) -> float:
+        """가장 오래된 대기 알림이 기다린 시간 (초)"""
+        return time.time() - self._since if self._since is not None else 0.0
+
+    def drain(self) -> List[PriceChange]:
+        """대기 알림 전부 꺼내고 버퍼 비우기"""
+        alerts = list(self._alerts.values())
+        self._alerts.clear()
+        self._levels.clear()
+        self._since = None
+        return alerts
@@ -0,0 +1,124 @@
+"""
+데이터 소스별 서킷 브레이커
+
+- closed: 정상 요청, 연속 실패가 FAILURE_THRESHOLD회에 도달하면 open
+- open: 요청하지 않고 즉시 실패 (CircuitOpenError) → 장애 소스 때문에 타임아웃을 기다리지 않음
+- half_open: 대기 시간이 지나면 요청 1개만 통과시켜 확인
+  → 성공하면 closed, 실패하면 대기 시간을 2배로 늘려 다시 open (RESET_TIMEOUT_MAX까지)
+- 실패 기준: 연결 오류/타임아웃, 5xx, 429 (서버 쪽 문제) - 그 외 4xx는 요청 자체의 문제라 제외
+"""
+import logging
+import threading
+import time
+from typing import Dict
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# 연속 실패 횟수 기준 / open 후 첫 확인까지 대기 (초) / 대기 상한 (초)
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+RESET_TIMEOUT_MAX = 300.0
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷이 열려 요청을 보내지 않음 (기존 requests 예외 처리로 그대로 잡힘)"""
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT, max_reset_timeout: float = RESET_TIMEOUT_MAX):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0          # 연속 실패 횟수
+        self.opened_at = 0.0       # open 된 시각 (monotonic)
+        self._probing = False      # half_open 확인 요청 진행 중
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.rejected = 0
+        self.trips = 0
+
+    def allow(self) -> bool:
+        """요청 가능 여부 (half_open에서는 확인 요청 1개만 허용)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+            # 확인 요청이 결과 기록 없이 끝난 경우 (예상 밖 예외) 대기 시간이 지나면 다시 확인
+            stale_probe = self._probing and now - self._probe_started >= self.reset_timeout
+            if self.state == HALF_OPEN and (not self._probing or stale_probe):
+                self._probing = True
+                self._probe_started = now
+                logger.info(f"서킷 확인 요청: {self.name}")
+                return True
+            self.rejected += 1
+            return False
+
+    def check(self):
+        """
+        요청 전 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name}: 서킷 열림 (장애 감지, {self.retry_in():.0f}초 후 재확인)")
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"서킷 닫힘 (복구): {self.name}")
+            self.state = CLOSED
+            self.failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # 확인 요청 실패 → 대기 시간 2배로 다시 open
+                self.reset_timeout = min(self.max_reset_timeout, self.reset_timeout * 2)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self._probing = False
+        self.trips += 1
+        logger.warning(f"서킷 열림: {self.name} (연속 실패 {self.failures}회, {self.reset_timeout:.0f}초 후 확인)")
+
+    def retry_in(self) -> float:
+        """다음 확인 요청까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self) -> Dict:
+        """현재 상태 (모니터링용)"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'retry_in': round(self.retry_in(), 1),
+                'trips': self.trips,
+                'rejected': self.rejected,
+            }
@@ -0,0 +1,167 @@
+"""
+장 마감 종가 확정 감지
+
+- 세션 캘린더의 다음 정규장 마감 시각에 감시 시작 (서머타임/조기 마감/휴장일 자동 반영)
+- 마감 후 짧은 간격으로 시세 메타데이터를 폴링해서
+  marketState가 REGULAR에서 바뀌고 regularMarketTime이 마감 시각 이후이면 종가 확정으로 판단
+- 확정 즉시 등록된 후속 작업(오전 브리핑, TQ버스 돌파, 실적 결과) 실행
+- 최대 대기 시간이 지나면 확정 여부와 관계없이 실행 (폴백)
+- 마감 후 작업이 끝나면 다음 거래일 마감을 다시 예약
+- is_active가 False면 (다중 인스턴스 대기 모드) 감시 없이 다음 마감만 예약
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import pytz
+
+from config import CLOSE_POLL_INTERVAL, CLOSE_MAX_WAIT
+from market_sessions import get_calendar
+from stock_monitor import StockMonitor
+
+logger = logging.getLogger(__name__)
+
+# 종가 확정 판단에 쓰는 심볼 (지수 + 대표 ETF 모두 확정되어야 함)
+CLOSE_SYMBOLS = ('^GSPC', 'TQQQ')
+
+# 재시작 시 이 시간 안에 지난 마감은 바로 감시 (스케줄러 misfire_grace_time과 동일)
+CATCHUP_SECONDS = 3600
+
+
+@dataclass
+class CloseDependent:
+    """종가 확정 후 실행할 작업"""
+    name: str
+    callback: Callable[[], Awaitable[None]]
+    delay: int  # 확정 후 지연 (초)
+
+
+class CloseDetector:
+    """정규장 마감 후 종가 확정을 감지해서 후속 작업 실행"""
+
+    def __init__(self, scheduler, stock_monitor: StockMonitor, market: str = 'US',
+                 symbols: Sequence[str] = CLOSE_SYMBOLS,
+                 poll_interval: int = CLOSE_POLL_INTERVAL,
+                 max_wait: int = CLOSE_MAX_WAIT,
+                 is_active: Callable[[], bool] = None):
+        self.scheduler = scheduler
+        self.stock_monitor = stock_monitor
+        self.market = market
+        self.symbols = tuple(symbols)
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.is_active = is_active  # False면 감시 생략 (다중 인스턴스 대기 모드)
+        self.dependents: List[CloseDependent] = []
+        self.last_release: Dict = {}  # 마지막 확정 정보 (마감 시각, 지연, 사유)
+
+    @property
+    def job_id(self) -> str:
+        return f'close_detector_{self.market.lower()}'
+
+    def on_close(self, name: str, callback: Callable[[], Awaitable[None]], delay: int = 0):
+        """
+        종가 확정 후 실행할 작업 등록
+
+        Args:
+            name: 작업 이름 (스케줄러 job id에 사용)
+            callback: 인자 없는 async 함수
+            delay: 확정 후 추가 대기 (초)
+        """
+        self.dependents.append(CloseDependent(name=name, callback=callback, delay=delay))
+
+    def start(self):
+        """감시 시작 (방금 지난 마감이 있으면 바로 감시, 아니면 다음 마감 예약)"""
+        now = time.time()
+        last_close = get_calendar(self.market, now).last_close(now)
+        if last_close and now - last_close < CATCHUP_SECONDS:
+            logger.info(f"{self.market} 마감 직후 시작 - 종가 확정 감시 즉시 실행")
+            self._add_watch_job(last_close, run_at=now)
+        else:
+            self.schedule_next(now)
+
+    def schedule_next(self, ts: float = None):
+        """ts 이후 다음 정규장 마감 시각에 감시 예약"""
+        ts = time.time() if ts is None else ts
+        close_ts = get_calendar(self.market, ts).next_close(ts)
+        if close_ts is None:
+            # 캘린더 범위 끝 - 범위 밖 시각으로 다시 조회하면 캘린더가 새로 생성됨
+            close_ts = get_calendar(self.market, ts + 7 * 86400).next_close(ts)
+        if close_ts is None:
+            logger.error(f"{self.market} 다음 마감 시각을 찾을 수 없음")
+            return
+
+        self._add_watch_job(close_ts, run_at=close_ts)
+        kst = datetime.fromtimestamp(close_ts, pytz.timezone('Asia/Seoul'))
+        logger.info(f"{self.market} 종가 확정 감시 예약: {kst.strftime('%m/%d %H:%M')} KST")
+
+    def _add_watch_job(self, close_ts: float, run_at: float):
+        self.scheduler.add_job(
+            self.watch,
+            'date',
+            run_date=datetime.fromtimestamp(run_at, pytz.utc),
+            args=[close_ts],
+            id=self.job_id,
+            name=f'{self.market} 종가 확정 감시',
+            replace_existing=True
+        )
+
+    def is_final(self, meta: Optional[Dict], close_ts: float) -> bool:
+        """시세 메타데이터 기준 종가 확정 여부"""
+        if not meta:
+            return False
+        if meta.get('marketState') == 'REGULAR':
+            return False
+        return (meta.get('regularMarketTime') or 0) >= close_ts
+
+    async def watch(self, close_ts: float):
+        """마감 후 종가 확정까지 폴링 후 후속 작업 실행"""
+        if self.is_active is not None and not self.is_active():
+            logger.info(f"{self.market} 종가 확정 감시 생략 (대기 인스턴스)")
+            self.schedule_next(max(time.time(), close_ts + 1))
+            return
+
+        loop = asyncio.get_event_loop()
+        deadline = close_ts + self.max_wait
+        reason = 'timeout'
+
+        try:
+            while time.time() < deadline:
+                metas = await asyncio.gather(*[
+                    loop.run_in_executor(None, self.stock_monitor.get_quote_meta, symbol)
+                    for symbol in self.symbols
+                ])
+                if all(self.is_final(meta, close_ts) for meta in metas):
+                    reason = 'final'
+                    break
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            logger.error(f"{self.market} 종가 확정 감시 오류: {e}")
+            reason = 'error'
+
+        latency = time.time() - close_ts
+        if reason == 'final':
+            logger.info(f"{self.market} 종가 확정 감지 (마감 후 {latency:.0f}초)")
+        else:
+            logger.warning(f"{self.market} 종가 확정 미감지 ({reason}) - 후속 작업 실행")
+        self.last_release = {'close': close_ts, 'latency': latency, 'reason': reason}
+
+        try:
+            self._release()
+        finally:
+            self.schedule_next(max(time.time(), close_ts + 1))
+
+    def _release(self):
+        """후속 작업을 각각 독립된 date job으로 실행 (하나가 느려도 다른 작업에 영향 없음)"""
+        now = datetime.now(pytz.utc)
+        for dependent in self.dependents:
+            self.scheduler.add_job(
+                dependent.callback,
+                'date',
+                run_date=now + timedelta(seconds=dependent.delay),
+                id=f'close_{dependent.name}',
+                name=dependent.name,
+                replace_existing=True
+            )
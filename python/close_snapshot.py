@@ -0,0 +1,279 @@
+"""
+장 마감 스냅샷
+
+- 미국 장 종가 확정 후 레지스트리 전 종목의 1년 일봉을 한 번만 조회
+- 종가/전일 종가/52주 고저/연초·1년 전·1개월 전 종가를 레지스트리 ID 순서의 배열로 보관
+- TQQQ 3년 종가(TQ버스), 배당 정보, Fear & Greed도 함께 저장
+- data/close_snapshot.npz 한 파일로 저장 → 다음 마감 전까지 모든 브리핑이 네트워크 없이 재사용
+"""
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from market_sessions import get_calendar, market_today
+from symbol_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 파일
+SNAPSHOT_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'close_snapshot.npz')
+
+# 종목별 수치 배열 (NaN = 데이터 없음)
+FIELDS = (
+    'close',        # 종가 (regularMarketPrice)
+    'prev_close',   # 전일 종가
+    'high_52w',     # 52주 최고 종가
+    'low_52w',      # 52주 최저 종가
+    'high_52w_ts',  # 52주 최고 종가 날짜 (epoch)
+    'year_start',   # 올해 첫 거래일 종가 (YTD 기준)
+    'year_ago',     # 약 1년(252거래일) 전 종가
+    'month_ago',    # 약 1개월(21거래일) 전 종가
+    'last_ts',      # 마지막 일봉 시각 (epoch)
+)
+
+# 배당 정보 배열
+DIVIDEND_FIELDS = ('div_price', 'div_yield', 'div_ex_date', 'div_pay_date')
+
+# 스냅샷 조회 동시 요청 수
+FETCH_WORKERS = 8
+
+
+def summarize_chart(timestamps: Sequence[int], closes: Sequence[Optional[float]],
+                    current_price: float = None) -> Optional[Dict[str, float]]:
+    """
+    일봉 종가 리스트 → 스냅샷 수치 (FIELDS)
+
+    Args:
+        current_price: 현재가 (생략 시 마지막 종가)
+    """
+    valid = [(ts, c) for ts, c in zip(timestamps, closes) if c is not None]
+    if not valid:
+        return None
+
+    valid_closes = [c for _, c in valid]
+    current = current_price or valid_closes[-1]
+
+    high_ts, high = max(valid, key=lambda item: item[1])
+    low = min(valid_closes)
+
+    year_start_ts = datetime(datetime.now().year, 1, 1).timestamp()
+    year_start = next((c for ts, c in valid if ts >= year_start_ts), None)
+
+    return {
+        'close': current,
+        'prev_close': valid_closes[-2] if len(valid_closes) >= 2 else current,
+        'high_52w': high,
+        'low_52w': low,
+        'high_52w_ts': high_ts,
+        'year_start': year_start,
+        'year_ago': valid_closes[max(0, len(valid_closes) - 252)] if len(valid_closes) > 200 else None,
+        'month_ago': valid_closes[-22] if len(valid_closes) > 21 else None,
+        'last_ts': valid[-1][0],
+    }
+
+
+def current_session(market: str = 'US', ts: float = None) -> str:
+    """마지막 정규장 마감의 현지 날짜 (스냅샷 세션 키)"""
+    ts = time.time() if ts is None else ts
+    last_close = get_calendar(market, ts).last_close(ts)
+    if last_close is None:
+        return ""
+    return market_today(market, last_close).strftime('%Y-%m-%d')
+
+
+class CloseSnapshot:
+    """장 마감 스냅샷 (종목별 배열 + TQQQ 히스토리 + 배당 + 부가 데이터)"""
+
+    def __init__(self, session: str, taken_at: float, symbols: List[str],
+                 arrays: Dict[str, np.ndarray],
+                 histories: Dict[str, Tuple[np.ndarray, np.ndarray]] = None,
+                 extras: Dict = None):
+        self.session = session
+        self.taken_at = taken_at
+        self.symbols = list(symbols)
+        self.arrays = arrays
+        self.histories = histories or {}
+        self.extras = extras or {}
+        # 저장 당시 심볼 순서 기준 인덱스 (레지스트리가 바뀌어도 심볼로 조회)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def count(self) -> int:
+        """종가가 있는 종목 수"""
+        return int(np.count_nonzero(~np.isnan(self.arrays['close'])))
+
+    def is_current(self, market: str = 'US') -> bool:
+        """마지막 정규장 마감의 스냅샷인지"""
+        return self.session == current_session(market)
+
+    def row(self, symbol: str) -> Optional[Dict[str, Optional[float]]]:
+        """종목 수치 (없으면 None, 개별 항목 NaN → None)"""
+        i = self._index.get(symbol)
+        if i is None or np.isnan(self.arrays['close'][i]):
+            return None
+        return {
+            field: (None if np.isnan(self.arrays[field][i]) else float(self.arrays[field][i]))
+            for field in FIELDS
+        }
+
+    def history(self, symbol: str) -> Optional[Tuple[List[float], List[int], float]]:
+        """저장된 일봉 히스토리 (종가 리스트, 타임스탬프 리스트, 현재가)"""
+        if symbol not in self.histories:
+            return None
+        timestamps, closes = self.histories[symbol]
+        row = self.row(symbol)
+        current = row['close'] if row else float(closes[-1])
+        return closes.tolist(), timestamps.tolist(), current
+
+    def dividend(self, symbol: str) -> Optional[Dict]:
+        """배당 정보 {'price', 'dividend_yield', 'ex_dividend_date', 'pay_date'}"""
+        i = self._index.get(symbol)
+        if i is None or 'div_yield' not in self.arrays or np.isnan(self.arrays['div_yield'][i]):
+            return None
+        return {
+            'price': float(self.arrays['div_price'][i]),
+            'dividend_yield': float(self.arrays['div_yield'][i]),
+            'ex_dividend_date': str(self.arrays['div_ex_date'][i]) or None,
+            'pay_date': str(self.arrays['div_pay_date'][i]) or None,
+        }
+
+    def save(self, path: str = None):
+        """npz 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = path or SNAPSHOT_FILE
+        payload = {
+            'session': np.array(self.session),
+            'taken_at': np.array(self.taken_at),
+            'symbols': np.array(self.symbols),
+            'extras': np.array(json.dumps(self.extras, ensure_ascii=False)),
+            'history_symbols': np.array(list(self.histories)),
+        }
+        payload.update(self.arrays)
+        for symbol, (timestamps, closes) in self.histories.items():
+            payload[f'hist_ts__{symbol}'] = timestamps
+            payload[f'hist_close__{symbol}'] = closes
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(tmp_path, **payload)
+        os.replace(tmp_path, path)
+        logger.info(f"장 마감 스냅샷 저장: {self.session}, {self.count()}/{len(self.symbols)}개 종목")
+
+    @classmethod
+    def load(cls, path: str = None) -> Optional['CloseSnapshot']:
+        """npz 파일에서 로드 (없거나 손상되면 None)"""
+        path = path or SNAPSHOT_FILE
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {key: data[key] for key in FIELDS + DIVIDEND_FIELDS if key in data}
+                histories = {
+                    str(symbol): (data[f'hist_ts__{symbol}'], data[f'hist_close__{symbol}'])
+                    for symbol in data['history_symbols']
+                }
+                return cls(
+                    session=str(data['session']),
+                    taken_at=float(data['taken_at']),
+                    symbols=[str(s) for s in data['symbols']],
+                    arrays=arrays,
+                    histories=histories,
+                    extras=json.loads(str(data['extras'])),
+                )
+        except Exception as e:
+            logger.error(f"장 마감 스냅샷 로드 오류: {e}")
+            return None
+
+
+def build_close_snapshot(fetch_chart: Callable[[str], Optional[Dict]],
+                         histories: Dict[str, Optional[Tuple[List[float], List[int], float]]] = None,
+                         dividends: List = None,
+                         extras: Dict = None) -> CloseSnapshot:
+    """
+    레지스트리 전 종목 스냅샷 생성
+
+    Args:
+        fetch_chart: 심볼 → {'timestamps', 'closes', 'meta'} (StockMonitor.get_daily_chart)
+        histories: 별도로 보관할 히스토리 {심볼: get_tqqq_data() 형식}
+        dividends: DividendInfo 리스트
+        extras: JSON으로 저장할 부가 데이터 (예: Fear & Greed)
+    """
+    registry = get_registry()
+    symbols = [registry.symbol_of(sid) for sid in range(len(registry))]
+    arrays = {field: np.full(len(symbols), np.nan) for field in FIELDS}
+
+    def fetch(symbol: str) -> Optional[Dict[str, float]]:
+        chart = fetch_chart(symbol)
+        if not chart:
+            return None
+        return summarize_chart(chart['timestamps'], chart['closes'],
+                               chart['meta'].get('regularMarketPrice'))
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        rows = list(pool.map(fetch, symbols))
+
+    for sid, row in enumerate(rows):
+        if row is None:
+            continue
+        for field in FIELDS:
+            if row[field] is not None:
+                arrays[field][sid] = row[field]
+
+    # 배당 정보 (레지스트리 ID 배열)
+    if dividends:
+        arrays['div_price'] = np.full(len(symbols), np.nan)
+        arrays['div_yield'] = np.full(len(symbols), np.nan)
+        arrays['div_ex_date'] = np.full(len(symbols), '', dtype='<U10')
+        arrays['div_pay_date'] = np.full(len(symbols), '', dtype='<U10')
+        for item in dividends:
+            sid = registry.id_of(item.symbol)
+            if sid is None:
+                continue
+            arrays['div_price'][sid] = item.price
+            arrays['div_yield'][sid] = item.dividend_yield
+            arrays['div_ex_date'][sid] = item.ex_dividend_date or ''
+            arrays['div_pay_date'][sid] = item.pay_date or ''
+
+    stored_histories = {}
+    for symbol, data in (histories or {}).items():
+        if data:
+            closes, timestamps, _ = data
+            stored_histories[symbol] = (np.asarray(timestamps, dtype=np.int64), np.asarray(closes, dtype=np.float64))
+
+    snapshot = CloseSnapshot(
+        session=current_session('US'),
+        taken_at=time.time(),
+        symbols=symbols,
+        arrays=arrays,
+        histories=stored_histories,
+        extras=extras,
+    )
+    missing = [symbols[sid] for sid, row in enumerate(rows) if row is None]
+    if missing:
+        logger.warning(f"장 마감 스냅샷 누락 {len(missing)}개: {', '.join(missing[:10])}")
+    return snapshot
+
+
+_snapshot: Optional[CloseSnapshot] = None
+
+
+def set_close_snapshot(snapshot: CloseSnapshot):
+    """새로 만든 스냅샷을 현재 스냅샷으로 등록"""
+    global _snapshot
+    _snapshot = snapshot
+
+
+def get_close_snapshot(market: str = 'US') -> Optional[CloseSnapshot]:
+    """마지막 정규장 마감 스냅샷 (메모리 → 파일 순, 지난 세션이면 None)"""
+    global _snapshot
+    if _snapshot is None or not _snapshot.is_current(market):
+        loaded = CloseSnapshot.load()
+        if loaded is not None:
+            _snapshot = loaded
+    if _snapshot is not None and _snapshot.is_current(market):
+        return _snapshot
+    return None
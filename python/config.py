@@ -29,6 +29,27 @@ UPDATE_INTERVAL = int(os.getenv('UPDATE_INTERVAL', '3600'))
 # 주가 모니터링 간격 (초) - 기본 5분
 STOCK_CHECK_INTERVAL = int(os.getenv('STOCK_CHECK_INTERVAL', '300'))
 
+# 공용 시세 틱 간격 (초) - 가장 짧은 종목별 조회 주기 (종목별 주기는 poll_planner가 결정)
+MARKET_TICK_INTERVAL = int(os.getenv('MARKET_TICK_INTERVAL', '30'))
+
+# 장 마감 종가 확정 감지 (초) - 마감 후 폴링 간격 / 최대 대기 시간
+CLOSE_POLL_INTERVAL = int(os.getenv('CLOSE_POLL_INTERVAL', '30'))
+CLOSE_MAX_WAIT = int(os.getenv('CLOSE_MAX_WAIT', '1200'))
+
+# 암호화폐 웹소켓 스트림 (Binance) - 사용 여부 / 구독 종목 (쉼표 구분, 비우면 레지스트리 crypto 유니버스) / 스트림 주소
+CRYPTO_STREAM_ENABLED = os.getenv('CRYPTO_STREAM_ENABLED', 'true').lower() == 'true'
+CRYPTO_STREAM_SYMBOLS = [s.strip() for s in os.getenv('CRYPTO_STREAM_SYMBOLS', '').split(',') if s.strip()]
+BINANCE_WS_URL = os.getenv('BINANCE_WS_URL', 'wss://stream.binance.com:9443/stream')
+
+# 차트/테이블 렌더링 워커 프로세스 수
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', '2'))
+
+# 이미지 업로드 바이트 예산 - 넘으면 JPEG 품질 / 해상도를 낮춤
+PHOTO_MAX_BYTES = int(os.getenv('PHOTO_MAX_BYTES', str(512 * 1024)))
+
+# 여러 인스턴스 동시 실행 시 리더 임대 시간 (초) - 리더 중단 시 대기 인스턴스가 이 시간 안에 인계
+LEADER_LEASE_TTL = int(os.getenv('LEADER_LEASE_TTL', '60'))
+
 # 미국 시장 장 마감 시간 자동 설정 (서머타임 고려, +10분 여유)
 def get_us_market_close_time_kst():
     """
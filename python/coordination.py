@@ -0,0 +1,143 @@
+"""
+다중 인스턴스 조정 (리더 선출 + 원자적 발송 선점)
+
+- 리더 임대: Redis `SET leader NX EX ttl`로 임대를 잡은 인스턴스만 폴링 작업 실행
+- 하트비트: ttl/3 간격으로 임대 갱신 (내 임대일 때만 EXPIRE, Lua로 원자 처리)
+  → 리더가 죽으면 임대 만료 후 다음 하트비트에서 대기 인스턴스가 인계
+  → 정상 종료 시 임대를 바로 반납해서 대기 인스턴스가 즉시 인계
+- 하트비트가 끊기면 (Redis 오류 등) 임대 만료 시각에 스스로 리더에서 내려옴
+- 발송 선점: `SET key NX EX ttl` 한 번으로 확인+기록 → 두 인스턴스가 같은 알림을 보낼 수 없음
+- Redis 미사용 시 단일 인스턴스로 보고 항상 리더, 선점은 메모리에서 처리
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict
+
+from config import LEADER_LEASE_TTL
+
+logger = logging.getLogger(__name__)
+
+# 리더 임대 키
+LEADER_KEY = "leader:telebot"
+
+# 내 임대일 때만 갱신 / 반납 (다른 인스턴스가 잡은 임대는 건드리지 않음)
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class Coordinator:
+    """리더 임대 + 발송 선점"""
+
+    def __init__(self, redis_client=None, lease_key: str = LEADER_KEY, lease_ttl: int = LEADER_LEASE_TTL,
+                 on_elected: Callable[[], None] = None):
+        self.redis = redis_client
+        self.on_elected = on_elected  # 리더가 될 때 호출 (이전 리더가 남긴 상태 로드 등)
+        self.lease_key = lease_key
+        self.lease_ttl = lease_ttl
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._leader = redis_client is None
+        self._lease_deadline = float('inf') if redis_client is None else 0.0  # monotonic
+        self._claims: Dict[str, float] = {}  # 메모리 선점 {키: 만료 monotonic}
+        self._lock = threading.Lock()
+
+    @property
+    def heartbeat_interval(self) -> int:
+        """임대 갱신 간격 (초)"""
+        return max(1, self.lease_ttl // 3)
+
+    @property
+    def is_leader(self) -> bool:
+        """현재 리더인지 (임대 만료 시각이 지나면 갱신 실패로 보고 False)"""
+        return self._leader and time.monotonic() < self._lease_deadline
+
+    def _set_leader(self, leader: bool, deadline: float = 0.0):
+        if leader != self._leader:
+            if leader:
+                logger.info(f"리더 임대 획득: {self.instance_id}")
+            else:
+                logger.warning(f"리더 임대 상실: {self.instance_id} (대기 모드)")
+        elected = leader and not self._leader
+        self._leader = leader
+        self._lease_deadline = deadline if leader else 0.0
+        if elected and self.on_elected is not None:
+            try:
+                self.on_elected()
+            except Exception as e:
+                logger.error(f"리더 인계 처리 오류: {e}")
+
+    def heartbeat(self) -> bool:
+        """
+        임대 갱신 또는 획득 시도 (스케줄러 interval job)
+
+        Returns:
+            리더 여부
+        """
+        if self.redis is None:
+            return True
+
+        # 요청 전 시각 기준으로 만료 계산 (Redis 쪽 만료보다 항상 먼저 내려옴)
+        deadline = time.monotonic() + self.lease_ttl
+        try:
+            if self._leader:
+                renewed = self.redis.eval(RENEW_SCRIPT, keys=[self.lease_key],
+                                          args=[self.instance_id, str(self.lease_ttl)])
+                if renewed:
+                    self._set_leader(True, deadline)
+                    return True
+
+            acquired = self.redis.set(self.lease_key, self.instance_id, nx=True, ex=self.lease_ttl)
+            self._set_leader(bool(acquired), deadline)
+        except Exception as e:
+            logger.error(f"리더 임대 갱신 오류: {e}")
+            if not self.is_leader:
+                self._set_leader(False)
+        return self.is_leader
+
+    def release(self):
+        """임대 반납 (정상 종료 시)"""
+        if self.redis is None or not self._leader:
+            return
+        try:
+            self.redis.eval(RELEASE_SCRIPT, keys=[self.lease_key], args=[self.instance_id])
+            logger.info(f"리더 임대 반납: {self.instance_id}")
+        except Exception as e:
+            logger.error(f"리더 임대 반납 오류: {e}")
+        self._set_leader(False)
+
+    def claim(self, key: str, ttl: int) -> bool:
+        """
+        발송 선점 (SET NX EX) - True를 받은 호출자만 발송
+
+        Args:
+            key: 선점 키 (예: alert:TQQQ:5, briefing:morning:2026-10-19)
+            ttl: 선점 유지 시간 (초)
+        """
+        if self.redis is not None:
+            try:
+                return bool(self.redis.set(key, self.instance_id, nx=True, ex=ttl))
+            except Exception as e:
+                logger.error(f"Redis 선점 오류 ({key}): {e} - 메모리 선점 사용")
+
+        now = time.monotonic()
+        with self._lock:
+            expires = self._claims.get(key)
+            if expires is not None and expires > now:
+                return False
+            self._claims[key] = now + ttl
+            if len(self._claims) > 1024:
+                self._claims = {k: v for k, v in self._claims.items() if v > now}
+            return True
@@ -0,0 +1,226 @@
+"""
+Binance 웹소켓 암호화폐 시세 스트림
+
+- 암호화폐 바스켓(레지스트리 provider=binance 종목)의 결합 스트림 구독
+  (miniTicker: 현재가 1초 간격 / kline_1d: UTC 00:00 기준 당일 시가)
+- 최신 현재가/당일 시가를 메모리에 유지 → 업데이트마다 콜백 (폴링 없이 알림 판단)
+- 연결이 끊기면 지수 백오프 + 지터로 자동 재연결
+- 스트림 시세가 오래되면 (STALE_SECONDS) quote()가 None → 시세 틱의 REST 조회로 폴백
+- 테스트용 로컬 스트림: LocalBinanceStream (같은 형식의 메시지를 보내는 aiohttp 서버)
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from symbol_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+BINANCE_WS_URL = 'wss://stream.binance.com:9443/stream'
+
+# 이 시간(초) 넘게 업데이트가 없으면 스트림 시세를 쓰지 않음 (REST 폴백)
+STALE_SECONDS = 60
+
+# 재연결 백오프 (초)
+RECONNECT_BASE = 1.0
+RECONNECT_CAP = 60.0
+
+# 웹소켓 ping 간격 (초)
+HEARTBEAT_SECONDS = 30
+
+UpdateCallback = Callable[[str, float, float], Awaitable[None]]
+
+
+def binance_basket(symbols: Iterable[str]) -> Dict[str, str]:
+    """레지스트리 심볼 중 Binance 종목만 {Binance 심볼(소문자): 레지스트리 심볼}"""
+    registry = get_registry()
+    basket = {}
+    for symbol in symbols:
+        info = registry.info(symbol)
+        if info is None or info.provider != 'binance':
+            logger.warning(f"암호화폐 스트림: Binance 종목이 아님 - {symbol} 제외")
+            continue
+        basket[info.provider_symbol.lower()] = symbol
+    return basket
+
+
+class CryptoStream:
+    """Binance 결합 스트림 구독 + 최신 시세 보관"""
+
+    def __init__(self, symbols: Iterable[str], on_update: UpdateCallback = None, url: str = BINANCE_WS_URL):
+        """
+        Args:
+            symbols: 레지스트리 심볼 (예: BTC-USD)
+            on_update: (심볼, 현재가, 당일 시가)를 받는 async 콜백 (당일 시가를 받은 뒤부터 호출)
+            url: 결합 스트림 주소 (테스트 시 로컬 스트림 주소)
+        """
+        self.basket = binance_basket(symbols)
+        self.on_update = on_update
+        self.url = url
+        self._prices: Dict[str, float] = {}
+        self._opens: Dict[str, float] = {}
+        self._updated: Dict[str, float] = {}  # 심볼 → 마지막 업데이트 (monotonic)
+        self._running = False
+        self._ws = None
+
+        # 통계
+        self.connects = 0
+        self.messages = 0
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.basket.values())
+
+    def stream_url(self) -> str:
+        streams = '/'.join(f"{pair}@{kind}" for pair in self.basket for kind in ('miniTicker', 'kline_1d'))
+        return f"{self.url}?streams={streams}"
+
+    def quote(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """(현재가, 당일 시가) - 스트림이 최신이 아니면 None"""
+        if not self.is_live(symbol):
+            return None
+        return self._prices[symbol], self._opens[symbol]
+
+    def is_live(self, symbol: str) -> bool:
+        """스트림 시세가 최신인지 (현재가/시가 모두 있고 STALE_SECONDS 안에 업데이트)"""
+        updated = self._updated.get(symbol)
+        return (updated is not None and symbol in self._opens
+                and time.monotonic() - updated < STALE_SECONDS)
+
+    async def run(self):
+        """스트림 구독 (stop() 전까지 자동 재연결)"""
+        if not self.basket:
+            logger.info("암호화폐 스트림: 구독 종목 없음")
+            return
+        self._running = True
+        attempt = 0
+        async with aiohttp.ClientSession() as session:
+            while self._running:
+                try:
+                    async with session.ws_connect(self.stream_url(), heartbeat=HEARTBEAT_SECONDS) as ws:
+                        self._ws = ws
+                        self.connects += 1
+                        logger.info(f"암호화폐 스트림 연결: {', '.join(self.symbols)}")
+                        async for msg in ws:
+                            if msg.type != aiohttp.WSMsgType.TEXT:
+                                break
+                            attempt = 0  # 메시지를 받으면 백오프 초기화
+                            await self._handle(msg.data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"암호화폐 스트림 오류: {e}")
+                finally:
+                    self._ws = None
+
+                if not self._running:
+                    break
+                delay = random.uniform(0, min(RECONNECT_CAP, RECONNECT_BASE * (2 ** attempt)))
+                attempt += 1
+                logger.info(f"암호화폐 스트림 끊김 - {delay:.1f}초 후 재연결 (REST 폴백)")
+                await asyncio.sleep(delay)
+
+    async def stop(self):
+        """구독 중지"""
+        self._running = False
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def _handle(self, raw: str):
+        """결합 스트림 메시지 처리 {'stream': ..., 'data': {...}}"""
+        try:
+            data = json.loads(raw).get('data', {})
+            symbol = self.basket.get(str(data.get('s', '')).lower())
+            if symbol is None:
+                return
+            if data.get('e') == 'kline':
+                kline = data['k']
+                self._opens[symbol] = float(kline['o'])
+                price = float(kline['c'])
+            elif data.get('e') == '24hrMiniTicker':
+                price = float(data['c'])
+            else:
+                return
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"암호화폐 스트림 메시지 무시: {e}")
+            return
+
+        self.messages += 1
+        self._prices[symbol] = price
+        self._updated[symbol] = time.monotonic()
+        if self.on_update is not None and symbol in self._opens:
+            try:
+                await self.on_update(symbol, price, self._opens[symbol])
+            except Exception as e:
+                logger.error(f"암호화폐 스트림 콜백 오류 ({symbol}): {e}")
+
+    def stats(self) -> Dict:
+        """현재 상태 (모니터링용)"""
+        return {
+            'connected': self._ws is not None,
+            'connects': self.connects,
+            'messages': self.messages,
+            'live': [symbol for symbol in self.symbols if self.is_live(symbol)],
+        }
+
+
+class LocalBinanceStream:
+    """테스트용 로컬 Binance 결합 스트림 (같은 메시지 형식)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self.host = host
+        self.port = port
+        self._clients: List[web.WebSocketResponse] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/stream"
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/stream', self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._clients.append(ws)
+        try:
+            async for _ in ws:
+                pass
+        finally:
+            self._clients.remove(ws)
+        return ws
+
+    async def disconnect_all(self):
+        """연결 강제 종료 (재연결 테스트용)"""
+        for ws in list(self._clients):
+            await ws.close()
+
+    async def push(self, pair: str, price: float, day_open: float = None):
+        """miniTicker (+ day_open이 있으면 kline_1d) 메시지 전송"""
+        pair = pair.lower()
+        messages = []
+        if day_open is not None:
+            messages.append({'stream': f'{pair}@kline_1d', 'data': {
+                'e': 'kline', 's': pair.upper(), 'k': {'o': str(day_open), 'c': str(price)}}})
+        messages.append({'stream': f'{pair}@miniTicker', 'data': {
+            'e': '24hrMiniTicker', 's': pair.upper(), 'c': str(price)}})
+        for ws in list(self._clients):
+            for message in messages:
+                await ws.send_str(json.dumps(message))
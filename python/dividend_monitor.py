@@ -1,12 +1,24 @@
 """
 배당주 모니터링 및 브리핑 모듈
+- 배당 현황 테이블 이미지 (table_renderer)
+- 배당 종목 뉴스 알림: 헤드라인을 종목 매처(news_matcher)로 태깅해서 종목별로 묶어 발송
 """
+import io
 import logging
+import os
+import re
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+from symbol_registry import get_registry
+from close_snapshot import CloseSnapshot
+from headline_index import HeadlineIndex
+from news_matcher import WatchlistMatcher, registry_aliases
+from render_service import get_render_service
+from table_renderer import render_table
 
 logger = logging.getLogger(__name__)
 
@@ -18,28 +30,40 @@ class DividendInfo:
     dividend_yield: float  # % 단위
     ex_dividend_date: Optional[str] = None  # YYYY-MM-DD
     pay_date: Optional[str] = None  # YYYY-MM-DD
-    
+
+
+@dataclass
+class NewsAlert:
+    symbol: str
+    message: str
+    titles: List[str]  # 원문 헤드라인 (발송 후 sent_index에 등록)
+
 class DividendMonitor:
     """배당주 및 배당 ETF 모니터링 클래스"""
     
-    # 모니터링할 배당 ETF 및 종목 목록
-    DIVIDEND_ETFS = {
-        "SCHD": "Schwab US Dividend Equity",
-        "VYM": "Vanguard High Dividend Yield",
-        "HDV": "iShares Core High Dividend",
-        "JEPI": "JPMorgan Equity Premium Income",
-        "JEPQ": "JPMorgan Nasdaq Equity Premium",
-        "DIVO": "Amplify CWP Enhanced Dividend",
-        "O": "Realty Income (Monthly)"
-    }
+    # 모니터링할 배당 ETF 및 종목 목록 (data/symbols.json 레지스트리)
+    DIVIDEND_ETFS = get_registry().names('dividend')
 
     def __init__(self):
         pass
         
-    def fetch_dividend_data(self) -> List[DividendInfo]:
+    def fetch_dividend_data(self, snapshot: Optional[CloseSnapshot] = None) -> List[DividendInfo]:
         """
         배당주 데이터 수집
+
+        Args:
+            snapshot: 장 마감 스냅샷 (배당 정보가 있으면 yfinance 조회 생략)
         """
+        if snapshot is not None:
+            results = []
+            for symbol, name in self.DIVIDEND_ETFS.items():
+                info = snapshot.dividend(symbol)
+                if info:
+                    results.append(DividendInfo(symbol=symbol, name=name, **info))
+            if results:
+                results.sort(key=lambda x: x.dividend_yield, reverse=True)
+                return results
+
         results = []
         symbols = list(self.DIVIDEND_ETFS.keys())
         
@@ -123,15 +147,7 @@ class DividendMonitor:
             ex_date = item.ex_dividend_date[5:] if item.ex_dividend_date else "-" 
             
             # 배당락일이 다가오는지 체크 (7일 이내면 강조)
-            is_upcoming = False
-            if item.ex_dividend_date:
-                try:
-                    ex_dt = datetime.strptime(item.ex_dividend_date, "%Y-%m-%d")
-                    # 오늘 ~ 7일 후 사이
-                    if now <= ex_dt <= now + timedelta(days=7):
-                        is_upcoming = True
-                except:
-                    pass
+            is_upcoming = self._is_upcoming(item, now)
             
             # 심볼 강조 (배당락 임박 시)
             symbol_str = f"{item.symbol}"
@@ -148,3 +164,152 @@ class DividendMonitor:
         message += "⚡ <i>배당락일(Ex-Date) 전일까지 매수해야 배당을 받을 수 있습니다.</i>"
         
         return message
+
+    @staticmethod
+    def _is_upcoming(item: DividendInfo, now: datetime) -> bool:
+        """배당락일이 오늘 ~ 7일 후 사이인지"""
+        if not item.ex_dividend_date:
+            return False
+        try:
+            ex_dt = datetime.strptime(item.ex_dividend_date, "%Y-%m-%d")
+            return now <= ex_dt <= now + timedelta(days=7)
+        except ValueError:
+            return False
+
+    async def create_dividend_table_image(self, data: List[DividendInfo]) -> Optional[io.BytesIO]:
+        """
+        배당 현황 테이블 이미지 (배당락 임박 종목은 빨간 글씨, 렌더링은 워커 프로세스)
+
+        Returns:
+            이미지 바이트 스트림
+        """
+        if not data:
+            return None
+        try:
+            now = datetime.now()
+            columns = ['Symbol', 'Name', 'Price', 'Yield', 'Ex-Date', 'Pay Date']
+            rows = [[item.symbol, item.name, f"${item.price:.2f}", f"{item.dividend_yield:.2f}%",
+                     item.ex_dividend_date or '-', item.pay_date or '-'] for item in data]
+            highlight = [i for i, item in enumerate(data) if self._is_upcoming(item, now)]
+            title = f"DIVIDEND ETF - {now.strftime('%Y-%m-%d')}"
+            png = await get_render_service().render(render_table, columns, rows, title, None, highlight)
+            return io.BytesIO(png) if png is not None else None
+
+        except Exception as e:
+            logger.error(f"배당 테이블 이미지 생성 오류: {e}")
+            return None
+
+
+# 배당 뉴스 알림으로 이미 보낸 헤드라인 (24시간 동안 재발송 안 함)
+NEWS_INDEX_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'dividend_news_index.json')
+
+# 종목별 알림에 넣을 최대 기사 수
+NEWS_PER_SYMBOL = 3
+
+
+class DividendAlertMonitor:
+    """배당 종목 뉴스 알림 (헤드라인 종목 태그 기준)"""
+
+    # 피드별 가져올 기사 수
+    FEED_LIMIT = 30
+
+    def __init__(self, news_fetcher=None):
+        """
+        Args:
+            news_fetcher: RSS 조회/번역에 쓸 NewsFetcher (생략 시 새로 생성)
+        """
+        if news_fetcher is None:
+            from news_fetcher import NewsFetcher
+            news_fetcher = NewsFetcher()
+        self.news_fetcher = news_fetcher
+        self.names = get_registry().names('dividend')
+        # 배당 종목만으로 구성한 매처 (다른 종목 태그는 필요 없음)
+        self.matcher = WatchlistMatcher(registry_aliases(universes=['dividend']))
+        self.sent_index = HeadlineIndex(NEWS_INDEX_PATH)
+        self.sent_index.load()
+
+    def feed_urls(self) -> List[str]:
+        """배당 ETF 국내 뉴스 + 배당 종목 영문 뉴스 (한 글자 티커는 회사명으로 검색)"""
+        terms = []
+        for symbol, name in self.names.items():
+            if len(symbol) >= 3:
+                terms.append(symbol)
+            else:
+                name = re.sub(r'\s*\(.*?\)', '', name)
+                terms.append(f'"{name}"')
+        query_en = quote_plus(' OR '.join(terms))
+        return [
+            'https://news.google.com/rss/search?q=배당+ETF&hl=ko-KR&gl=KR&ceid=KR:ko',
+            f'https://news.google.com/rss/search?q={query_en}&hl=en-US&gl=US&ceid=US:en',
+        ]
+
+    def collect_news(self) -> Dict[str, List[Dict]]:
+        """
+        새 헤드라인을 종목별로 묶기 (이미 보낸 헤드라인과 중복이면 제외)
+
+        Returns:
+            {심볼: 기사 목록}
+        """
+        articles = []
+        for url in self.feed_urls():
+            articles.extend(dict(article) for article in self.news_fetcher.fetch_google_news_rss(url, self.FEED_LIMIT))
+
+        # 보낸 헤드라인은 조회만 (등록은 발송 성공 후 mark_sent), 이번 실행 안의 중복은 임시 인덱스로
+        seen = HeadlineIndex()
+        by_symbol: Dict[str, List[Dict]] = {}
+        for article in self.matcher.tag(articles):
+            title = article.get('title', '')
+            if not article['symbols'] or not title or self.sent_index.find_duplicate(title) is not None:
+                continue
+            if not seen.check_and_add(title):
+                continue
+            for symbol in article['symbols']:
+                by_symbol.setdefault(symbol, []).append(article)
+        return by_symbol
+
+    def check_news_alerts(self) -> List[NewsAlert]:
+        """
+        배당 종목 뉴스 알림 (종목당 1개) - 헤드라인은 발송 후 mark_sent로 등록
+
+        Returns:
+            발송할 알림 목록 (새 뉴스가 없으면 빈 목록)
+        """
+        try:
+            by_symbol = self.collect_news()
+            if not by_symbol:
+                return []
+
+            # 번역 전 원문 제목 (sent_index는 피드 원문으로 비교)
+            titles = {symbol: [a['title'] for a in items[:NEWS_PER_SYMBOL]] for symbol, items in by_symbol.items()}
+
+            # 제목은 모아서 한 번에 번역 (한국어 제목은 translate_titles가 그대로 반환)
+            articles = list({id(a): a for items in by_symbol.values() for a in items[:NEWS_PER_SYMBOL]}.values())
+            translated = self.news_fetcher.translate_titles([a['title'] for a in articles])
+            for article, title in zip(articles, translated):
+                article['title'] = title
+
+            return [NewsAlert(symbol, self.format_news_alert(symbol, items[:NEWS_PER_SYMBOL]), titles[symbol])
+                    for symbol, items in by_symbol.items()]
+
+        except Exception as e:
+            logger.error(f"배당 뉴스 알림 확인 오류: {e}")
+            return []
+
+    def mark_sent(self, alert: NewsAlert):
+        """발송한 알림의 헤드라인 등록 + 저장 (다음 실행부터 중복 제외)"""
+        for title in alert.titles:
+            self.sent_index.add(title)
+        self.sent_index.save()
+
+    def format_news_alert(self, symbol: str, articles: List[Dict]) -> str:
+        """종목 뉴스 알림 메시지 포맷 (HTML)"""
+        message = f"📰 <b>{symbol} 뉴스</b> ({self.names.get(symbol, symbol)})\n\n"
+        for article in articles:
+            title = article.get('title', '')
+            link = article.get('link', '')
+            source = article.get('source', '')
+            message += f"• <a href=\"{link}\">{title}</a>" if link else f"• {title}"
+            if source:
+                message += f" <i>({source})</i>"
+            message += "\n"
+        return message
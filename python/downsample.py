@@ -0,0 +1,72 @@
+"""
+차트용 시계열 다운샘플링 (Largest-Triangle-Three-Buckets)
+
+- 출력 이미지의 가로 픽셀 수보다 점이 많으면 픽셀 수만큼만 남김
+  (첫/마지막 점은 유지, 버킷마다 앞 점 - 후보 - 다음 버킷 평균이 이루는 삼각형이 가장 큰 점 선택)
+- 고점/저점 같은 모양은 그대로 → 히스토리 길이와 무관하게 렌더링 시간 / PNG 크기 일정
+- 인덱스를 반환하므로 날짜 목록 같은 x값도 같이 골라낼 수 있음
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> List[int]:
+    """
+    LTTB로 남길 점의 인덱스
+
+    Args:
+        x: x값 (오름차순 숫자)
+        y: y값
+        threshold: 남길 점 수 (3 미만이거나 점 수 이하면 전부)
+
+    Returns:
+        오름차순 인덱스 목록
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    xs = np.asarray(x, dtype=float)
+    ys = np.asarray(y, dtype=float)
+    # 첫/마지막 점을 뺀 나머지를 threshold - 2개 버킷으로
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(int) + 1
+    edges[-1] = n - 1
+
+    indices = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷 평균 (마지막 버킷은 마지막 점)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = xs[next_start:next_end].mean(), ys[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = xs[n - 1], ys[n - 1]
+
+        # 삼각형 넓이 (x2 생략 - 비교만 하므로)
+        areas = np.abs((xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+        a = start + int(areas.argmax())
+        indices.append(a)
+
+    indices.append(n - 1)
+    return indices
+
+
+def downsample(x: Sequence, y: Sequence[float], threshold: int, x_values: Sequence[float] = None):
+    """
+    (x, y)를 threshold개 점으로 줄임
+
+    Args:
+        x: x값 (날짜 등 숫자가 아니어도 됨 - 이때는 x_values로 숫자 x 전달)
+        y: y값
+        threshold: 남길 점 수 (보통 그림의 가로 픽셀 수)
+        x_values: 넓이 계산용 숫자 x (생략 시 x 사용)
+
+    Returns:
+        (줄인 x 목록, 줄인 y 목록)
+    """
+    if len(y) <= threshold:
+        return list(x), list(y)
+    indices = lttb_indices(x if x_values is None else x_values, y, threshold)
+    return [x[i] for i in indices], [y[i] for i in indices]
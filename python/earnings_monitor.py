@@ -15,53 +15,12 @@ from typing import List, Optional, Dict
 import pandas as pd
 import yfinance as yf
 
+from symbol_registry import get_registry
+
 logger = logging.getLogger(__name__)
 
-# S&P 100 주요 기업 (stock_monitor.py US_TOP_STOCKS와 동일)
-SP100_STOCKS = {
-    # Technology
-    "AAPL": "Apple", "MSFT": "Microsoft", "GOOGL": "Alphabet",
-    "NVDA": "NVIDIA", "META": "Meta", "AVGO": "Broadcom",
-    "CSCO": "Cisco", "ADBE": "Adobe", "CRM": "Salesforce",
-    "ORCL": "Oracle", "ACN": "Accenture", "IBM": "IBM",
-    "INTC": "Intel", "AMD": "AMD", "QCOM": "Qualcomm",
-    "TXN": "Texas Instruments",
-    # Consumer
-    "AMZN": "Amazon", "TSLA": "Tesla", "HD": "Home Depot",
-    "MCD": "McDonald's", "NKE": "Nike", "SBUX": "Starbucks",
-    "LOW": "Lowe's", "TGT": "Target", "COST": "Costco",
-    "WMT": "Walmart", "PG": "P&G", "KO": "Coca-Cola",
-    "PEP": "PepsiCo", "MDLZ": "Mondelez", "CL": "Colgate",
-    "KHC": "Kraft Heinz",
-    # Communication
-    "NFLX": "Netflix", "DIS": "Disney", "CMCSA": "Comcast",
-    "T": "AT&T", "VZ": "Verizon", "TMUS": "T-Mobile",
-    # Healthcare
-    "UNH": "UnitedHealth", "JNJ": "J&J", "LLY": "Eli Lilly",
-    "MRK": "Merck", "ABBV": "AbbVie", "PFE": "Pfizer",
-    "TMO": "Thermo Fisher", "ABT": "Abbott", "DHR": "Danaher",
-    "BMY": "Bristol-Myers", "AMGN": "Amgen", "GILD": "Gilead",
-    "MDT": "Medtronic", "CVS": "CVS Health",
-    # Financial
-    "BRK-B": "Berkshire", "JPM": "JPMorgan", "V": "Visa",
-    "MA": "Mastercard", "BAC": "BofA", "WFC": "Wells Fargo",
-    "GS": "Goldman Sachs", "MS": "Morgan Stanley", "C": "Citigroup",
-    "SCHW": "Schwab", "BLK": "BlackRock", "AXP": "AmEx",
-    "COF": "Capital One", "MET": "MetLife", "AIG": "AIG",
-    # Industrial
-    "BA": "Boeing", "HON": "Honeywell", "UNP": "Union Pacific",
-    "RTX": "Raytheon", "CAT": "Caterpillar", "GE": "GE Aerospace",
-    "LMT": "Lockheed Martin", "UPS": "UPS", "FDX": "FedEx",
-    "MMM": "3M",
-    # Energy
-    "XOM": "Exxon Mobil", "CVX": "Chevron", "COP": "ConocoPhillips",
-    # Utilities
-    "NEE": "NextEra Energy", "DUK": "Duke Energy",
-    "SO": "Southern Co", "EXC": "Exelon",
-    # Others
-    "LIN": "Linde", "DOW": "Dow", "AMT": "American Tower",
-    "BKNG": "Booking", "GM": "GM",
-}
+# S&P 100 주요 기업 (stock_monitor.py US_TOP_STOCKS와 같은 레지스트리 유니버스)
+SP100_STOCKS = get_registry().names('sp100', short=True)
 
 WEEKDAY_KR = {0: '월요일', 1: '화요일', 2: '수요일', 3: '목요일', 4: '금요일'}
 
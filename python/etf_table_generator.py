@@ -1,25 +1,43 @@
 """
 ETF 테이블 이미지 생성 모듈
+- 그리기는 table_renderer (Pillow, pandas / matplotlib 불필요)
+- 제목에는 날짜만 표시 (캐시 키에 제목 포함 → 같은 날 같은 데이터면 캐시된 이미지 사용)
 """
 import logging
-from typing import List, Dict
-import pandas as pd
-import matplotlib.pyplot as plt
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import io
+from render_cache import render_cached
+from table_renderer import render_table
 
 logger = logging.getLogger(__name__)
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['axes.unicode_minus'] = False
-
 
 class ETFTableGenerator:
     """ETF 데이터를 테이블 이미지로 변환하는 클래스"""
-    
-    @staticmethod
-    def create_table_image(etf_data: List[Dict]) -> io.BytesIO:
+
+    COLUMNS = ['ETF', 'Current', '52W Close', 'High Date', 'DD %', 'YTD %', 'Daily %']
+    MIN_WIDTHS = [110, 130, 130, 130, 130, 130, 130]
+
+    @classmethod
+    def _table_args(cls, etf_data: List[Dict]) -> Tuple:
+        """렌더 함수 입력 (헤더, 셀 문자열, 제목, 열 최소 너비)"""
+        rows = []
+        for etf in etf_data:
+            rows.append([
+                etf['symbol'],
+                f"${etf['current_price']:.2f}",
+                f"${etf['high_52w']:.2f}",
+                etf['high_52w_date'],
+                f"{etf['dd']:.2f}%",
+                f"{etf['ytd_return']:.2f}%",
+                f"{etf['daily_change']:+.2f}%",
+            ])
+        title = f"3X ETF LIST - {datetime.now().strftime('%Y-%m-%d')}"
+        return cls.COLUMNS, rows, title, cls.MIN_WIDTHS
+
+    @classmethod
+    def create_table_image(cls, etf_data: List[Dict]) -> io.BytesIO:
         """
         ETF 데이터를 테이블 이미지로 생성
         
@@ -30,63 +48,8 @@ class ETFTableGenerator:
             이미지 바이트 스트림
         """
         try:
-            # DataFrame 생성
-            df_data = []
-            for etf in etf_data:
-                df_data.append({
-                    'ETF': etf['symbol'],
-                    'Current': f"${etf['current_price']:.2f}",
-                    '52W Close': f"${etf['high_52w']:.2f}",
-                    'High Date': etf['high_52w_date'],
-                    'DD %': f"{etf['dd']:.2f}%",
-                    'YTD %': f"{etf['ytd_return']:.2f}%",
-                    'Daily %': f"{etf['daily_change']:+.2f}%",
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # 그림 생성
-            fig, ax = plt.subplots(figsize=(14, 10))
-            ax.axis('off')
-            
-            # 테이블 생성
-            table = ax.table(
-                cellText=df.values,
-                colLabels=df.columns,
-                cellLoc='center',
-                loc='center',
-                colWidths=[0.10, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12]
-            )
-            
-            # 스타일 설정
-            table.auto_set_font_size(False)
-            table.set_fontsize(9)
-            table.scale(1, 2)
-            
-            # 헤더 스타일
-            for i in range(len(df.columns)):
-                table[(0, i)].set_facecolor('#4472C4')
-                table[(0, i)].set_text_props(weight='bold', color='white')
-            
-            # 행 스타일 (교대로)
-            for i in range(1, len(df) + 1):
-                for j in range(len(df.columns)):
-                    if i % 2 == 0:
-                        table[(i, j)].set_facecolor('#E7E6E6')
-                    else:
-                        table[(i, j)].set_facecolor('#F2F2F2')
-            
-            # 제목 추가
-            title = f"3X ETF LIST - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            plt.figtext(0.5, 0.98, title, ha='center', fontsize=14, weight='bold')
-            
-            # 이미지로 저장
-            img_buffer = io.BytesIO()
-            plt.tight_layout()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight')
-            img_buffer.seek(0)
-            plt.close()
-            
+            args = cls._table_args(etf_data)
+            img_buffer = io.BytesIO(render_cached(render_table, *args))
             logger.info("ETF 테이블 이미지 생성 성공")
             return img_buffer
         
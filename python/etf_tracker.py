@@ -6,50 +6,17 @@ DD (Drawdown): 52주 최고 종가 대비 현재 하락률
 - DD가 0%에 가까울수록 고점 근처
 """
 import logging
-from typing import List, Dict
-import requests
+from typing import List, Dict, Optional
+from http_client import http_get
 from datetime import datetime
+from symbol_registry import get_registry
+from close_snapshot import CloseSnapshot, summarize_chart
 
 logger = logging.getLogger(__name__)
 
 
-# 기본 ETF 목록 (미국 3배 Bull Only - 인버스/해외 제외)
-DEFAULT_ETF_LIST = [
-    # 주요 지수
-    "TQQQ",   # ProShares UltraPro QQQ (나스닥 3배)
-    "UPRO",   # ProShares UltraPro S&P500 (S&P 3배)
-    "SPXL",   # Direxion S&P 500 Bull 3X (S&P 3배)
-    "UDOW",   # ProShares UltraPro Dow30 (다우 3배)
-    "TNA",    # Direxion Small Cap Bull 3X (소형주 3배)
-    "MIDU",   # Direxion Mid Cap Bull 3X (중형주 3배)
-    "HIBL",   # Direxion S&P 500 High Beta Bull 3X (고베타 3배)
-    # 섹터
-    "SOXL",   # Direxion Semiconductor Bull 3X (반도체 3배)
-    "TECL",   # Direxion Technology Bull 3X (기술 3배)
-    "FNGU",   # MicroSectors FANG+ 3X (빅테크 3배)
-    "BULZ",   # MicroSectors Solactive FANG & Innovation 3X (빅테크 3배)
-    "WEBL",   # Direxion Internet Bull 3X (인터넷 3배)
-    "UBOT",   # Direxion Robotics AI & Automation Bull 3X (로봇/AI 3배)
-    "FAS",    # Direxion Financial Bull 3X (금융 3배)
-    "DPST",   # Direxion Regional Banks Bull 3X (지방은행 3배)
-    "LABU",   # Direxion Biotech Bull 3X (바이오 3배)
-    "CURE",   # Direxion Healthcare Bull 3X (헬스케어 3배)
-    "PILL",   # Direxion Pharmaceutical Bull 3X (제약 3배)
-    "NAIL",   # Direxion Homebuilders Bull 3X (주택건설 3배)
-    "DFEN",   # Direxion Aerospace Bull 3X (방산/항공 3배)
-    "DUSL",   # Direxion Industrials Bull 3X (산업 3배)
-    "TPOR",   # Direxion Transportation Bull 3X (운송 3배)
-    "RETL",   # Direxion Retail Bull 3X (리테일 3배)
-    "WANT",   # Direxion Consumer Discretionary Bull 3X (소비재 3배)
-    "DRN",    # Direxion Real Estate Bull 3X (부동산 3배)
-    "UTSL",   # Direxion Utilities Bull 3X (유틸리티 3배)
-    # 에너지/원자재
-    "ERX",    # Direxion Energy Bull 3X (에너지 3배)
-    "GUSH",   # Direxion Oil & Gas E&P Bull 3X (석유/가스 3배)
-    "NUGT",   # Direxion Gold Miners Bull 3X (금광주 3배)
-    # 채권
-    "TMF",    # Direxion Treasury Bull 3X (장기국채 3배)
-]
+# 기본 ETF 목록 (미국 3배 Bull Only - 인버스/해외 제외, data/symbols.json 레지스트리)
+DEFAULT_ETF_LIST = get_registry().symbols('leveraged_3x')
 
 
 class ETFTracker:
@@ -62,7 +29,7 @@ class ETFTracker:
         Args:
             etf_list: 추적할 ETF 목록 (기본값: DEFAULT_ETF_LIST)
         """
-        self.etf_list = etf_list or DEFAULT_ETF_LIST
+        self.etf_list = etf_list or list(DEFAULT_ETF_LIST)
     
     def get_etf_data(self, symbol: str) -> Dict:
         """
@@ -86,7 +53,7 @@ class ETFTracker:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
 
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = http_get(url, params=params, headers=headers, timeout=10)
 
             if response.status_code != 200:
                 logger.warning(f"{symbol}: API 응답 오류 ({response.status_code})")
@@ -105,96 +72,88 @@ class ETFTracker:
 
             closes = indicators.get("close", [])
 
-            # 현재가
-            current_price = meta.get("regularMarketPrice", 0)
+            # 현재가 + 52주/1년/1개월 종가 요약 (장 마감 스냅샷과 같은 계산)
+            summary = summarize_chart(timestamps, closes, meta.get("regularMarketPrice"))
+            if not summary:
+                logger.warning(f"{symbol}: 종가 데이터 없음")
+                return None
 
-            # 전일종가 계산 (closes 배열에서 마지막 두 값 사용)
-            valid_closes = [c for c in closes if c is not None]
-            if len(valid_closes) >= 2:
-                previous_close = valid_closes[-2]  # 어제 종가
-            else:
-                previous_close = current_price
-
-            # 52주 최고 종가, 저가 및 날짜 계산
-            high_52w_close = 0
-            low_52w_close = float('inf')
-            high_52w_date = "N/A"
-
-            for i, c in enumerate(closes):
-                if c is not None:
-                    if c > high_52w_close:
-                        high_52w_close = c
-                        if i < len(timestamps):
-                            high_52w_date = datetime.fromtimestamp(timestamps[i]).strftime("%Y-%m-%d")
-                    if c < low_52w_close:
-                        low_52w_close = c
-
-            if high_52w_close == 0:
-                high_52w_close = current_price
-            if low_52w_close == float('inf'):
-                low_52w_close = current_price
-
-            # DD (52주 최고 종가 대비 현재 하락률)
-            dd = ((current_price - high_52w_close) / high_52w_close) * 100 if high_52w_close > 0 else 0
-
-            # 52주 저가 대비 상승률
-            low_52w_change = ((current_price - low_52w_close) / low_52w_close) * 100 if low_52w_close > 0 else 0
-
-            # 연초 대비 수익률 (YTD)
-            ytd_return = 0
-            if len(valid_closes) > 200:
-                # 대략 연초 가격 (약 252 거래일)
-                year_start_idx = max(0, len(valid_closes) - 252)
-                year_start_price = valid_closes[year_start_idx]
-                if year_start_price > 0:
-                    ytd_return = ((current_price - year_start_price) / year_start_price) * 100
-
-            # 월간 수익률 (최근 21 거래일)
-            monthly_return = 0
-            if len(valid_closes) > 21:
-                month_ago_price = valid_closes[-22]
-                if month_ago_price > 0:
-                    monthly_return = ((current_price - month_ago_price) / month_ago_price) * 100
-
-            # 전일 변동률
-            daily_change = ((current_price - previous_close) / previous_close) * 100 if previous_close > 0 else 0
-
-            return {
-                "symbol": symbol,
-                "current_price": round(float(current_price), 2),
-                "high_52w": round(float(high_52w_close), 2),
-                "low_52w": round(float(low_52w_close), 2),
-                "high_52w_date": high_52w_date,
-                "dd": round(float(dd), 2),
-                "low_52w_change": round(float(low_52w_change), 2),
-                "ytd_return": round(float(ytd_return), 2),
-                "monthly_return": round(float(monthly_return), 2),
-                "daily_change": round(float(daily_change), 2),
-                "previous_close": round(float(previous_close), 2),
-            }
+            return self._build_etf_info(symbol, summary)
 
         except Exception as e:
             logger.error(f"{symbol} 데이터 수집 오류: {e}")
             return None
     
-    def get_all_etf_data(self) -> List[Dict]:
+    def _build_etf_info(self, symbol: str, summary: Dict) -> Dict:
+        """종가 요약(summarize_chart 결과) → ETF 정보 딕셔너리"""
+        current_price = summary['close']
+        previous_close = summary['prev_close'] or current_price
+        high_52w_close = summary['high_52w'] or current_price
+        low_52w_close = summary['low_52w'] or current_price
+        high_52w_date = "N/A"
+        if summary.get('high_52w_ts'):
+            high_52w_date = datetime.fromtimestamp(summary['high_52w_ts']).strftime("%Y-%m-%d")
+
+        # DD (52주 최고 종가 대비 현재 하락률)
+        dd = ((current_price - high_52w_close) / high_52w_close) * 100 if high_52w_close > 0 else 0
+
+        # 52주 저가 대비 상승률
+        low_52w_change = ((current_price - low_52w_close) / low_52w_close) * 100 if low_52w_close > 0 else 0
+
+        # 연초 대비 수익률 (YTD) - 대략 연초 가격 (약 252 거래일 전)
+        ytd_return = 0
+        year_start_price = summary.get('year_ago')
+        if year_start_price and year_start_price > 0:
+            ytd_return = ((current_price - year_start_price) / year_start_price) * 100
+
+        # 월간 수익률 (최근 21 거래일)
+        monthly_return = 0
+        month_ago_price = summary.get('month_ago')
+        if month_ago_price and month_ago_price > 0:
+            monthly_return = ((current_price - month_ago_price) / month_ago_price) * 100
+
+        # 전일 변동률
+        daily_change = ((current_price - previous_close) / previous_close) * 100 if previous_close > 0 else 0
+
+        return {
+            "symbol": symbol,
+            "current_price": round(float(current_price), 2),
+            "high_52w": round(float(high_52w_close), 2),
+            "low_52w": round(float(low_52w_close), 2),
+            "high_52w_date": high_52w_date,
+            "dd": round(float(dd), 2),
+            "low_52w_change": round(float(low_52w_change), 2),
+            "ytd_return": round(float(ytd_return), 2),
+            "monthly_return": round(float(monthly_return), 2),
+            "daily_change": round(float(daily_change), 2),
+            "previous_close": round(float(previous_close), 2),
+        }
+
+    def get_all_etf_data(self, snapshot: Optional[CloseSnapshot] = None) -> List[Dict]:
         """
         모든 ETF 데이터 수집
-        
+
+        Args:
+            snapshot: 장 마감 스냅샷 (주어지면 네트워크 조회 없이 스냅샷 값 사용)
+
         Returns:
             ETF 정보 리스트
         """
         all_data = []
-        
+
         for symbol in self.etf_list:
-            logger.info(f"{symbol} 데이터 수집 중...")
-            data = self.get_etf_data(symbol)
-            
+            if snapshot is not None:
+                row = snapshot.row(symbol)
+                data = self._build_etf_info(symbol, row) if row else None
+            else:
+                logger.info(f"{symbol} 데이터 수집 중...")
+                data = self.get_etf_data(symbol)
+
             if data:
                 all_data.append(data)
-        
+
         return all_data
-    
+
     def format_etf_report(self, etf_data: List[Dict]) -> str:
         """
         ETF 데이터를 포맷된 메시지로 변환 (간결한 형태)
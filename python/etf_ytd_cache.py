@@ -3,18 +3,28 @@
 """
 import yfinance as yf
 import logging
-from typing import Dict
+from typing import Dict, Optional
+from symbol_registry import get_registry
+from close_snapshot import CloseSnapshot
 
 logger = logging.getLogger(__name__)
 
-def get_etf_ytd_data() -> Dict[str, float]:
+def get_etf_ytd_data(snapshot: Optional[CloseSnapshot] = None) -> Dict[str, float]:
     """
     배당 ETF의 YTD 성과를 별도로 계산 (캐싱 가능)
+
+    Args:
+        snapshot: 장 마감 스냅샷 (올해 첫 종가가 있는 종목은 조회 생략)
     """
-    etf_symbols = ["SCHD", "VYM", "DGRO", "NOBL", "VIG", "HDV"]
+    etf_symbols = get_registry().symbols('dividend_ytd')
     ytd_data = {}
     
     for symbol in etf_symbols:
+        row = snapshot.row(symbol) if snapshot is not None else None
+        if row and row['year_start']:
+            ytd_data[symbol] = ((row['close'] - row['year_start']) / row['year_start']) * 100
+            continue
+
         try:
             ticker = yf.Ticker(symbol)
             # 1월 2일부터 현재까지
@@ -2,11 +2,14 @@
 CNN Fear & Greed Index 및 네이버 금융 데이터 트래커
 - Playwright 스크린샷 방식만 사용
 """
-import requests
+from http_client import http_get
 import logging
 from io import BytesIO
 from datetime import datetime
 import asyncio
+from typing import Optional
+from symbol_registry import get_registry
+from close_snapshot import CloseSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +26,7 @@ class FearGreedTracker:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(self.api_url, headers=headers, timeout=10)
+            response = http_get(self.api_url, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -174,27 +177,37 @@ class NaverFinanceTracker:
     """네이버 금융 데이터 트래커 (스크린샷 방식)"""
 
     def __init__(self):
-        self.indices = [
-            ('%5EDJI', '다우존스'),
-            ('%5EIXIC', '나스닥 종합'),
-            ('%5EGSPC', 'S&P 500'),
-            ('%5ESOX', '필라델피아 반도체'),
-            ('%5ENDX', '나스닥 100'),
-        ]
+        self.indices = list(get_registry().names('us_market', short=True).items())
         self._headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
 
-    def fetch_us_market_data(self):
-        """미국 시장 데이터 가져오기 (텍스트 폴백용)"""
+    def fetch_us_market_data(self, snapshot: Optional[CloseSnapshot] = None):
+        """
+        미국 시장 데이터 가져오기 (텍스트 폴백용)
+
+        Args:
+            snapshot: 장 마감 스냅샷 (주어지면 네트워크 조회 없이 스냅샷 값 사용, 값이 없는 지수만 직접 조회)
+        """
         results = []
 
         for symbol, name in self.indices:
+            row = snapshot.row(symbol) if snapshot is not None else None
+            if row and row['prev_close']:
+                change = row['close'] - row['prev_close']
+                results.append({
+                    'name': name,
+                    'price': row['close'],
+                    'change': change,
+                    'change_pct': (change / row['prev_close']) * 100
+                })
+                continue
+
             try:
                 url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
                 params = {"interval": "1d", "range": "5d"}
 
-                response = requests.get(url, params=params, headers=self._headers, timeout=10)
+                response = http_get(url, params=params, headers=self._headers, timeout=10)
 
                 if response.status_code != 200:
                     continue
@@ -256,7 +269,7 @@ class NaverFinanceTracker:
         try:
             url = f'https://query1.finance.yahoo.com/v8/finance/chart/{yahoo_symbol}'
             params = {'interval': '1d', 'range': '1y'}
-            response = requests.get(url, params=params, headers=self._headers, timeout=10)
+            response = http_get(url, params=params, headers=self._headers, timeout=10)
 
             if response.status_code != 200:
                 return None
@@ -282,18 +295,25 @@ class NaverFinanceTracker:
             logger.warning(f"YTD 데이터 조회 실패 ({yahoo_symbol}): {e}")
             return None
 
-    def fetch_kr_market_data(self):
-        """한국 시장 데이터 가져오기 (네이버 증권 API - 실시간 + YTD)"""
+    def fetch_kr_market_data(self, snapshot: Optional[CloseSnapshot] = None):
+        """
+        한국 시장 데이터 가져오기 (네이버 증권 API - 실시간 + YTD)
+
+        Args:
+            snapshot: 장 마감 스냅샷 (올해 첫 종가가 있으면 YTD 기준가 조회 생략)
+        """
+        registry = get_registry()
         kr_indices = [
-            ('KOSPI', '코스피', '^KS11'),
-            ('KOSDAQ', '코스닥', '^KQ11'),
+            (info.provider_symbol, info.short_name, info.symbol)
+            for info in map(registry.info, registry.universe_ids('monitor_indices'))
+            if info.market == 'KR'
         ]
         results = []
 
         for symbol, name, yahoo_symbol in kr_indices:
             try:
                 url = f'https://m.stock.naver.com/api/index/{symbol}/basic'
-                response = requests.get(url, headers=self._headers, timeout=10)
+                response = http_get(url, headers=self._headers, timeout=10)
 
                 if response.status_code != 200:
                     logger.warning(f"{name}: 네이버 API 오류 ({response.status_code})")
@@ -315,8 +335,9 @@ class NaverFinanceTracker:
                 # 변동률
                 change_pct = (change / prev_close) * 100 if prev_close != 0 else 0
 
-                # YTD 계산
-                ytd_start = self._get_ytd_start_price(yahoo_symbol)
+                # YTD 계산 (연초 기준가는 스냅샷 우선)
+                row = snapshot.row(yahoo_symbol) if snapshot is not None else None
+                ytd_start = row['year_start'] if row and row['year_start'] else self._get_ytd_start_price(yahoo_symbol)
                 ytd_pct = None
                 if ytd_start and ytd_start > 0:
                     ytd_pct = ((price - ytd_start) / ytd_start) * 100
@@ -0,0 +1,168 @@
+"""
+뉴스 헤드라인 유사 중복 인덱스 (MinHash + LSH)
+
+- 헤드라인은 한 번만 토큰화 (특수문자 제거 + 소문자 + 공백 분리)
+- 토큰 집합의 MinHash 서명 (NUM_PERM개 해시) → BANDS개 밴드로 나눠 버킷에 등록
+- 새 헤드라인은 밴드 버킷이 하나라도 겹치는 후보만 정확한 Jaccard / 포함관계 비교 (전체 비교 없음)
+  (ROWS=2, BANDS=64: Jaccard 0.3인 쌍이 후보가 될 확률 약 99.8%)
+- 카테고리 구분 없이 하나의 인덱스 공유
+- 저장 파일을 주면 롤링 윈도우(24시간) 동안 실행 간 유지 (예: 배당 뉴스 알림으로 보낸 헤드라인)
+- 해시는 crc32 + 고정 시드 계수 (프로세스가 달라도 같은 서명)
+"""
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# MinHash 해시 수 / LSH 밴드 구성 (BANDS * ROWS == NUM_PERM)
+NUM_PERM = 128
+ROWS = 2
+BANDS = NUM_PERM // ROWS
+
+# 중복 판정 Jaccard 임계값 (기존 _deduplicate_articles 기준)
+DEFAULT_THRESHOLD = 0.3
+
+# 발행 헤드라인 보관 기간 (초)
+WINDOW_SECONDS = 24 * 60 * 60
+
+# 범용 해시 h(x) = (a*x + b) mod p (x: 32비트 crc32, a < 2^31 → 곱이 uint64를 넘지 않음)
+_PRIME = np.uint64(4294967311)
+_rng = np.random.RandomState(20240101)
+_A = _rng.randint(1, 2 ** 31 - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64).reshape(-1, 1)
+_B = _rng.randint(0, 2 ** 31 - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64).reshape(-1, 1)
+
+_CLEAN_PATTERN = re.compile(r'[^\w\s가-힣]')
+
+
+def tokenize(title: str) -> FrozenSet[str]:
+    """헤드라인 → 토큰 집합"""
+    return frozenset(_CLEAN_PATTERN.sub('', title).lower().split())
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(tokens: FrozenSet[str]) -> np.ndarray:
+    """토큰 집합의 MinHash 서명 (NUM_PERM,)"""
+    hashes = np.fromiter((zlib.crc32(t.encode('utf-8')) for t in tokens), dtype=np.uint64, count=len(tokens))
+    return ((_A * hashes + _B) % _PRIME).min(axis=1)
+
+
+class HeadlineIndex:
+    """헤드라인 유사 중복 인덱스"""
+
+    def __init__(self, path: str = None, threshold: float = DEFAULT_THRESHOLD, window: float = WINDOW_SECONDS):
+        """
+        Args:
+            path: 저장 파일 (None이면 메모리 전용 - 한 번의 실행 안에서만 사용)
+            threshold: 이 Jaccard를 넘으면 중복
+            window: 보관 기간 (초)
+        """
+        self.path = path
+        self.threshold = threshold
+        self.window = window
+        self._titles: List[str] = []
+        self._tokens: List[FrozenSet[str]] = []
+        self._times: List[float] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [(band, row.tobytes()) for band, row in enumerate(signature.reshape(BANDS, ROWS))]
+
+    def find_duplicate(self, title: str, tokens: FrozenSet[str] = None) -> Optional[str]:
+        """
+        중복 헤드라인 찾기 (LSH 후보만 비교)
+
+        Returns:
+            이미 등록된 중복 헤드라인 또는 None
+        """
+        tokens = tokenize(title) if tokens is None else tokens
+        if not tokens:
+            return None
+
+        candidates = set()
+        for key in self._band_keys(minhash(tokens)):
+            candidates.update(self._buckets.get(key, ()))
+
+        for idx in candidates:
+            existing = self._titles[idx]
+            # 유사도가 임계값을 넘거나 서로 포함관계면 중복
+            if jaccard(tokens, self._tokens[idx]) > self.threshold or title in existing or existing in title:
+                return existing
+        return None
+
+    def add(self, title: str, ts: float = None, tokens: FrozenSet[str] = None):
+        """헤드라인 등록"""
+        tokens = tokenize(title) if tokens is None else tokens
+        if not tokens:
+            return
+        idx = len(self._titles)
+        self._titles.append(title)
+        self._tokens.append(tokens)
+        self._times.append(time.time() if ts is None else ts)
+        for key in self._band_keys(minhash(tokens)):
+            self._buckets.setdefault(key, []).append(idx)
+
+    def check_and_add(self, title: str) -> bool:
+        """중복이 아니면 등록 후 True, 중복이면 False"""
+        tokens = tokenize(title)
+        if self.find_duplicate(title, tokens) is not None:
+            return False
+        self.add(title, tokens=tokens)
+        return True
+
+    def prune(self, now: float = None):
+        """보관 기간이 지난 헤드라인 제거 (남은 헤드라인으로 버킷 재구성)"""
+        now = time.time() if now is None else now
+        keep = [(title, ts) for title, ts in zip(self._titles, self._times) if now - ts < self.window]
+        if len(keep) == len(self._titles):
+            return
+        self._titles, self._tokens, self._times = [], [], []
+        self._buckets.clear()
+        for title, ts in keep:
+            self.add(title, ts)
+
+    def save(self):
+        """보관 기간 안의 헤드라인 저장"""
+        if not self.path:
+            return
+        self.prune()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump([[title, ts] for title, ts in zip(self._titles, self._times)], f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"헤드라인 인덱스 저장 오류: {e}")
+
+    def load(self):
+        """저장된 헤드라인 로드 (보관 기간이 지난 항목 제외)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.error(f"헤드라인 인덱스 로드 오류: {e}")
+            return
+
+        now = time.time()
+        for title, ts in entries:
+            if now - ts < self.window:
+                self.add(title, ts)
+        logger.info(f"헤드라인 인덱스 로드: {len(self)}개 (최근 {self.window / 3600:.0f}시간)")
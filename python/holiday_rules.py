@@ -0,0 +1,322 @@
+"""
+증시 휴장일 규칙 엔진
+
+- NYSE/KRX 휴장일과 조기 마감일을 규칙으로 생성 (연도 제한 없음)
+  - 미국: 관측일 이동(토→금, 일→월), 부활절 기준 Good Friday, N번째 요일 공휴일
+  - 한국: 양력 공휴일 + 음력 명절 테이블(설날/추석/부처님오신날) + 대체공휴일 + 연말 폐장일
+- 연도별 결과를 비트맵(int, 1월 1일 = bit 0)으로 만들어 두고 날짜 조회는 O(1)
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 음력 명절 양력 날짜 (설날/추석은 당일, 전후 하루가 연휴)
+SEOLLAL = {
+    2020: (1, 25), 2021: (2, 12), 2022: (2, 1), 2023: (1, 22), 2024: (2, 10),
+    2025: (1, 29), 2026: (2, 17), 2027: (2, 7), 2028: (1, 27), 2029: (2, 13),
+    2030: (2, 3), 2031: (1, 23), 2032: (2, 11), 2033: (1, 31), 2034: (2, 19),
+    2035: (2, 8), 2036: (1, 28), 2037: (2, 15), 2038: (2, 4), 2039: (1, 24),
+    2040: (2, 12), 2041: (2, 1), 2042: (1, 22), 2043: (2, 10), 2044: (1, 30),
+    2045: (2, 17), 2046: (2, 6), 2047: (1, 26), 2048: (2, 14), 2049: (2, 2),
+    2050: (1, 23),
+}
+
+CHUSEOK = {
+    2020: (10, 1), 2021: (9, 21), 2022: (9, 10), 2023: (9, 29), 2024: (9, 17),
+    2025: (10, 6), 2026: (9, 25), 2027: (9, 15), 2028: (10, 3), 2029: (9, 22),
+    2030: (9, 12), 2031: (10, 1), 2032: (9, 19), 2033: (9, 8), 2034: (9, 27),
+    2035: (9, 16), 2036: (10, 4), 2037: (9, 24), 2038: (9, 13), 2039: (10, 2),
+    2040: (9, 21), 2041: (9, 10), 2042: (9, 28), 2043: (9, 17), 2044: (10, 5),
+    2045: (9, 25), 2046: (9, 15), 2047: (10, 4), 2048: (9, 22), 2049: (9, 11),
+    2050: (9, 30),
+}
+
+BUDDHA = {
+    2020: (4, 30), 2021: (5, 19), 2022: (5, 8), 2023: (5, 27), 2024: (5, 15),
+    2025: (5, 5), 2026: (5, 24), 2027: (5, 13), 2028: (5, 2), 2029: (5, 20),
+    2030: (5, 9), 2031: (5, 28), 2032: (5, 16), 2033: (5, 6), 2034: (5, 25),
+    2035: (5, 15), 2036: (5, 3), 2037: (5, 22), 2038: (5, 11), 2039: (4, 30),
+    2040: (5, 18), 2041: (5, 7), 2042: (5, 26), 2043: (5, 16), 2044: (5, 5),
+    2045: (5, 24), 2046: (5, 13), 2047: (5, 2), 2048: (5, 20), 2049: (5, 9),
+    2050: (5, 28),
+}
+
+# 규칙으로 만들 수 없는 휴장일 (선거일, 임시공휴일, 특별 휴장)
+KR_EXTRA_CLOSURES = {
+    date(2020, 4, 15): "국회의원 선거일",
+    date(2020, 8, 17): "임시공휴일",
+    date(2022, 3, 9): "대통령 선거일",
+    date(2022, 6, 1): "지방선거일",
+    date(2023, 10, 2): "임시공휴일",
+    date(2024, 4, 10): "국회의원 선거일",
+    date(2024, 10, 1): "국군의 날 (임시공휴일)",
+    date(2025, 1, 27): "임시공휴일",
+    date(2025, 6, 3): "대통령 선거일",
+    date(2026, 6, 3): "지방선거일",
+    date(2028, 4, 12): "국회의원 선거일",
+    date(2030, 6, 12): "지방선거일",
+}
+
+US_EXTRA_CLOSURES = {
+    date(2025, 1, 9): "National Day of Mourning (Carter)",
+}
+
+# 대체공휴일 적용 시작 연도
+SUBSTITUTE_SINCE = {
+    '설날': 2014,
+    '추석': 2014,
+    '어린이날': 2014,
+    '삼일절': 2021,
+    '광복절': 2021,
+    '개천절': 2021,
+    '한글날': 2021,
+    '부처님오신날': 2023,
+    '성탄절': 2023,
+}
+
+_warned_years = set()
+
+
+@dataclass(frozen=True)
+class HolidayYear:
+    """한 시장의 1년치 휴장/조기 마감 비트맵"""
+    market: str
+    year: int
+    closed: int   # 주말 + 휴장일 (bit n = 1월 1일 + n일)
+    early: int    # 조기 마감일
+    names: Dict[date, str]  # 평일 휴장일/조기 마감일 이름
+
+    def _bit(self, day: date) -> int:
+        return day.timetuple().tm_yday - 1
+
+    def is_closed(self, day: date) -> bool:
+        return bool(self.closed >> self._bit(day) & 1)
+
+    def is_early_close(self, day: date) -> bool:
+        return bool(self.early >> self._bit(day) & 1)
+
+
+def easter_sunday(year: int) -> date:
+    """부활절 (그레고리력, 익명 알고리즘)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """해당 월의 n번째 요일 (n=-1이면 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """NYSE 관측일 (토요일 → 금요일, 일요일 → 월요일)"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_holidays(year: int) -> Dict[date, str]:
+    """NYSE 휴장일 (평일)"""
+    result = {}
+
+    # 1월 1일이 토요일이면 전년 12월 31일은 쉬지 않음 (NYSE 규칙)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        result[_observed(new_year)] = "New Year's Day"
+
+    result[nth_weekday(year, 1, 0, 3)] = "MLK Day"
+    result[nth_weekday(year, 2, 0, 3)] = "Presidents Day"
+    result[easter_sunday(year) - timedelta(days=2)] = "Good Friday"
+    result[nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        result[_observed(date(year, 6, 19))] = "Juneteenth"
+    result[_observed(date(year, 7, 4))] = "Independence Day"
+    result[nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    result[nth_weekday(year, 11, 3, 4)] = "Thanksgiving"
+    result[_observed(date(year, 12, 25))] = "Christmas"
+
+    for day, name in US_EXTRA_CLOSURES.items():
+        if day.year == year:
+            result[day] = name
+    return result
+
+
+def us_early_closes(year: int) -> Dict[date, str]:
+    """NYSE 조기 마감일 (13:00 ET)"""
+    result = {}
+
+    # 7월 3일, 12월 24일은 월~목일 때만 조기 마감 (금요일이면 관측 휴일)
+    july_3 = date(year, 7, 3)
+    if july_3.weekday() <= 3:
+        result[july_3] = "Independence Day 전날"
+
+    result[nth_weekday(year, 11, 3, 4) + timedelta(days=1)] = "Thanksgiving 다음날"
+
+    christmas_eve = date(year, 12, 24)
+    if christmas_eve.weekday() <= 3:
+        result[christmas_eve] = "Christmas Eve"
+    return result
+
+
+def _lunar(table: Dict[int, Tuple[int, int]], year: int, name: str):
+    """음력 명절 테이블 조회 (범위 밖이면 1회 경고)"""
+    md = table.get(year)
+    if md is None:
+        if (name, year) not in _warned_years:
+            _warned_years.add((name, year))
+            logger.warning(f"{year}년 {name} 날짜 테이블 없음 - 휴장일에서 제외됨")
+        return None
+    return date(year, md[0], md[1])
+
+
+def kr_holidays(year: int) -> Dict[date, str]:
+    """KRX 휴장일 (평일)"""
+    # 날짜 → 공휴일 이름 목록 (겹치는 공휴일 판단용)
+    days: Dict[date, List[str]] = {}
+
+    def add(day: date, name: str):
+        days.setdefault(day, []).append(name)
+
+    add(date(year, 1, 1), "신정")
+    add(date(year, 3, 1), "삼일절")
+    add(date(year, 5, 1), "근로자의 날")
+    add(date(year, 5, 5), "어린이날")
+    add(date(year, 6, 6), "현충일")
+    add(date(year, 8, 15), "광복절")
+    add(date(year, 10, 3), "개천절")
+    add(date(year, 10, 9), "한글날")
+    add(date(year, 12, 25), "성탄절")
+
+    buddha = _lunar(BUDDHA, year, "부처님오신날")
+    if buddha:
+        add(buddha, "부처님오신날")
+
+    # 설날/추석 3일 연휴
+    blocks = []
+    for table, name in ((SEOLLAL, "설날"), (CHUSEOK, "추석")):
+        center = _lunar(table, year, name)
+        if center:
+            block = [center + timedelta(days=offset) for offset in (-1, 0, 1)]
+            for day in block:
+                add(day, name)
+            blocks.append((name, block))
+
+    # 대체공휴일: 해당 날짜 다음 첫 번째 평일 비공휴일
+    def substitute(after: date, name: str):
+        day = after + timedelta(days=1)
+        while day.weekday() >= 5 or day in days:
+            day += timedelta(days=1)
+        add(day, f"대체공휴일({name})")
+
+    # 설날/추석: 연휴 중 일요일 또는 다른 공휴일과 겹치는 날마다
+    for name, block in blocks:
+        if year < SUBSTITUTE_SINCE[name]:
+            continue
+        overlaps = sum(1 for day in block if day.weekday() == 6 or len(days[day]) > 1)
+        for _ in range(overlaps):
+            substitute(block[-1], name)
+
+    # 그 외: 토/일요일 또는 다른 공휴일과 겹치면 (같은 날 여러 공휴일은 한 번만)
+    block_days = {day for _, block in blocks for day in block}
+    for day in sorted(days):
+        if day in block_days:
+            continue
+        eligible = [n for n in days[day] if year >= SUBSTITUTE_SINCE.get(n, 9999)]
+        if eligible and (day.weekday() >= 5 or len(days[day]) > 1):
+            substitute(day, eligible[0])
+
+    for day, name in KR_EXTRA_CLOSURES.items():
+        if day.year == year:
+            add(day, name)
+
+    # 연말 폐장일: 그 해 마지막 평일 영업일
+    last = date(year, 12, 31)
+    while last.weekday() >= 5 or last in days:
+        last -= timedelta(days=1)
+    add(last, "폐장일")
+
+    return {day: ", ".join(names) for day, names in days.items() if day.weekday() < 5}
+
+
+def _build_year(market: str, year: int) -> HolidayYear:
+    """1년치 비트맵 생성"""
+    holidays = us_holidays(year) if market == 'US' else kr_holidays(year)
+    early_days = us_early_closes(year) if market == 'US' else {}
+
+    closed = 0
+    early = 0
+    names: Dict[date, str] = {}
+    day = date(year, 1, 1)
+    bit = 0
+    while day.year == year:
+        if day.weekday() >= 5 or day in holidays:
+            closed |= 1 << bit
+        elif day in early_days:
+            early |= 1 << bit
+        bit += 1
+        day += timedelta(days=1)
+
+    for day, name in holidays.items():
+        if day.year == year:
+            names[day] = name
+    for day, name in early_days.items():
+        if day not in holidays:
+            names[day] = name
+
+    return HolidayYear(market=market, year=year, closed=closed, early=early, names=names)
+
+
+_years: Dict[Tuple[str, int], HolidayYear] = {}
+
+
+def get_year(market: str, year: int) -> HolidayYear:
+    """시장/연도별 비트맵 (최초 조회 시 생성 후 캐시)"""
+    key = (market, year)
+    table = _years.get(key)
+    if table is None:
+        table = _build_year(market, year)
+        _years[key] = table
+    return table
+
+
+def is_closed(market: str, day: date) -> bool:
+    """휴장 여부 (주말 포함)"""
+    return get_year(market, day.year).is_closed(day)
+
+
+def is_early_close(market: str, day: date) -> bool:
+    """조기 마감일 여부"""
+    return get_year(market, day.year).is_early_close(day)
+
+
+def holiday_name(market: str, day: date) -> str:
+    """평일 휴장일/조기 마감일 이름 (없으면 빈 문자열)"""
+    return get_year(market, day.year).names.get(day, "")
+
+
+def holidays_between(market: str, start: date, end: date) -> List[date]:
+    """start~end(포함) 사이 평일 휴장일 목록"""
+    result = []
+    for year in range(start.year, end.year + 1):
+        table = get_year(market, year)
+        for day in sorted(table.names):
+            if start <= day <= end and table.is_closed(day):
+                result.append(day)
+    return result
@@ -0,0 +1,296 @@
+"""
+공용 HTTP 클라이언트 (호스트별 속도 제한 + 적응형 동시성 + 재시도)
+
+- 모든 조회 모듈이 같은 클라이언트를 공유 (StockMonitor, ETFTracker, 트래커들, 점검 스크립트)
+- 호스트별 토큰 버킷: 초당 요청 수 제한 (버스트 허용)
+- 호스트별 AIMD 동시성: 성공하면 동시 요청 한도를 조금씩 늘리고 (+1/한도),
+  429/503 또는 응답 지연이 목표를 넘으면 절반으로 줄임 (요청 속도도 함께 조정)
+- 429/5xx/연결 오류는 지수 백오프 + 전체 지터로 재시도 (Retry-After 헤더 우선)
+- 엔드포인트별 서킷 브레이커 (circuit_breaker): 장애 중인 소스는 타임아웃 대신 즉시 실패
+- 반환값은 requests.Response (재시도 후에도 실패하면 마지막 응답을 그대로 반환,
+  연결 오류/서킷 열림은 requests.RequestException) → 기존 호출부의 status_code 검사/예외 처리 그대로 사용
+"""
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 상태 코드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 속도를 줄여야 하는 상태 코드 (서버가 과부하/차단 신호를 보냄)
+THROTTLE_STATUSES = (429, 503)
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """호스트별 제한 정책"""
+    rate: float              # 시작 초당 요청 수
+    max_rate: float          # 초당 요청 수 상한
+    burst: int               # 토큰 버킷 크기
+    max_concurrency: int     # 동시 요청 상한
+    latency_target: float    # 이 시간(초)을 넘는 응답은 과부하 신호로 처리
+
+
+DEFAULT_POLICY = HostPolicy(rate=5.0, max_rate=10.0, burst=5, max_concurrency=4, latency_target=3.0)
+
+HOST_POLICIES = {
+    'query1.finance.yahoo.com': HostPolicy(rate=5.0, max_rate=20.0, burst=10, max_concurrency=8, latency_target=2.0),
+    'query2.finance.yahoo.com': HostPolicy(rate=5.0, max_rate=20.0, burst=10, max_concurrency=8, latency_target=2.0),
+    'api.binance.com': HostPolicy(rate=10.0, max_rate=20.0, burst=10, max_concurrency=4, latency_target=2.0),
+    'm.stock.naver.com': HostPolicy(rate=5.0, max_rate=10.0, burst=5, max_concurrency=4, latency_target=2.0),
+    'production.dataviz.cnn.io': HostPolicy(rate=1.0, max_rate=2.0, burst=2, max_concurrency=1, latency_target=5.0),
+}
+
+# 서킷 브레이커 단위: 호스트 + 경로 앞 N단계 (예: query1.finance.yahoo.com/v8/finance)
+ENDPOINT_DEPTH = 2
+
+# 최소 속도 / 재시도 백오프 (초)
+MIN_RATE = 0.2
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 10.0
+MAX_RETRY_AFTER = 30.0
+
+# 동시에 진행 중이던 요청들이 한꺼번에 429를 받아도 한 번만 줄이도록 감소 사이 최소 간격 (초)
+DECREASE_COOLDOWN = 1.0
+
+
+class HostLimiter:
+    """토큰 버킷 + AIMD 동시성 제한 (스레드 안전)"""
+
+    def __init__(self, host: str, policy: HostPolicy):
+        self.host = host
+        self.policy = policy
+        self.rate = policy.rate
+        self.limit = float(min(2, policy.max_concurrency))  # 동시 요청 한도 (AIMD, 소수 허용)
+        self.tokens = float(policy.burst)
+        self.in_flight = 0
+        self.blocked_until = 0.0   # Retry-After 등으로 요청을 멈출 시각 (monotonic)
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+
+        # 통계
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.policy.burst, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self):
+        """동시성 슬롯 + 토큰 1개 확보까지 대기"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = 0.0
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.in_flight >= int(self.limit):
+                    wait = None  # release 알림 대기
+                elif self.tokens < 1.0:
+                    wait = (1.0 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1.0
+                    self.in_flight += 1
+                    self.requests += 1
+                    return
+                self._cond.wait(wait)
+
+    def release(self, status: Optional[int], latency: float, retry_after: float = None):
+        """
+        요청 결과 반영 (AIMD)
+
+        Args:
+            status: HTTP 상태 코드 (연결 오류면 None)
+            latency: 응답 시간 (초)
+            retry_after: 서버가 요구한 대기 시간 (초)
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if status in THROTTLE_STATUSES:
+                self.throttled += 1
+                self._decrease()
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + min(retry_after, MAX_RETRY_AFTER))
+                logger.warning(f"{self.host}: {status} 응답 - 동시 {self.limit:.1f}, 초당 {self.rate:.1f}회로 축소")
+            elif status is None or status >= 500:
+                self.errors += 1
+            elif latency > self.policy.latency_target:
+                self._decrease(factor=0.75)
+            else:
+                # additive increase: 한도당 1회 성공마다 +1 (한도 1 늘리는 데 한도만큼의 성공 필요)
+                self.limit = min(self.policy.max_concurrency, self.limit + 1.0 / max(self.limit, 1.0))
+                self.rate = min(self.policy.max_rate, self.rate + 0.1)
+            self._cond.notify_all()
+
+    def _decrease(self, factor: float = 0.5):
+        """multiplicative decrease (DECREASE_COOLDOWN 안에서는 1회만)"""
+        now = time.monotonic()
+        if now - self._decreased_at < DECREASE_COOLDOWN:
+            return
+        self._decreased_at = now
+        self.limit = max(1.0, self.limit * factor)
+        self.rate = max(MIN_RATE, self.rate * factor)
+
+    def stats(self) -> Dict:
+        """현재 상태 (모니터링용)"""
+        with self._cond:
+            return {
+                'rate': round(self.rate, 2),
+                'concurrency': round(self.limit, 2),
+                'in_flight': self.in_flight,
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'errors': self.errors,
+            }
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Retry-After 헤더 (초 단위만 지원)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def endpoint_key(url: str) -> str:
+    """서킷 브레이커 키 (호스트 + 경로 앞 ENDPOINT_DEPTH단계)"""
+    parsed = urlparse(url)
+    segments = [s for s in parsed.path.split('/') if s][:ENDPOINT_DEPTH]
+    return '/'.join([parsed.netloc] + segments)
+
+
+class HttpClient:
+    """호스트별 제한을 공유하는 requests.Session 래퍼"""
+
+    def __init__(self, pool_size: int = 16):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, host: str) -> HostLimiter:
+        """호스트 제한기 (처음 요청 시 생성)"""
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = HostLimiter(host, HOST_POLICIES.get(host, DEFAULT_POLICY))
+                self._limiters[host] = limiter
+            return limiter
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """엔드포인트 서킷 브레이커 (처음 요청 시 생성)"""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key)
+                self._breakers[key] = breaker
+            return breaker
+
+    def request(self, method: str, url: str, retries: int = 2, **kwargs) -> requests.Response:
+        """
+        요청 (호스트 제한 + 재시도)
+
+        Args:
+            retries: 429/5xx/연결 오류 시 추가 시도 횟수
+            **kwargs: requests 인자 (params, headers, timeout 등)
+
+        Raises:
+            requests.RequestException: 재시도 후에도 연결 실패
+            CircuitOpenError: 서킷이 열려 있음 (요청하지 않음)
+        """
+        limiter = self.limiter(urlparse(url).netloc)
+        breaker = self.breaker(endpoint_key(url))
+        kwargs.setdefault('timeout', 10)
+
+        for attempt in range(retries + 1):
+            breaker.check()
+            limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                limiter.release(None, time.monotonic() - start)
+                breaker.record_failure()
+                if attempt >= retries:
+                    raise
+                self._sleep_backoff(attempt)
+                continue
+            except Exception:
+                # 요청 외 오류 (잘못된 인자 등)도 슬롯은 반환 - 재시도/서킷 기록 없이 그대로 전달
+                limiter.release(None, time.monotonic() - start)
+                raise
+
+            retry_after = _retry_after_seconds(response) if response.status_code in THROTTLE_STATUSES else None
+            limiter.release(response.status_code, time.monotonic() - start, retry_after)
+            if response.status_code in RETRY_STATUSES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            logger.debug(f"{limiter.host}: {response.status_code} 응답 - 재시도 {attempt + 1}/{retries}")
+            response.close()  # stream=True 요청도 연결 반환
+            self._sleep_backoff(attempt, retry_after)
+
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    @staticmethod
+    def _sleep_backoff(attempt: int, retry_after: float = None):
+        """지수 백오프 + 전체 지터 (Retry-After가 있으면 그 이상)"""
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+        if retry_after:
+            delay = max(delay, min(retry_after, MAX_RETRY_AFTER))
+        time.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict]:
+        """호스트별 상태"""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.host: limiter.stats() for limiter in limiters}
+
+    def breaker_stats(self) -> Dict[str, Dict]:
+        """엔드포인트별 서킷 상태"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """프로세스 전역 HTTP 클라이언트"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """공용 클라이언트로 GET (requests.get과 같은 인자)"""
+    return get_http_client().get(url, **kwargs)
@@ -0,0 +1,106 @@
+"""
+텔레그램 업로드 전 이미지 인코딩
+
+- 이미지 종류별 포맷 선택
+  graphic (차트 / 테이블 / 게이지 - 색 수가 적음): 256색 팔레트 PNG
+  photo (사진이 섞인 페이지 캡처 등): JPEG (품질 JPEG_QUALITY)
+  auto: 축소본의 색 수로 판단 (GRAPHIC_MAX_COLORS 이하면 graphic)
+- Pillow로 다시 저장하므로 메타데이터(tEXt / EXIF 등)는 모두 제거
+- 바이트 예산(PHOTO_MAX_BYTES)을 넘으면 JPEG 품질 → 해상도 순으로 낮춤
+- WebP는 텔레그램 send_photo에서 사진으로 표시되지 않아 JPEG 사용
+"""
+import io
+import logging
+from typing import Tuple, Union
+
+from PIL import Image
+
+from config import PHOTO_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# auto 판단 기준 (축소본의 서로 다른 색 수)
+GRAPHIC_MAX_COLORS = 4096
+SAMPLE_SIZE = (256, 256)
+
+# JPEG 품질 (예산 초과 시 순서대로 낮춤)
+JPEG_QUALITY = 85
+JPEG_FALLBACK_QUALITIES = (75, 65, 50)
+
+# 해상도 축소 비율 / 최소 가로 크기 (픽셀)
+SCALE_STEP = 0.8
+MIN_WIDTH = 480
+
+KINDS = ('auto', 'graphic', 'photo')
+
+
+def _load(source: Union[bytes, io.BytesIO]) -> Image.Image:
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    source.seek(0)
+    image = Image.open(source)
+    image.load()
+    # 투명 배경은 흰색으로 합성 (텔레그램 사진은 투명도 없음)
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        background = Image.new('RGB', rgba.size, 'white')
+        background.paste(rgba, mask=rgba.split()[-1])
+        return background
+    return image.convert('RGB')
+
+
+def detect_kind(image: Image.Image) -> str:
+    """색 수로 graphic / photo 판단"""
+    sample = image.copy()
+    sample.thumbnail(SAMPLE_SIZE)
+    return 'graphic' if sample.getcolors(maxcolors=GRAPHIC_MAX_COLORS) is not None else 'photo'
+
+
+def _palette_png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE).save(
+        buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def _jpeg(image: Image.Image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def encode_image(source: Union[bytes, io.BytesIO], kind: str = 'auto',
+                 max_bytes: int = PHOTO_MAX_BYTES) -> Tuple[bytes, str]:
+    """
+    업로드용 인코딩
+
+    Args:
+        source: 원본 이미지 (PNG / JPEG 등)
+        kind: 'auto' / 'graphic' / 'photo'
+        max_bytes: 바이트 예산
+
+    Returns:
+        (인코딩된 바이트, 확장자)
+    """
+    if kind not in KINDS:
+        raise ValueError(f"알 수 없는 이미지 종류: {kind}")
+    image = _load(source)
+    if kind == 'auto':
+        kind = detect_kind(image)
+
+    if kind == 'graphic':
+        data = _palette_png(image)
+        if len(data) <= max_bytes:
+            return data, 'png'
+
+    # 사진 (또는 예산을 넘은 그래픽): 품질 → 해상도 순으로 낮춤
+    while True:
+        for quality in (JPEG_QUALITY,) + JPEG_FALLBACK_QUALITIES:
+            data = _jpeg(image, quality)
+            if len(data) <= max_bytes:
+                return data, 'jpg'
+        width, height = image.size
+        if width * SCALE_STEP < MIN_WIDTH:
+            logger.warning(f"이미지 예산 초과 ({len(data)} > {max_bytes} bytes) - 최소 크기로 전송")
+            return data, 'jpg'
+        image = image.resize((int(width * SCALE_STEP), int(height * SCALE_STEP)), Image.Resampling.LANCZOS)
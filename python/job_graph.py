@@ -0,0 +1,110 @@
+"""
+작업 의존성 그래프 실행기
+
+- 노드 = 입력(데이터 조회) 또는 작업(발송), 노드는 자신이 필요로 하는 입력 이름을 선언
+- 실행 1회 동안 각 노드는 정확히 한 번만 계산되고 결과는 모든 하위 노드가 공유
+- 의존 관계가 없는 가지는 동시에 실행 (동기 함수는 스레드 풀에서)
+- 실패한 노드의 결과는 None으로 전달 (하위 작업이 None 처리)
+"""
+import asyncio
+import functools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GraphNode:
+    """그래프 노드"""
+    name: str
+    func: Callable  # 의존 노드가 없으면 func(), 있으면 func(inputs={의존 노드 이름: 결과})
+    deps: Tuple[str, ...]
+
+
+class JobGraph:
+    """의존성 그래프 기반 작업 실행기"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nodes: Dict[str, GraphNode] = {}
+        self.last_results: Dict[str, Any] = {}
+        self.last_timings: Dict[str, float] = {}
+        self.last_run: Optional[float] = None  # 마지막 실행 시작 epoch
+        self._lock = asyncio.Lock()
+
+    def add(self, name: str, func: Callable, deps: Iterable[str] = ()):
+        """
+        노드 등록 (의존 노드는 먼저 등록되어 있어야 함 → 순환 불가)
+
+        Args:
+            name: 노드 이름
+            func: 동기 또는 async 함수 (의존 노드가 있으면 inputs 키워드 인자로 결과 전달)
+            deps: 필요한 입력 노드 이름 목록
+        """
+        deps = tuple(deps)
+        if name in self.nodes:
+            raise ValueError(f"중복 노드: {name}")
+        for dep in deps:
+            if dep not in self.nodes:
+                raise ValueError(f"{name}: 등록되지 않은 의존 노드 {dep}")
+        self.nodes[name] = GraphNode(name=name, func=func, deps=deps)
+
+    def _closure(self, targets: Iterable[str]) -> List[str]:
+        """targets 실행에 필요한 노드 (등록 순서 유지)"""
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.nodes[name].deps)
+        return [name for name in self.nodes if name in needed]
+
+    async def run(self, targets: Iterable[str] = None) -> Dict[str, Any]:
+        """
+        그래프 실행
+
+        Args:
+            targets: 실행할 노드 (생략 시 전체), 필요한 입력 노드는 자동 포함
+
+        Returns:
+            {노드 이름: 결과}
+        """
+        async with self._lock:
+            names = self._closure(targets) if targets is not None else list(self.nodes)
+            loop = asyncio.get_event_loop()
+            tasks: Dict[str, asyncio.Future] = {}
+            timings: Dict[str, float] = {}
+            run_start = time.time()
+
+            async def run_node(node: GraphNode):
+                # 의존 노드 완료 대기 (각 노드는 한 번만 실행되고 결과 공유)
+                inputs = {dep: await tasks[dep] for dep in node.deps}
+                start = time.perf_counter()
+                try:
+                    call = functools.partial(node.func, inputs=inputs) if node.deps else node.func
+                    if asyncio.iscoroutinefunction(node.func):
+                        result = await call()
+                    else:
+                        result = await loop.run_in_executor(None, call)
+                except Exception as e:
+                    logger.error(f"[{self.name}] {node.name} 실행 오류: {e}")
+                    result = None
+                timings[node.name] = time.perf_counter() - start
+                return result
+
+            # 등록 순서 = 위상 정렬 순서라서 의존 노드의 task가 항상 먼저 생성됨
+            for name in names:
+                tasks[name] = asyncio.ensure_future(run_node(self.nodes[name]))
+            results = dict(zip(names, await asyncio.gather(*tasks.values())))
+
+            self.last_run = run_start
+            self.last_results = results
+            self.last_timings = timings
+            total = time.time() - run_start
+            stages = " | ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+            logger.info(f"[{self.name}] 완료 ({total:.2f}s): {stages}")
+            return results
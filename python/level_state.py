@@ -0,0 +1,193 @@
+"""
+종목별 알림 레벨 상태 (세션 단위)
+
+- 레지스트리 ID로 인덱싱한 배열 2개: 이번 세션에 알림한 최대 상승 레벨 / 최대 하락 레벨
+- 조회/기록은 배열 인덱싱 O(1) (네트워크 호출 없음)
+- 시장별 세션이 바뀌면 그 시장 종목만 초기화
+  (미국/한국: 현지 날짜, 암호화폐/환율: 한국 날짜)
+- 알림마다 쓰지 않고 주기적으로 변경분이 있을 때만 압축 스냅샷 저장 (Redis + data/ 파일)
+  → 재시작해도 같은 세션의 알림 판단 유지
+"""
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytz
+
+from market_sessions import MARKET_HOURS
+from symbol_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 파일 디렉토리 / Redis 키 접두사
+STATE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+REDIS_KEY_PREFIX = "level_state"
+
+# Redis 스냅샷 TTL (초) - 세션이 지난 스냅샷은 어차피 초기화되므로 이틀이면 충분
+SNAPSHOT_TTL = 2 * 24 * 60 * 60
+
+def _market_tz(market: str):
+    return pytz.timezone(MARKET_HOURS[market]['tz'] if market in MARKET_HOURS else 'Asia/Seoul')
+
+
+def session_key(market: str, ts: float = None) -> str:
+    """시장별 현재 세션 키 (현지 날짜)"""
+    ts = time.time() if ts is None else ts
+    return datetime.fromtimestamp(ts, _market_tz(market)).date().isoformat()
+
+
+def session_end(market: str, ts: float = None) -> float:
+    """현재 세션이 끝나는 epoch (다음 현지 자정)"""
+    ts = time.time() if ts is None else ts
+    tz = _market_tz(market)
+    today = datetime.fromtimestamp(ts, tz).date()
+    return tz.localize(datetime.combine(today + timedelta(days=1), datetime.min.time())).timestamp()
+
+
+class LevelState:
+    """세션별 최대 알림 레벨 상태 머신"""
+
+    def __init__(self, name: str, redis_client=None, state_dir: str = None):
+        registry = get_registry()
+        self.name = name
+        self.redis = redis_client
+        self.path = os.path.join(state_dir or STATE_DIR, f'level_state_{name}.json')
+        self.up = np.zeros(len(registry), dtype=np.int16)
+        self.down = np.zeros(len(registry), dtype=np.int16)
+
+        # 종목 ID → 시장, 시장 → 종목 ID 배열 (세션 초기화용)
+        self._markets: List[str] = [registry.info(sid).market for sid in range(len(registry))]
+        self._market_ids: Dict[str, np.ndarray] = {
+            market: np.array([sid for sid, m in enumerate(self._markets) if m == market], dtype=np.intp)
+            for market in set(self._markets)
+        }
+        self._sessions: Dict[str, str] = {}  # 시장 → 현재 상태가 속한 세션 키
+        self._session_until: Dict[str, float] = {}  # 시장 → 세션 키를 다시 계산할 epoch
+        self._dirty = False
+
+    def _sid(self, symbol: str) -> Optional[int]:
+        sid = get_registry().id_of(symbol)
+        if sid is None:
+            logger.warning(f"레벨 상태: 레지스트리에 없는 심볼 {symbol}")
+        return sid
+
+    def _roll(self, market: str):
+        """세션이 바뀌었으면 해당 시장 종목 상태 초기화 (세션 끝 전까지는 시각 비교 1번)"""
+        now = time.time()
+        if now < self._session_until.get(market, 0.0):
+            return
+        key = session_key(market, now)
+        self._session_until[market] = session_end(market, now)
+        if self._sessions.get(market) == key:
+            return
+        if market in self._sessions:
+            ids = self._market_ids[market]
+            self.up[ids] = 0
+            self.down[ids] = 0
+            logger.info(f"레벨 상태 초기화 ({self.name}/{market}): {self._sessions[market]} → {key}")
+        self._sessions[market] = key
+        self._dirty = True
+
+    def session_of(self, symbol: str) -> str:
+        """종목 시장의 현재 세션 키 (레지스트리에 없는 심볼은 한국 날짜)"""
+        sid = get_registry().id_of(symbol)
+        return session_key(self._markets[sid] if sid is not None else '')
+
+    def max_level(self, symbol: str, up: bool) -> int:
+        """이번 세션에 알림한 최대 레벨 (방향별)"""
+        sid = self._sid(symbol)
+        if sid is None:
+            return 0
+        self._roll(self._markets[sid])
+        return int(self.up[sid] if up else self.down[sid])
+
+    def should_alert(self, symbol: str, level: int, up: bool) -> bool:
+        """이번 세션 같은 방향 최대 레벨보다 높을 때만 알림"""
+        return level > self.max_level(symbol, up)
+
+    def record(self, symbol: str, level: int, up: bool):
+        """알림한 레벨 기록 (방향별 최대값 유지)"""
+        sid = self._sid(symbol)
+        if sid is None:
+            return
+        self._roll(self._markets[sid])
+        levels = self.up if up else self.down
+        if level > levels[sid]:
+            levels[sid] = level
+            self._dirty = True
+
+    def snapshot(self) -> Dict:
+        """압축 스냅샷 {'sessions': {시장: 세션}, 'levels': {심볼: [상승, 하락]}} (0인 종목 제외)"""
+        registry = get_registry()
+        active = np.flatnonzero(self.up | self.down)
+        return {
+            'sessions': dict(self._sessions),
+            'levels': {registry.symbol_of(int(sid)): [int(self.up[sid]), int(self.down[sid])] for sid in active},
+        }
+
+    def restore(self, data: Dict) -> int:
+        """스냅샷 복원 (이미 지난 세션의 시장은 버림, 현재 상태와 최대값으로 합침), 복원한 종목 수 반환"""
+        registry = get_registry()
+        live = [market for market, key in data.get('sessions', {}).items()
+                if market in self._market_ids and session_key(market) == key]
+        for market in live:
+            self._roll(market)  # 현재 상태도 같은 세션으로 맞춤
+
+        restored = 0
+        for symbol, (up, down) in data.get('levels', {}).items():
+            sid = registry.id_of(symbol)
+            if sid is None or self._markets[sid] not in live:
+                continue
+            self.up[sid] = max(int(self.up[sid]), up)
+            self.down[sid] = max(int(self.down[sid]), down)
+            restored += 1
+        return restored
+
+    def save(self, force: bool = False):
+        """변경분이 있으면 스냅샷 저장 (Redis + 파일)"""
+        if not self._dirty and not force:
+            return
+        payload = json.dumps(self.snapshot(), separators=(',', ':'))
+
+        if self.redis:
+            try:
+                self.redis.setex(f"{REDIS_KEY_PREFIX}:{self.name}", SNAPSHOT_TTL, payload)
+            except Exception as e:
+                logger.error(f"레벨 상태 Redis 저장 오류 ({self.name}): {e}")
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"레벨 상태 파일 저장 오류 ({self.name}): {e}")
+        self._dirty = False
+
+    def load(self):
+        """스냅샷 로드 (Redis 우선, 없으면 파일)"""
+        payload = None
+        if self.redis:
+            try:
+                payload = self.redis.get(f"{REDIS_KEY_PREFIX}:{self.name}")
+            except Exception as e:
+                logger.error(f"레벨 상태 Redis 조회 오류 ({self.name}): {e}")
+        if payload is None and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    payload = f.read()
+            except Exception as e:
+                logger.error(f"레벨 상태 파일 로드 오류 ({self.name}): {e}")
+        if not payload:
+            return
+
+        try:
+            restored = self.restore(json.loads(payload))
+            logger.info(f"레벨 상태 복원 ({self.name}): {restored}개 종목")
+        except Exception as e:
+            logger.error(f"레벨 상태 복원 오류 ({self.name}): {e}")
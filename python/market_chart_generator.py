@@ -1,20 +1,17 @@
 """
 시장 현황 차트 생성 모듈
+- 그리기는 render_service의 렌더 함수 (Figure API, 같은 데이터면 캐시된 이미지)
 """
 import logging
-import requests
+from http_client import http_get
 from typing import List, Dict, Optional
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import io
+from render_cache import render_cached
+from render_service import render_market_chart, render_single_chart
 
 logger = logging.getLogger(__name__)
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['axes.unicode_minus'] = False
-
 
 class MarketChartGenerator:
     """시장 현황 차트 생성 클래스"""
@@ -48,7 +45,7 @@ class MarketChartGenerator:
                 "range": "1y"
             }
 
-            response = requests.get(url, params=params, headers=self._headers, timeout=15)
+            response = http_get(url, params=params, headers=self._headers, timeout=15)
 
             if response.status_code != 200:
                 logger.warning(f"{symbol}: API 오류 ({response.status_code})")
@@ -93,6 +90,16 @@ class MarketChartGenerator:
             logger.error(f"{symbol} 차트 데이터 오류: {e}")
             return None
 
+    def _collect_chart_data(self) -> List[Dict]:
+        """시장 현황 차트에 넣을 지수/암호화폐 데이터 (가져온 것만)"""
+        symbols = list(self.INDICES.keys()) + list(self.CRYPTO.keys())
+        chart_data = []
+        for symbol in symbols:
+            data = self.get_chart_data(symbol)
+            if data:
+                chart_data.append(data)
+        return chart_data
+
     def create_market_chart(self) -> Optional[io.BytesIO]:
         """
         시장 현황 차트 생성 (4개 지수를 2x2 스파크라인으로)
@@ -101,60 +108,12 @@ class MarketChartGenerator:
             이미지 바이트 스트림
         """
         try:
-            symbols = list(self.INDICES.keys()) + list(self.CRYPTO.keys())
-            chart_data = {}
-
-            for symbol in symbols:
-                data = self.get_chart_data(symbol)
-                if data:
-                    chart_data[symbol] = data
-
+            chart_data = self._collect_chart_data()
             if not chart_data:
                 logger.warning("차트 데이터 없음")
                 return None
 
-            # 2x2 차트 (높이 절반)
-            fig, axes = plt.subplots(2, 2, figsize=(8, 3))
-            axes = axes.flatten()
-
-            for idx, (symbol, data) in enumerate(chart_data.items()):
-                if idx >= 4:
-                    break
-
-                ax = axes[idx]
-                closes = data['closes']
-                color = data['color']
-                name = data['name']
-                current = data['current']
-                change = data['change_1y']
-
-                # 차트 그리기
-                ax.plot(closes, color=color, linewidth=1.5)
-                ax.fill_between(range(len(closes)), closes, alpha=0.2, color=color)
-
-                # 축 스타일 (xy축 표시)
-                ax.tick_params(axis='both', labelsize=6)
-                ax.spines['top'].set_visible(False)
-                ax.spines['right'].set_visible(False)
-
-                # 제목 (이름, 가격, 수익률)
-                change_sign = "+" if change >= 0 else ""
-                title = f"{name}\n${current:,.0f} ({change_sign}{change:.1f}%)"
-                ax.set_title(title, fontsize=9, fontweight='bold', color=color)
-
-            # 빈 축 숨기기
-            for idx in range(len(chart_data), 4):
-                axes[idx].set_visible(False)
-
-            plt.tight_layout()
-
-            # 이미지로 저장
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=120, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            img_buffer.seek(0)
-            plt.close()
-
+            img_buffer = io.BytesIO(render_cached(render_market_chart, chart_data))
             logger.info("시장 현황 차트 생성 성공")
             return img_buffer
 
@@ -173,46 +132,7 @@ class MarketChartGenerator:
             data = self.get_chart_data(symbol)
             if not data:
                 return None
-
-            fig, ax = plt.subplots(figsize=(8, 4))
-
-            dates = data['dates']
-            closes = data['closes']
-            color = data['color']
-            name = data['name']
-            current = data['current']
-            change = data['change_1y']
-
-            # 차트 그리기
-            ax.plot(dates, closes, color=color, linewidth=2)
-            ax.fill_between(dates, closes, alpha=0.15, color=color)
-
-            # 현재가 표시
-            ax.axhline(y=current, color=color, linestyle='--', alpha=0.5)
-
-            # 제목
-            change_sign = "+" if change >= 0 else ""
-            ax.set_title(f"{name} - ${current:,.2f} ({change_sign}{change:.1f}% YTD)",
-                        fontsize=14, fontweight='bold')
-
-            # 축 설정
-            ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            ax.tick_params(axis='x', rotation=45)
-            ax.grid(True, alpha=0.3)
-
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-
-            plt.tight_layout()
-
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight',
-                       facecolor='white')
-            img_buffer.seek(0)
-            plt.close()
-
-            return img_buffer
+            return io.BytesIO(render_cached(render_single_chart, data))
 
         except Exception as e:
             logger.error(f"단일 차트 생성 오류: {e}")
@@ -4,20 +4,14 @@
 """
 import logging
 from typing import Dict, Optional
-import requests
+from http_client import http_get
 from datetime import datetime
+from symbol_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
-# 주요 지수 리스트
-MAJOR_INDICES = {
-    "^IXIC": "나스닥",      # Nasdaq Composite
-    "^GSPC": "S&P500",      # S&P 500
-    "BTC-USD": "비트코인",  # Bitcoin
-    "^KS11": "코스피",      # KOSPI
-    "^KQ11": "코스닥",      # KOSDAQ
-    "^SOX": "SOXX",         # Semiconductor Index
-}
+# 주요 지수 리스트 (나스닥, S&P500, 비트코인, 코스피, 코스닥, 필라델피아 반도체)
+MAJOR_INDICES = get_registry().names('major_indices', short=True)
 
 
 class MarketIndexTracker:
@@ -49,7 +43,7 @@ class MarketIndexTracker:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = http_get(url, params=params, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.warning(f"{name}({symbol}): API 응답 오류 ({response.status_code})")
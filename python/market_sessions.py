@@ -0,0 +1,183 @@
+"""
+미국/한국 거래 세션 캘린더
+
+- 거래일마다 (프리 시작, 정규장 시작, 정규장 마감, 애프터 마감) UTC epoch 배열을 미리 계산
+- 휴장일/조기 마감 반영 (market_holidays 기준)
+- bisect로 "지금 열린 세션" / "다음 개장 시각"을 O(log n) 조회
+"""
+import logging
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+# 시장별 세션 시간 (현지 시각)
+MARKET_HOURS = {
+    'US': {
+        'tz': 'America/New_York',
+        'pre': (4, 0),          # 프리마켓 시작
+        'open': (9, 30),        # 정규장 시작
+        'close': (16, 0),       # 정규장 마감
+        'post': (20, 0),        # 애프터마켓 마감
+        'early_close': (13, 0),  # 조기 마감일 정규장 마감
+        'early_post': (17, 0),   # 조기 마감일 애프터마켓 마감
+    },
+    'KR': {
+        'tz': 'Asia/Seoul',
+        'pre': (8, 30),         # 장전 동시호가/시간외
+        'open': (9, 0),
+        'close': (15, 30),
+        'post': (18, 0),        # 시간외 단일가 마감
+        'early_close': (15, 30),
+        'early_post': (18, 0),
+    },
+}
+
+# 세션 배열을 미리 만들어 둘 범위 (올해 기준 앞뒤 연도)
+YEARS_BEHIND = 1
+YEARS_AHEAD = 1
+
+
+class SessionCalendar:
+    """거래일별 세션 epoch 배열"""
+
+    def __init__(self, market: str, start_year: int, end_year: int):
+        from market_holidays import is_market_holiday, is_early_close
+
+        self.market = market
+        self.start_year = start_year
+        self.end_year = end_year
+        hours = MARKET_HOURS[market]
+        self.tz = pytz.timezone(hours['tz'])
+
+        self.days: List[int] = []        # date.toordinal()
+        self.pre: List[float] = []
+        self.open: List[float] = []
+        self.close: List[float] = []
+        self.post: List[float] = []
+        self.early: List[bool] = []
+
+        day = date(start_year, 1, 1)
+        last = date(end_year, 12, 31)
+        while day <= last:
+            if not is_market_holiday(market, day):
+                early = is_early_close(market, day)
+                close_hm = hours['early_close'] if early else hours['close']
+                post_hm = hours['early_post'] if early else hours['post']
+
+                self.days.append(day.toordinal())
+                self.pre.append(self._epoch(day, hours['pre']))
+                self.open.append(self._epoch(day, hours['open']))
+                self.close.append(self._epoch(day, close_hm))
+                self.post.append(self._epoch(day, post_hm))
+                self.early.append(early)
+            day += timedelta(days=1)
+
+        logger.debug(f"{market} 세션 캘린더 생성: {start_year}~{end_year}, {len(self.days)}거래일")
+
+    def _epoch(self, day: date, hm) -> float:
+        """현지 날짜/시각 → UTC epoch (서머타임 반영)"""
+        local = self.tz.localize(datetime(day.year, day.month, day.day, hm[0], hm[1]))
+        return local.timestamp()
+
+    def covers(self, ts: float) -> bool:
+        """ts가 미리 계산한 범위 안인지"""
+        return bool(self.pre) and self.pre[0] - 86400 <= ts <= self.post[-1] + 86400
+
+    def session_index(self, ts: float) -> Optional[int]:
+        """ts가 속한 세션(프리~애프터) 인덱스, 없으면 None"""
+        i = bisect_right(self.pre, ts) - 1
+        if i >= 0 and ts < self.post[i]:
+            return i
+        return None
+
+    def phase(self, ts: float = None) -> Optional[str]:
+        """'pre' / 'regular' / 'post' / None(장 외)"""
+        ts = time.time() if ts is None else ts
+        i = self.session_index(ts)
+        if i is None:
+            return None
+        if ts < self.open[i]:
+            return 'pre'
+        if ts < self.close[i]:
+            return 'regular'
+        return 'post'
+
+    def is_open(self, ts: float = None, extended: bool = False) -> bool:
+        """
+        장 운영 중인지 확인
+
+        Args:
+            extended: True면 프리/애프터 포함
+        """
+        phase = self.phase(ts)
+        if extended:
+            return phase is not None
+        return phase == 'regular'
+
+    def is_trading_day(self, day: date) -> bool:
+        """해당 현지 날짜가 거래일인지"""
+        ordinal = day.toordinal()
+        i = bisect_right(self.days, ordinal) - 1
+        return i >= 0 and self.days[i] == ordinal
+
+    def next_open(self, ts: float = None, extended: bool = False) -> Optional[float]:
+        """ts 이후 다음 개장 epoch (extended면 프리마켓 시작)"""
+        ts = time.time() if ts is None else ts
+        starts = self.pre if extended else self.open
+        i = bisect_right(starts, ts)
+        return starts[i] if i < len(starts) else None
+
+    def last_close(self, ts: float = None) -> Optional[float]:
+        """ts 이전 마지막 정규장 마감 epoch"""
+        ts = time.time() if ts is None else ts
+        i = bisect_right(self.close, ts) - 1
+        return self.close[i] if i >= 0 else None
+
+    def next_close(self, ts: float = None) -> Optional[float]:
+        """ts 이후 다음 정규장 마감 epoch"""
+        ts = time.time() if ts is None else ts
+        i = bisect_right(self.close, ts)
+        return self.close[i] if i < len(self.close) else None
+
+
+_calendars: Dict[str, SessionCalendar] = {}
+
+
+def get_calendar(market: str, ts: float = None) -> SessionCalendar:
+    """시장별 캘린더 (ts가 범위를 벗어나면 다시 생성)"""
+    ts = time.time() if ts is None else ts
+    calendar = _calendars.get(market)
+    if calendar is None or not calendar.covers(ts):
+        year = datetime.fromtimestamp(ts, pytz.utc).year
+        calendar = SessionCalendar(market, year - YEARS_BEHIND, year + YEARS_AHEAD)
+        _calendars[market] = calendar
+    return calendar
+
+
+def open_markets(ts: float = None, extended: bool = False) -> List[str]:
+    """지금 열려 있는 시장 목록 (예: ['US'])"""
+    ts = time.time() if ts is None else ts
+    return [market for market in MARKET_HOURS if get_calendar(market, ts).is_open(ts, extended)]
+
+
+def is_market_open(market: str, ts: float = None, extended: bool = False) -> bool:
+    """해당 시장 장 운영 여부"""
+    ts = time.time() if ts is None else ts
+    return get_calendar(market, ts).is_open(ts, extended)
+
+
+def next_open(market: str, ts: float = None, extended: bool = False) -> Optional[float]:
+    """해당 시장 다음 개장 epoch"""
+    ts = time.time() if ts is None else ts
+    return get_calendar(market, ts).next_open(ts, extended)
+
+
+def market_today(market: str, ts: float = None) -> date:
+    """시장 현지 기준 오늘 날짜"""
+    ts = time.time() if ts is None else ts
+    return datetime.fromtimestamp(ts, get_calendar(market, ts).tz).date()
@@ -0,0 +1,138 @@
+"""
+공용 시세 틱 파이프라인
+
+- 매 틱마다 등록된 평가기들이 필요로 하는 종목의 합집합을 한 번만 조회
+- 조회 주기 계획기가 있으면 조회 시각이 된 종목만 조회하고 나머지는 직전 시세 유지
+- 같은 스냅샷으로 평가기(주가 레벨, 배당주, TQ버스, 주말 모드)를 순서대로 실행
+- 틱은 겹치지 않음 (이전 틱이 진행 중이면 이번 틱은 건너뜀)
+- 단계별 소요 시간 기록
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from poll_planner import PollPlanner
+from stock_monitor import QuoteSnapshot, StockMonitor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TickEvaluator:
+    """틱 평가기"""
+    name: str
+    evaluate: Callable[[QuoteSnapshot], Awaitable[None]]
+    symbols: Callable[[], Iterable[str]]  # 이번 틱에 필요한 종목 (빈 목록이면 스냅샷 불필요)
+    enabled: Callable[[], bool]           # False면 이번 틱에서 제외
+    interval: Optional[float] = None      # 최소 실행 간격 (초), 필요한 종목도 이 간격 이상 오래된 시세는 안 씀
+    last_run: float = 0.0
+
+
+class MarketTickPipeline:
+    """하나의 스냅샷을 여러 평가기가 공유하는 틱 파이프라인"""
+
+    def __init__(self, stock_monitor: StockMonitor, planner: PollPlanner = None, tick_interval: float = 0.0):
+        self.stock_monitor = stock_monitor
+        self.planner = planner
+        self.slack = tick_interval / 2  # 조회/실행 시각 판단 여유 (다음 틱까지 밀리지 않도록)
+        self.evaluators: List[TickEvaluator] = []
+        self._lock = asyncio.Lock()
+        self.last_timings: Dict[str, float] = {}
+        self.last_snapshot: Optional[QuoteSnapshot] = None
+        self.skipped_ticks = 0
+
+    def register(self, name: str, evaluate: Callable[[QuoteSnapshot], Awaitable[None]],
+                 symbols: Callable[[], Iterable[str]] = None,
+                 enabled: Callable[[], bool] = None,
+                 interval: float = None):
+        """
+        평가기 등록 (등록 순서대로 실행)
+
+        Args:
+            name: 평가기 이름 (타이밍 로그 키)
+            evaluate: 스냅샷을 받는 async 함수
+            symbols: 이번 틱에 필요한 심볼 목록을 반환하는 함수
+            enabled: 이번 틱 실행 여부를 반환하는 함수
+            interval: 최소 실행 간격 (초, 생략 시 매 틱)
+        """
+        self.evaluators.append(TickEvaluator(
+            name=name,
+            evaluate=evaluate,
+            symbols=symbols or (lambda: ()),
+            enabled=enabled or (lambda: True),
+            interval=interval,
+        ))
+
+    async def run_tick(self):
+        """틱 1회 실행 (겹치는 실행 방지)"""
+        if self._lock.locked():
+            self.skipped_ticks += 1
+            logger.warning(f"이전 틱 진행 중 - 이번 틱 스킵 (누적 {self.skipped_ticks}회)")
+            return
+
+        async with self._lock:
+            timings: Dict[str, float] = {}
+            tick_start = time.perf_counter()
+
+            # 1. 이번 틱에 실행할 평가기와 필요한 종목 합집합
+            stage_start = time.perf_counter()
+            now = time.time()
+            active = []
+            wanted: Dict[str, None] = {}
+            for evaluator in self.evaluators:
+                try:
+                    if evaluator.interval and now - evaluator.last_run < evaluator.interval - self.slack:
+                        continue
+                    if not evaluator.enabled():
+                        continue
+                    symbols = list(evaluator.symbols())
+                    if self.planner is not None and evaluator.interval:
+                        self.planner.pin(symbols, evaluator.interval)
+                    wanted.update(dict.fromkeys(symbols))
+                    evaluator.last_run = now
+                    active.append(evaluator)
+                except Exception as e:
+                    logger.error(f"틱 평가기 준비 오류 ({evaluator.name}): {e}")
+            timings['plan'] = time.perf_counter() - stage_start
+
+            # 2. 스냅샷 1회 조회 (블로킹 HTTP는 스레드에서)
+            stage_start = time.perf_counter()
+            fetch = self.planner.due(wanted, now, self.slack) if self.planner is not None else list(wanted)
+            if fetch:
+                loop = asyncio.get_event_loop()
+                snapshot = await loop.run_in_executor(None, self.stock_monitor.take_snapshot, fetch)
+            else:
+                snapshot = QuoteSnapshot()
+            if self.planner is not None:
+                self._carry_forward(snapshot, wanted, fetch)
+            self.last_snapshot = snapshot
+            timings['snapshot'] = time.perf_counter() - stage_start
+
+            # 3. 평가기 실행 (하나가 실패해도 나머지는 계속)
+            for evaluator in active:
+                stage_start = time.perf_counter()
+                try:
+                    await evaluator.evaluate(snapshot)
+                except Exception as e:
+                    logger.error(f"틱 평가기 오류 ({evaluator.name}): {e}")
+                timings[evaluator.name] = time.perf_counter() - stage_start
+
+            timings['total'] = time.perf_counter() - tick_start
+            self.last_timings = timings
+
+            stages = " | ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+            logger.info(f"틱 완료 ({len(snapshot)}/{len(wanted)}개 시세, {len(fetch)}개 조회): {stages}")
+
+    def _carry_forward(self, snapshot: QuoteSnapshot, wanted: Iterable[str], fetched: List[str]):
+        """조회 결과로 다음 조회 시각 갱신 + 이번 틱에 조회하지 않은 종목은 직전 시세 유지"""
+        now = time.time()
+        fetched_set = set(fetched)
+        for symbol in fetched:
+            self.planner.observe(symbol, snapshot.get(symbol), now)
+        if self.last_snapshot is None:
+            return
+        for symbol in wanted:
+            if symbol not in fetched_set:
+                snapshot.put(symbol, self.last_snapshot.get(symbol))
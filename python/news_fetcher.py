@@ -1,14 +1,26 @@
 """
 뉴스 데이터 가져오기 모듈 (Google News RSS 사용)
 - 비트코인, 미국 증시, 한국 증시 뉴스
-- 영어 뉴스 한국어 번역 지원
+- 영어 뉴스 한국어 번역 지원 (실행당 1회 배치 요청 + 영구 번역 캐시)
+- RSS는 스트리밍 파싱 (필요한 기사 수를 채우면 나머지는 받지 않음)
+- 제목 중복 제거는 MinHash/LSH 인덱스 (headline_index, 전체 카테고리 공용)
+- 기사마다 제목에 나온 관심 종목 태그 ('symbols', news_matcher)
+- 피드는 동시에 조회, 피드별 캐시 (TTL 안에는 요청 없음, 이후 ETag/Last-Modified 조건부 요청 → 304면 파싱 없이 캐시 사용)
 """
 import requests
 import logging
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
+from http_client import http_get
+from headline_index import HeadlineIndex, tokenize
+from translation_cache import BatchTranslator, GoogleBatchTranslator, TranslationCache
+from news_matcher import AhoCorasick, get_watchlist_matcher
 
 # googletrans는 선택적 (한국어 뉴스만 사용시 불필요)
 try:
@@ -19,6 +31,33 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 피드 캐시 TTL (초) - 이 시간 안에는 다시 요청하지 않음
+FEED_CACHE_TTL = 10 * 60
+
+# 피드 동시 조회 스레드 수
+FEED_WORKERS = 6
+
+# RSS 스트리밍 파싱 청크 크기 (바이트)
+RSS_CHUNK_SIZE = 8192
+
+# 관심 주제 키워드 (소문자, 오토마톤은 모듈 로드 시 한 번 구성)
+RELEVANT_KEYWORDS = [
+    "kospi", "코스피", "한국주식", "korea stock",
+    "nasdaq", "dow jones", "s&p 500", "미국주식", "us stock",
+    "bitcoin", "비트코인", "ethereum", "이더리움", "crypto", "cryptocurrency"
+]
+_RELEVANT_AUTOMATON = AhoCorasick(RELEVANT_KEYWORDS)
+
+
+@dataclass
+class FeedCacheEntry:
+    """피드별 캐시 (조건부 요청 헤더 + 파싱 결과)"""
+    articles: List[Dict]
+    limit: int                        # 파싱한 최대 기사 수 (더 많이 필요하면 전체 재요청)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+
 
 class NewsFetcher:
     """Google News RSS에서 뉴스를 가져오는 클래스"""
@@ -63,7 +102,11 @@ class NewsFetcher:
         },
     }
 
-    def __init__(self, api_key: str = None, category: str = "business"):
+    def __init__(self, api_key: str = None, category: str = "business", translator=None):
+        """
+        Args:
+            translator: translate_batch(texts, src, dest)를 가진 번역기 (생략 시 googletrans, 테스트 시 LocalTranslator)
+        """
         self.api_key = api_key  # 번역 API용 (선택적)
         self.category = category
         self.last_fetched_articles = []
@@ -71,10 +114,20 @@ class NewsFetcher:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.translator = Translator() if TRANSLATOR_AVAILABLE else None
+        # 번역 (캐시에 없는 제목만 실행당 1회 배치 요청)
+        if translator is None and self.translator is not None:
+            translator = GoogleBatchTranslator(self.translator)
+        translation_cache = TranslationCache()
+        translation_cache.load()
+        self.translation = BatchTranslator(translator, translation_cache)
+        self._feed_cache: Dict[str, FeedCacheEntry] = {}
+        self._feed_cache_lock = threading.Lock()
 
     def fetch_google_news_rss(self, url: str, limit: int = 10) -> List[Dict]:
         """
-        Google News RSS에서 뉴스 가져오기
+        Google News RSS에서 뉴스 가져오기 (피드 캐시 사용)
+        - TTL 안이면 캐시 그대로 반환 (요청 없음)
+        - TTL이 지났으면 ETag/Last-Modified 조건부 요청 → 304면 캐시 반환 (파싱 없음)
 
         Args:
             url: RSS URL
@@ -83,33 +136,41 @@ class NewsFetcher:
         Returns:
             뉴스 기사 리스트
         """
-        try:
-            response = requests.get(url, headers=self._headers, timeout=10)
-            response.raise_for_status()
-
-            # XML 파싱
-            root = ET.fromstring(response.content)
-
-            articles = []
-            for item in root.findall('.//item'):
-                if len(articles) >= limit:
-                    break
+        with self._feed_cache_lock:
+            cached = self._feed_cache.get(url)
+        if cached is not None and cached.limit < limit:
+            cached = None  # 캐시보다 많은 기사 필요 → 전체 재요청
 
-                title = item.find('title')
-                link = item.find('link')
-                pub_date = item.find('pubDate')
-                source = item.find('source')
+        if cached is not None and time.time() - cached.fetched_at < FEED_CACHE_TTL:
+            return cached.articles[:limit]
 
-                article = {
-                    'title': title.text if title is not None else '',
-                    'link': link.text if link is not None else '',
-                    'pubDate': pub_date.text if pub_date is not None else '',
-                    'source': source.text if source is not None else '',
-                }
+        headers = dict(self._headers)
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
 
-                # 제목이 있는 것만 추가
-                if article['title']:
-                    articles.append(article)
+        try:
+            response = http_get(url, headers=headers, timeout=10, stream=True)
+            try:
+                if response.status_code == 304 and cached is not None:
+                    cached.fetched_at = time.time()
+                    logger.info(f"RSS 변경 없음 (304) - 캐시 {len(cached.articles[:limit])}개 기사 사용")
+                    return cached.articles[:limit]
+
+                response.raise_for_status()
+                articles = list(self._iter_rss_articles(response.iter_content(RSS_CHUNK_SIZE), limit))
+            finally:
+                response.close()  # limit개를 채웠으면 나머지 본문은 받지 않고 연결 종료
+
+            with self._feed_cache_lock:
+                self._feed_cache[url] = FeedCacheEntry(
+                    articles=articles,
+                    limit=limit,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                )
 
             logger.info(f"Google News RSS에서 {len(articles)}개 기사 가져옴")
             return articles
@@ -124,9 +185,42 @@ class NewsFetcher:
             logger.error(f"뉴스 처리 오류: {e}")
             return []
 
+    def _iter_rss_articles(self, chunks: Iterable[bytes], limit: int) -> Iterator[Dict]:
+        """
+        RSS 스트리밍 파싱 - <item>이 닫힐 때마다 기사 반환
+        - 제목(없으면 링크)이 같은 기사는 한 번만, limit개를 채우면 나머지는 읽지 않음
+        - 처리한 item은 비워서 문서 전체를 메모리에 두지 않음
+        """
+        parser = ET.XMLPullParser(events=('end',))
+        seen = set()
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, item in parser.read_events():
+                if item.tag != 'item':
+                    continue
+
+                article = {
+                    'title': item.findtext('title') or '',
+                    'link': item.findtext('link') or '',
+                    'pubDate': item.findtext('pubDate') or '',
+                    'source': item.findtext('source') or '',
+                }
+                item.clear()
+
+                # 제목이 있는 것만, 같은 기사는 한 번만
+                key = article['title'] or article['link']
+                if not article['title'] or key in seen:
+                    continue
+                seen.add(key)
+                yield article
+
+                if len(seen) >= limit:
+                    return
+        parser.close()
+
     def translate_to_korean(self, text: str) -> str:
         """
-        영어 텍스트를 한국어로 번역 (google-translate-new 사용)
+        영어 텍스트를 한국어로 번역 (번역 캐시 사용)
 
         Args:
             text: 번역할 텍스트
@@ -134,79 +228,32 @@ class NewsFetcher:
         Returns:
             번역된 텍스트
         """
-        if not text:
-            return text
+        return self.translate_titles([text])[0]
 
-        # 이미 한국어인 경우 그대로 반환
-        if self._is_korean(text):
-            return text
-
-        # 번역기 없으면 원문 반환
-        if not self.translator:
-            return text
+    def translate_titles(self, texts: List[str]) -> List[str]:
+        """
+        여러 제목을 한국어로 번역 (캐시에 없는 영어 제목만 1회 배치 요청, 실패 시 원문)
 
-        try:
-            # googletrans 라이브러리 사용
-            translated = self.translator.translate(text, src='en', dest='ko')
-            if translated and getattr(translated, 'text', None):
-                return translated.text
-            return text  # 번역 실패시 원문 반환
+        Args:
+            texts: 번역할 텍스트 목록
 
-        except Exception as e:
-            logger.debug(f"번역 오류: {e}")
-            return text
+        Returns:
+            입력 순서대로 번역된 텍스트
+        """
+        # 이미 한국어인 제목은 그대로
+        english = [text for text in texts if text and not self._is_korean(text)]
+        translated = dict(zip(english, self.translation.translate_many(english)))
+        return [translated.get(text, text) for text in texts]
 
     def _is_korean(self, text: str) -> bool:
         """한국어 포함 여부 확인"""
         korean_pattern = re.compile('[가-힣]')
         return bool(korean_pattern.search(text))
 
-    def _get_similarity(self, str1: str, str2: str) -> float:
-        """두 문자열의 유사도 계산 (Jaccard Similarity)"""
-        def clean(s: str) -> set:
-            s = re.sub(r'[^\w\s가-힣]', '', s).lower()
-            return set(s.split())
-
-        s1 = clean(str1)
-        s2 = clean(str2)
-
-        if not s1 or not s2:
-            return 0.0
-
-        intersection = s1 & s2
-        union = s1 | s2
-
-        return len(intersection) / len(union) if union else 0.0
-
     def _deduplicate_articles(self, articles: List[Dict], threshold: float = 0.3) -> List[Dict]:
-        """중복 기사 제거"""
-        unique_articles = []
-
-        for article in articles:
-            title = article.get('title', '')
-            is_duplicate = False
-
-            for existing in unique_articles:
-                existing_title = existing.get('title', '')
-                similarity = self._get_similarity(title, existing_title)
-
-                # 유사도 40% 이상이거나 서로 포함관계면 중복
-                if similarity > threshold or title in existing_title or existing_title in title:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                unique_articles.append(article)
-
-        return unique_articles
-
-    def _is_duplicate_global(self, title: str, seen_titles: List[str], threshold: float = 0.3) -> bool:
-        """전체 카테고리에서 중복인지 확인"""
-        for seen in seen_titles:
-            similarity = self._get_similarity(title, seen)
-            if similarity > threshold or title in seen or seen in title:
-                return True
-        return False
+        """중복 기사 제거 (유사도 임계값 초과 또는 서로 포함관계, MinHash/LSH 후보만 비교)"""
+        index = HeadlineIndex(threshold=threshold)
+        return [article for article in articles if index.check_and_add(article.get('title', ''))]
 
     def fetch_all_news(self, translate: bool = True) -> Dict[str, List[Dict]]:
         """
@@ -219,27 +266,35 @@ class NewsFetcher:
             카테고리별 뉴스 딕셔너리
         """
         all_news = {}
-        seen_titles = []  # 전체 카테고리에서 본 제목들
+        seen = HeadlineIndex()  # 이번 실행에서 전체 카테고리에 걸쳐 고른 제목들
+        feeds = self._fetch_feeds()
+
+        # 영어 제목은 카테고리 구분 없이 모아서 한 번에 번역
+        translations: Dict[str, str] = {}
+        if translate:
+            en_titles = [article.get('title', '')
+                         for config in self.NEWS_FEEDS.values() if config.get('url_en')
+                         for article in feeds.get(config['url_en'], [])]
+            translations = dict(zip(en_titles, self.translate_titles(en_titles)))
 
         for category, config in self.NEWS_FEEDS.items():
             # 카테고리별 limit 사용 (기본값 3)
             cat_limit = config.get('limit', 3)
             articles = []
 
-            # 한국어 뉴스 가져오기
+            # 한국어 뉴스
             if config.get('url_ko'):
-                ko_articles = self.fetch_google_news_rss(config['url_ko'], limit=cat_limit * 3)
-                articles.extend(ko_articles)
+                articles.extend(feeds.get(config['url_ko'], []))
 
-            # 영어 뉴스 가져오기 (있는 경우)
+            # 영어 뉴스 (있는 경우) - 번역으로 제목이 바뀌므로 캐시 원본은 복사해서 사용
             if config.get('url_en'):
-                en_articles = self.fetch_google_news_rss(config['url_en'], limit=cat_limit)
+                en_articles = [dict(article) for article in feeds.get(config['url_en'], [])]
 
                 # 번역
                 if translate:
                     for article in en_articles:
                         original_title = article.get('title', '')
-                        translated_title = self.translate_to_korean(original_title)
+                        translated_title = translations.get(original_title, original_title)
 
                         # 번역된 경우 원문도 보존
                         if translated_title != original_title:
@@ -255,18 +310,37 @@ class NewsFetcher:
             unique_articles = []
             for article in articles:
                 title = article.get('title', '')
-                if title and not self._is_duplicate_global(title, seen_titles):
-                    unique_articles.append(article)
-                    seen_titles.append(title)
+                tokens = tokenize(title)
+                if not title or seen.find_duplicate(title, tokens) is not None:
+                    continue
+                unique_articles.append(article)
+                seen.add(title, tokens=tokens)
 
                 if len(unique_articles) >= cat_limit:
                     break
 
-            all_news[category] = unique_articles
+            all_news[category] = get_watchlist_matcher().tag(unique_articles)
             logger.info(f"{config['title']}: {len(unique_articles)}개 기사 (중복 {len(articles) - len(unique_articles)}개 제거)")
 
         return all_news
 
+    def _fetch_feeds(self) -> Dict[str, List[Dict]]:
+        """
+        전체 피드 동시 조회 {URL: 기사 목록}
+        - 한국어 피드는 중복 제거 여유분으로 limit의 3배, 영어 피드는 limit만큼
+        """
+        requests_by_url: Dict[str, int] = {}
+        for config in self.NEWS_FEEDS.values():
+            cat_limit = config.get('limit', 3)
+            for key, limit in (('url_ko', cat_limit * 3), ('url_en', cat_limit)):
+                url = config.get(key)
+                if url:
+                    requests_by_url[url] = max(limit, requests_by_url.get(url, 0))
+
+        with ThreadPoolExecutor(max_workers=FEED_WORKERS) as pool:
+            results = pool.map(lambda item: self.fetch_google_news_rss(*item), requests_by_url.items())
+            return dict(zip(requests_by_url, results))
+
     def format_briefing_message(self, all_news: Dict[str, List[Dict]]) -> str:
         """
         브리핑 메시지 포맷
@@ -326,21 +400,9 @@ class NewsFetcher:
         return self.fetch_google_news_rss(url, limit)
 
     def is_relevant_news(self, article: Dict) -> bool:
-        """기사가 관심 주제와 관련있는지 확인"""
-        keywords = [
-            "kospi", "코스피", "한국주식", "korea stock",
-            "nasdaq", "dow jones", "s&p 500", "미국주식", "us stock",
-            "bitcoin", "비트코인", "ethereum", "이더리움", "crypto", "cryptocurrency"
-        ]
-
+        """기사가 관심 주제와 관련있는지 확인 (키워드 오토마톤으로 제목을 한 번만 훑음)"""
         title = (article.get("title") or "").lower()
-        content = title
-
-        for keyword in keywords:
-            if keyword in content:
-                return True
-
-        return False
+        return _RELEVANT_AUTOMATON.contains_any(title)
 
     def format_article(self, article: Dict) -> str:
         """기사를 텔레그램 메시지 형식으로 포맷"""
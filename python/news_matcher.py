@@ -0,0 +1,211 @@
+"""
+뉴스 헤드라인 종목 태깅 (Aho-Corasick 다중 패턴 매칭)
+
+- 레지스트리 전 종목의 티커 / 이름 / 별칭(한국어 포함)으로 오토마톤을 한 번만 구성
+- 헤드라인은 한 번 훑으면서 모든 패턴을 동시에 찾음 (패턴 수와 무관한 선형 시간)
+- 영문 패턴은 대소문자 구분 + 단어 경계 확인 (예: "AMD"는 "AMDOCS"에 매칭 안 됨)
+  한글 패턴은 앞쪽 경계만 확인 (뒤에는 조사가 붙음, 예: "애플이")
+  두 글자 한글 별칭은 뒤에 조사만 허용 (예: "인텔"은 "인텔리전스"에 매칭 안 됨)
+- 한 글자 티커 / 일반 단어와 겹치는 티커·이름은 매칭하지 않음 (예: "Dow" → "Dow Jones"와 혼동, 별칭 "Dow Inc"로만)
+"""
+import logging
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from symbol_registry import SymbolRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+# 티커로는 매칭하지 않는 일반 단어/약어
+TICKER_STOPWORDS = {
+    'ALL', 'LOW', 'COST', 'DIS', 'MET', 'DOW', 'CAT', 'NOW', 'SO', 'PM', 'HD', 'USB',
+    'NAIL', 'CURE', 'PILL', 'WANT', 'GUSH', 'FAS', 'RETL', 'DRN', 'ERX',
+}
+
+# 이름으로는 매칭하지 않는 일반 단어 (TICKER_STOPWORDS와 대소문자 무시하고 같은 이름도 제외)
+NAME_STOPWORDS = {'Target', 'Charter', 'Booking', 'Visa'}
+
+# 두 글자 한글 별칭 뒤에 허용하는 조사 (긴 것부터)
+HANGUL_PARTICLES = (
+    '으로', '에서', '까지', '보다', '처럼', '이나', '에게', '주가',
+    '이', '가', '은', '는', '을', '를', '의', '과', '와', '도', '에', '로', '만', '나', '주',
+)
+SHORT_HANGUL_LENGTH = 2
+
+# 티커 형식 (두 글자 이상 대문자, BRK-B 같은 구분자 허용)
+_TICKER_PATTERN = re.compile(r'^[A-Z][A-Z.\-]+$')
+
+# 이름 뒤 괄호 설명 제거 (예: "Realty Income (Monthly)" → "Realty Income")
+_PAREN_PATTERN = re.compile(r'\s*\([^)]*\)')
+
+
+class AhoCorasick:
+    """Aho-Corasick 오토마톤 (문자 단위 goto/fail/output)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(index)
+
+        # 실패 링크 (BFS), 실패 상태의 출력을 합쳐서 매칭 시 따라갈 필요 없게
+        # (루트의 자식은 실패 링크가 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(시작 위치, 패턴 번호) - 텍스트를 한 번만 훑음"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield i - len(self.patterns[index]) + 1, index
+
+    def contains_any(self, text: str) -> bool:
+        for _ in self.iter_matches(text):
+            return True
+        return False
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _is_short_hangul(pattern: str) -> bool:
+    return len(pattern) <= SHORT_HANGUL_LENGTH and all(_is_hangul(ch) for ch in pattern)
+
+
+def _left_ok(pattern: str, text: str, start: int) -> bool:
+    """앞쪽 경계 (영문은 영숫자, 한글은 한글이 바로 앞에 오면 안 됨)"""
+    if start == 0:
+        return True
+    prev = text[start - 1]
+    if _is_word_char(pattern[0]):
+        return not _is_word_char(prev)
+    if _is_hangul(pattern[0]):
+        return not _is_hangul(prev)
+    return True
+
+
+def _right_ok(pattern: str, text: str, end: int) -> bool:
+    """뒤쪽 경계 (영문은 영숫자 불가, 두 글자 한글 별칭은 한글이면 조사 + 경계만 허용)"""
+    if end >= len(text):
+        return True
+    nxt = text[end]
+    if _is_word_char(pattern[-1]):
+        return not _is_word_char(nxt)
+    if _is_short_hangul(pattern) and _is_hangul(nxt):
+        for particle in HANGUL_PARTICLES:
+            if text.startswith(particle, end):
+                after = end + len(particle)
+                return after >= len(text) or not _is_hangul(text[after])
+        return False
+    return True
+
+
+class WatchlistMatcher:
+    """헤드라인 → 종목 심볼 태그"""
+
+    def __init__(self, aliases: Dict[str, Iterable[str]]):
+        """
+        Args:
+            aliases: {심볼: 매칭할 텍스트 목록}
+        """
+        symbols_by_pattern: Dict[str, Set[str]] = {}
+        for symbol, texts in aliases.items():
+            for text in texts:
+                text = text.strip()
+                if len(text) >= 2:
+                    symbols_by_pattern.setdefault(text, set()).add(symbol)
+
+        self._automaton = AhoCorasick(symbols_by_pattern)
+        patterns = self._automaton.patterns
+        self._symbols: List[Tuple[str, ...]] = [tuple(sorted(symbols_by_pattern[p])) for p in patterns]
+
+    def __len__(self) -> int:
+        return len(self._automaton.patterns)
+
+    def match(self, text: str) -> List[str]:
+        """헤드라인에 나온 종목 심볼 (처음 나온 순서)"""
+        found: Dict[str, None] = {}
+        if not text:
+            return []
+        patterns = self._automaton.patterns
+        for start, index in self._automaton.iter_matches(text):
+            pattern = patterns[index]
+            if not _left_ok(pattern, text, start) or not _right_ok(pattern, text, start + len(pattern)):
+                continue
+            for symbol in self._symbols[index]:
+                found[symbol] = None
+        return list(found)
+
+    def tag(self, articles: List[Dict]) -> List[Dict]:
+        """기사마다 'symbols' 태그 추가 (제목 기준, 번역된 기사는 원문 제목도)"""
+        for article in articles:
+            text = article.get('title', '')
+            if article.get('original_title'):
+                text = f"{text}\n{article['original_title']}"
+            article['symbols'] = self.match(text)
+        return articles
+
+
+def registry_aliases(registry: SymbolRegistry = None, universes: Iterable[str] = None) -> Dict[str, List[str]]:
+    """레지스트리 종목별 매칭 텍스트 (티커 + 이름 + 짧은 이름 + 별칭)"""
+    registry = registry or get_registry()
+    if universes is None:
+        sids = range(len(registry))
+    else:
+        sids = registry.ids_in_mask(registry.universe_mask(*universes))
+
+    result = {}
+    for sid in sids:
+        info = registry.info(sid)
+        texts = [_PAREN_PATTERN.sub('', info.name), _PAREN_PATTERN.sub('', info.short_name)]
+        # 일반 단어와 겹치는 이름 제외 (별칭은 그대로 - 모호하지 않은 이름을 별칭으로 등록)
+        texts = [t for t in texts if t not in NAME_STOPWORDS and t.upper() not in TICKER_STOPWORDS]
+        texts.extend(info.aliases)
+        if _TICKER_PATTERN.match(info.symbol) and info.symbol not in TICKER_STOPWORDS:
+            texts.append(info.symbol)
+        result[info.symbol] = [t for t in dict.fromkeys(texts) if t]
+    return result
+
+
+_matcher: Optional[WatchlistMatcher] = None
+
+
+def get_watchlist_matcher() -> WatchlistMatcher:
+    """레지스트리 전 종목 매처 (최초 호출 시 구성)"""
+    global _matcher
+    if _matcher is None:
+        _matcher = WatchlistMatcher(registry_aliases())
+        logger.info(f"뉴스 종목 매처 구성: {len(_matcher)}개 패턴")
+    return _matcher
@@ -0,0 +1,179 @@
+"""
+종목별 적응형 조회 주기
+
+- 종목마다 다음 조회 시각을 두고, 틱마다 조회 시각이 된 종목만 조회
+- 기본 주기는 종목 분류 기준 (지수/암호화폐 30초, 개별주/ETF 10분)
+- 최근 실현 변동성(조회 간 수익률 제곱의 지수 이동 평균)으로 다음 알림 레벨까지
+  도달할 수 있는 시간을 추정해서 주기를 줄임 → 레벨 근처 종목은 최대 60초
+- 조회 실패 종목은 짧은 주기로 재시도
+"""
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from symbol_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+# 분류별 기본 조회 주기 (초)
+FAST_INTERVAL = 30    # 지수/암호화폐/환율
+NEAR_INTERVAL = 60    # 다음 알림 레벨 근처 / 조회 실패 재시도
+CALM_INTERVAL = 600   # 개별주/ETF
+CLASS_INTERVALS = {
+    'index': FAST_INTERVAL,
+    'crypto': FAST_INTERVAL,
+    'currency': FAST_INTERVAL,
+    'stock': CALM_INTERVAL,
+    'etf': CALM_INTERVAL,
+}
+
+# 분류별 알림 레벨 (첫 임계값 %, 레벨 간격 %) - scheduler._get_threshold_level과 동일 기준
+CLASS_LEVELS = {
+    'index': (2.0, 1.0),
+    'crypto': (2.0, 1.0),
+    'stock': (5.0, 5.0),
+    'etf': (5.0, 5.0),
+}
+
+# 다음 레벨까지 거리가 레벨 간격의 이 비율 안이면 "근처"
+NEAR_FRACTION = 0.2
+
+# 변동성 추정: 지수 이동 평균 가중치 / 주기 계산 시 표준편차 배수
+VOL_ALPHA = 0.3
+VOL_Z = 2.0
+
+# 조회 간격이 이보다 길면 (장 마감/재시작) 변동성 추정 초기화
+VOL_RESET_SECONDS = 3600
+
+
+def next_level_distance(change_percent: float, category: str) -> Optional[float]:
+    """다음 알림 레벨까지 남은 변동률 (%p), 레벨 없는 분류는 None"""
+    levels = CLASS_LEVELS.get(category)
+    if levels is None:
+        return None
+    first, step = levels
+    magnitude = abs(change_percent)
+    if magnitude < first:
+        return first - magnitude
+    return (math.floor(magnitude / step) + 1) * step - magnitude
+
+
+class PollPlanner:
+    """레지스트리 ID 배열 기반 종목별 조회 시각 관리"""
+
+    def __init__(self):
+        registry = get_registry()
+        size = len(registry)
+        self.categories: List[str] = [registry.info(sid).category for sid in range(size)]
+        self.next_due = np.zeros(size)                 # 다음 조회 epoch (0 = 즉시)
+        self.interval = np.zeros(size)                 # 마지막으로 정한 주기 (초)
+        self.last_price = np.full(size, np.nan)
+        self.last_ts = np.zeros(size)
+        self.var_rate = np.full(size, np.nan)          # 초당 수익률 분산 (%^2/s)
+        self.max_interval: Dict[int, float] = {}       # 평가기가 요구하는 종목별 최대 주기
+
+    def pin(self, symbols: Iterable[str], max_interval: float):
+        """해당 종목은 최소 max_interval초마다 조회 (예: TQ버스 TQQQ)"""
+        registry = get_registry()
+        for symbol in symbols:
+            sid = registry.id_of(symbol)
+            if sid is not None:
+                self.max_interval[sid] = min(max_interval, self.max_interval.get(sid, max_interval))
+
+    def due(self, symbols: Iterable[str], now: float = None, slack: float = 0.0) -> List[str]:
+        """
+        조회 시각이 된 종목 (레지스트리 미등록 종목은 항상 조회)
+
+        Args:
+            slack: 이 시간 안에 조회 시각이 되는 종목도 포함 (틱 간격의 절반이면 다음 틱까지 밀리지 않음)
+        """
+        now = time.time() if now is None else now
+        registry = get_registry()
+        result = []
+        for symbol in symbols:
+            sid = registry.id_of(symbol)
+            if sid is None or self.next_due[sid] <= now + slack:
+                result.append(symbol)
+        return result
+
+    def observe(self, symbol: str, price_data: Optional[Tuple[float, float]], now: float = None) -> float:
+        """
+        조회 결과 반영 후 다음 조회 시각 결정
+
+        Returns:
+            다음 조회까지 주기 (초)
+        """
+        now = time.time() if now is None else now
+        sid = get_registry().id_of(symbol)
+        if sid is None:
+            return 0.0
+
+        if price_data is None:
+            interval = NEAR_INTERVAL
+        else:
+            current, previous = price_data
+            self._update_volatility(sid, current, now)
+            change = (current - previous) / previous * 100 if previous else 0.0
+            interval = self._plan_interval(sid, change)
+
+        interval = min(interval, self.max_interval.get(sid, interval))
+        self.interval[sid] = interval
+        self.next_due[sid] = now + interval
+        return interval
+
+    def _update_volatility(self, sid: int, price: float, now: float):
+        """조회 간 로그 수익률로 초당 분산 갱신"""
+        last_price, last_ts = self.last_price[sid], self.last_ts[sid]
+        self.last_price[sid] = price
+        self.last_ts[sid] = now
+
+        dt = now - last_ts
+        if np.isnan(last_price) or last_price <= 0 or price <= 0 or dt <= 0 or dt > VOL_RESET_SECONDS:
+            self.var_rate[sid] = np.nan
+            return
+
+        ret = math.log(price / last_price) * 100
+        sample = ret * ret / dt
+        if np.isnan(self.var_rate[sid]):
+            self.var_rate[sid] = sample
+        else:
+            self.var_rate[sid] = VOL_ALPHA * sample + (1 - VOL_ALPHA) * self.var_rate[sid]
+
+    def _plan_interval(self, sid: int, change_percent: float) -> float:
+        """
+        다음 조회 주기
+        - 분류 기본 주기에서 시작
+        - 다음 레벨 근처면 NEAR_INTERVAL 이하
+        - 변동성이 알려져 있으면 VOL_Z 표준편차 이동이 다음 레벨에 닿는 시간 이하
+        """
+        category = self.categories[sid]
+        base = CLASS_INTERVALS.get(category, CALM_INTERVAL)
+        distance = next_level_distance(change_percent, category)
+        if distance is None:
+            return base
+
+        interval = base
+        if distance <= CLASS_LEVELS[category][1] * NEAR_FRACTION:
+            interval = min(interval, NEAR_INTERVAL)
+
+        var_rate = self.var_rate[sid]
+        if not np.isnan(var_rate) and var_rate > 0:
+            # VOL_Z * sqrt(var_rate * t) = distance → t
+            reach = (distance / VOL_Z) ** 2 / var_rate
+            interval = min(interval, max(FAST_INTERVAL, reach))
+
+        return float(interval)
+
+    def summary(self, symbols: Iterable[str]) -> Dict[int, int]:
+        """종목 주기 분포 {주기(초): 종목 수} (로그용)"""
+        registry = get_registry()
+        counts: Dict[int, int] = {}
+        for symbol in symbols:
+            sid = registry.id_of(symbol)
+            if sid is not None and self.interval[sid]:
+                key = int(self.interval[sid])
+                counts[key] = counts.get(key, 0) + 1
+        return counts
@@ -0,0 +1,216 @@
+"""
+시세 데이터 소스 집계 (헤지 요청 + 소스별 성능 기반 자동 순서 조정)
+
+- 데이터 소스(QuoteProvider): 심볼 → (현재가, 전일종가) 또는 None 을 돌려주는 함수
+- 심볼마다 후보 소스 목록 (routes) → 성공률/응답 시간으로 순서 재정렬
+- 1순위 소스가 평소 응답 시간(p95) 안에 답하지 않으면 다음 소스에 동시 요청 (hedged request)
+  → 먼저 도착한 유효 응답 사용, 실패(None/예외)하면 바로 다음 소스로
+- 소스별 성공률(지수 이동 평균)/최근 응답 시간 p95 추적 → 장애 소스는 자동으로 뒤로
+- 테스트용 로컬 대체 소스: local_provider(이름, {심볼: (현재가, 전일종가)}, 지연)
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PriceData = Tuple[float, float]
+
+# 헤지 대기 시간 (초): 표본이 적을 때 기본값 / 하한 / 상한
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_DELAY = 0.05
+HEDGE_MAX_DELAY = 5.0
+
+# p95 계산에 쓰는 최근 응답 시간 수 / p95를 믿기 위한 최소 표본 수
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 10
+
+# 성공률 지수 이동 평균 가중치 / 이 성공률 미만이면 장애 소스로 보고 뒤로 보냄
+SUCCESS_ALPHA = 0.1
+UNHEALTHY_SUCCESS_RATE = 0.5
+
+# 후보 순위당 응답 시간 가중치 (2순위 소스는 1순위보다 2배 빨라야 앞섬)
+ROUTE_PENALTY = 1.0
+
+# 헤지 요청 스레드 수
+AGGREGATOR_WORKERS = 16
+
+
+class QuoteProvider:
+    """시세 데이터 소스"""
+
+    def __init__(self, name: str, fetch: Callable[[str], Optional[PriceData]]):
+        self.name = name
+        self.fetch = fetch
+
+
+def local_provider(name: str, quotes, delay: float = 0.0) -> QuoteProvider:
+    """
+    테스트용 로컬 대체 소스
+
+    Args:
+        quotes: {심볼: (현재가, 전일종가)} 또는 심볼 → 가격 함수
+        delay: 응답 지연 (초)
+    """
+    lookup = quotes if callable(quotes) else quotes.get
+
+    def fetch(symbol: str) -> Optional[PriceData]:
+        if delay:
+            time.sleep(delay)
+        return lookup(symbol)
+
+    return QuoteProvider(name, fetch)
+
+
+class ProviderStats:
+    """소스별 성공률/응답 시간 (스레드 안전)"""
+
+    def __init__(self):
+        self.success_rate = 1.0
+        self.calls = 0
+        self.failures = 0
+        self.wins = 0   # 최종 응답으로 채택된 횟수
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, ok: bool, latency: float):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.failures += 1
+            self.success_rate = SUCCESS_ALPHA * (1.0 if ok else 0.0) + (1 - SUCCESS_ALPHA) * self.success_rate
+            self._latencies.append(latency)
+
+    def record_win(self):
+        with self._lock:
+            self.wins += 1
+
+    def p95(self) -> Optional[float]:
+        """최근 응답 시간 p95 (표본 부족 시 None)"""
+        with self._lock:
+            if len(self._latencies) < MIN_SAMPLES:
+                return None
+            return float(np.percentile(self._latencies, 95))
+
+    def hedge_delay(self) -> float:
+        """이 소스에 요청 후 다음 소스에 헤지 요청을 보낼 때까지 대기 시간"""
+        p95 = self.p95()
+        if p95 is None:
+            return HEDGE_DEFAULT_DELAY
+        return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95))
+
+    @property
+    def healthy(self) -> bool:
+        return self.success_rate >= UNHEALTHY_SUCCESS_RATE
+
+    def summary(self) -> Dict:
+        p95 = self.p95()
+        return {
+            'success_rate': round(self.success_rate, 3),
+            'p95_ms': round(p95 * 1000) if p95 is not None else None,
+            'calls': self.calls,
+            'failures': self.failures,
+            'wins': self.wins,
+        }
+
+
+def _valid(result) -> bool:
+    """(현재가, 전일종가) 둘 다 양수인지"""
+    try:
+        current, previous = result
+        return current > 0 and previous > 0
+    except (TypeError, ValueError):
+        return False
+
+
+class QuoteAggregator:
+    """여러 데이터 소스 중 가장 빠른 유효 응답 선택"""
+
+    def __init__(self, providers: List[QuoteProvider],
+                 routes: Callable[[str], List[str]] = None,
+                 workers: int = AGGREGATOR_WORKERS):
+        """
+        Args:
+            providers: 데이터 소스 목록
+            routes: 심볼 → 후보 소스 이름 목록 (선호 순), 없으면 전체 소스를 등록 순서대로
+        """
+        self.providers: Dict[str, QuoteProvider] = {p.name: p for p in providers}
+        self.routes = routes or (lambda symbol: list(self.providers))
+        self._stats: Dict[str, ProviderStats] = {p.name: ProviderStats() for p in providers}
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='quote')
+
+    def rank(self, symbol: str) -> List[QuoteProvider]:
+        """후보 소스를 (장애 여부, p95 x 선호 순위 가중치) 순으로 정렬"""
+        names = [name for name in self.routes(symbol) if name in self.providers]
+
+        def score(item):
+            position, name = item
+            stats = self._stats[name]
+            p95 = stats.p95()
+            latency = p95 if p95 is not None else HEDGE_DEFAULT_DELAY
+            return (not stats.healthy, latency * (1 + ROUTE_PENALTY * position), position)
+
+        return [self.providers[name] for _, name in sorted(enumerate(names), key=score)]
+
+    def _call(self, provider: QuoteProvider, symbol: str) -> Optional[PriceData]:
+        """소스 1개 호출 + 통계 기록 (예외는 None)"""
+        start = time.monotonic()
+        try:
+            result = provider.fetch(symbol)
+        except Exception as e:
+            logger.debug(f"{symbol}: {provider.name} 조회 오류 - {e}")
+            result = None
+        ok = _valid(result)
+        self._stats[provider.name].record(ok, time.monotonic() - start)
+        return result if ok else None
+
+    def fetch(self, symbol: str) -> Optional[PriceData]:
+        """
+        시세 조회
+        - 1순위 소스 요청 → p95 안에 응답이 없으면 다음 소스에 헤지 요청 (동시 진행 최대 2개)
+        - 실패 응답이면 즉시 다음 소스로
+        - 먼저 도착한 유효 응답 반환 (늦게 도착한 응답은 통계에만 반영)
+
+        Returns:
+            (현재가, 전일종가) 또는 None (모든 소스 실패)
+        """
+        order = self.rank(symbol)
+        pending = {}
+        next_index = 0
+        last_started: Optional[QuoteProvider] = None
+
+        def start_next():
+            nonlocal next_index, last_started
+            provider = order[next_index]
+            next_index += 1
+            pending[self._pool.submit(self._call, provider, symbol)] = provider
+            last_started = provider
+
+        while pending or next_index < len(order):
+            if not pending:
+                start_next()
+            can_hedge = next_index < len(order) and len(pending) < 2
+            timeout = self._stats[last_started.name].hedge_delay() if can_hedge else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                logger.debug(f"{symbol}: {last_started.name} 응답 지연 - {order[next_index].name} 헤지 요청")
+                start_next()
+                continue
+            for future in done:
+                provider = pending.pop(future)
+                result = future.result()
+                if result is not None:
+                    self._stats[provider.name].record_win()
+                    return result
+
+        logger.warning(f"{symbol}: 모든 데이터 소스 조회 실패 ({', '.join(p.name for p in order)})")
+        return None
+
+    def stats(self) -> Dict[str, Dict]:
+        """소스별 상태 (모니터링용)"""
+        return {name: stats.summary() for name, stats in self._stats.items()}
@@ -0,0 +1,144 @@
+"""
+렌더링 결과 캐시 (입력 데이터 해시 → PNG 바이트)
+
+- 키: 렌더 함수 이름 + 렌더 버전 + 입력(시계열, 렌더 설정)의 sha256
+  → 장 마감 후처럼 종가가 그대로면 수동 실행 / 재시도 / 여러 채널 발송에서 다시 그리지 않음
+- 메모리 LRU (최근 MEMORY_ENTRIES개) + 디스크 (data/render_cache/, 최대 DISK_ENTRIES개, 오래된 파일부터 삭제)
+- 그리는 방식을 바꾸면 RENDER_VERSION을 올려서 이전 결과를 무효화
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'render_cache')
+
+# 렌더 함수 출력이 바뀌면 올림
+RENDER_VERSION = 3
+
+# 메모리 / 디스크 최대 항목 수
+MEMORY_ENTRIES = 32
+DISK_ENTRIES = 200
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'tolist'):  # numpy 배열 / 스칼라
+        return value.tolist()
+    raise TypeError(f"해시할 수 없는 입력: {type(value).__name__}")
+
+
+def cache_key(name: str, *parts) -> str:
+    """렌더 함수 이름 + 입력 → 캐시 키"""
+    payload = json.dumps([name, RENDER_VERSION, parts], default=_json_default, sort_keys=True,
+                         separators=(',', ':'), ensure_ascii=False)
+    return f"{name}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+
+class RenderCache:
+    """메모리 LRU + 디스크 렌더링 결과 캐시"""
+
+    def __init__(self, directory: Optional[str] = CACHE_DIR, memory_entries: int = MEMORY_ENTRIES,
+                 disk_entries: int = DISK_ENTRIES):
+        """
+        Args:
+            directory: 디스크 캐시 폴더 (None이면 메모리 전용)
+        """
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def _remember(self, key: str, png: bytes):
+        with self._lock:
+            self._memory[key] = png
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            png = self._memory.get(key)
+            if png is not None:
+                self._memory.move_to_end(key)
+        if png is None and self.directory:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    png = f.read()
+                self._remember(key, png)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"렌더 캐시 읽기 오류: {e}")
+
+        if png is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return png
+
+    def put(self, key: str, png: bytes):
+        self._remember(key, png)
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._path(key) + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, self._path(key))
+            self._prune_disk()
+        except Exception as e:
+            logger.error(f"렌더 캐시 저장 오류: {e}")
+
+    def _prune_disk(self):
+        """디스크 항목이 최대 개수를 넘으면 오래된 파일부터 삭제"""
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.png')]
+        if len(paths) <= self.disk_entries:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """프로세스 공용 렌더 캐시"""
+    global _cache
+    if _cache is None:
+        _cache = RenderCache()
+    return _cache
+
+
+def render_cached(func: Callable[..., bytes], *args, key_args: Sequence = None) -> bytes:
+    """
+    렌더 함수를 현재 프로세스에서 실행 (캐시에 같은 입력의 결과가 있으면 그대로 반환)
+
+    Args:
+        key_args: 캐시 키에 쓸 입력 (생략 시 args 전체 - 그림에 보이지 않는 입력만 뺄 것)
+    """
+    cache = get_render_cache()
+    key = cache_key(func.__name__, *(args if key_args is None else key_args))
+    png = cache.get(key)
+    if png is None:
+        png = func(*args)
+        cache.put(key, png)
+    return png
@@ -0,0 +1,228 @@
+"""
+차트 이미지 렌더링 서비스 (프로세스 풀)
+
+- pyplot 전역 상태 대신 Figure + Agg 캔버스로 그림 (스레드 안전, 그림마다 독립)
+- 렌더링은 CPU 작업이라 프로세스 풀에서 실행 → 이벤트 루프는 막히지 않고 여러 장을 병렬로 그림
+- 워커는 시작할 때 한 번만 준비 (Agg 백엔드 + rcParams + 폰트 캐시)
+- 렌더 함수는 모듈 최상위 함수 (피클 가능한 입력 → PNG 바이트)
+  동기 호출자는 같은 함수를 현재 프로세스에서 바로 실행
+- 워커 프로세스는 spawn으로 생성 (스케줄러/aiohttp 스레드가 있는 프로세스를 fork하지 않음)
+- 결과는 입력 해시로 캐시 (render_cache) - 같은 입력이면 다시 그리지 않고 캐시된 PNG 반환
+- 시계열은 그리기 전에 LTTB로 가로 픽셀 수만큼만 남김 (downsample) - 긴 히스토리도 렌더링 비용 일정
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from config import RENDER_WORKERS
+from render_cache import cache_key, get_render_cache
+from downsample import downsample
+
+logger = logging.getLogger(__name__)
+
+# 차트 크기 (인치) / 해상도 - 다운샘플링 점 수 = 가로 픽셀 수
+MARKET_CHART_SIZE = (8, 3)
+MARKET_CHART_DPI = 120
+SINGLE_CHART_SIZE = (8, 4)
+SINGLE_CHART_DPI = 100
+
+# 이보다 긴 시계열은 2개월 간격 눈금 대신 자동 간격 (눈금 라벨이 수십 개가 되지 않게)
+LONG_SPAN_DAYS = 400
+
+def apply_style():
+    """공통 rcParams (한글 폰트 설정)"""
+    matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+    matplotlib.rcParams['axes.unicode_minus'] = False
+
+
+apply_style()
+
+
+def _init_worker():
+    """워커 준비 - 스타일 적용 + 폰트 로드 (첫 렌더가 느리지 않게)"""
+    apply_style()
+    from matplotlib import font_manager
+    font_manager.findfont(matplotlib.rcParams['font.family'][0])
+    fig = Figure(figsize=(1, 1))
+    fig.add_subplot().set_title('warm-up', fontweight='bold')
+    FigureCanvasAgg(fig).draw()
+
+
+def _ping(delay: float) -> int:
+    # 잠깐 붙잡아서 작업이 한 워커에 몰리지 않게 (모든 워커의 준비가 끝나야 반환)
+    time.sleep(delay)
+    return os.getpid()
+
+
+def _to_png(fig: Figure, dpi: int, **kwargs) -> bytes:
+    buffer = io.BytesIO()
+    FigureCanvasAgg(fig)
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', **kwargs)
+    return buffer.getvalue()
+
+
+def render_market_chart(chart_data: List[Dict]) -> bytes:
+    """
+    시장 현황 차트 (최대 4개 지수 2x2 스파크라인)
+
+    Args:
+        chart_data: MarketChartGenerator.get_chart_data 결과 목록
+    """
+    fig = Figure(figsize=MARKET_CHART_SIZE)
+    axes = fig.subplots(2, 2).flatten()
+    max_points = int(MARKET_CHART_SIZE[0] / 2 * MARKET_CHART_DPI)  # 2열 → 칸당 절반
+
+    for ax, data in zip(axes, chart_data[:4]):
+        positions, closes = downsample(range(len(data['closes'])), data['closes'], max_points)
+        color = data['color']
+        change = data['change_1y']
+
+        # 차트 그리기
+        ax.plot(positions, closes, color=color, linewidth=1.5)
+        ax.fill_between(positions, closes, alpha=0.2, color=color)
+
+        # 축 스타일 (xy축 표시)
+        ax.tick_params(axis='both', labelsize=6)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+
+        # 제목 (이름, 가격, 수익률)
+        change_sign = "+" if change >= 0 else ""
+        title = f"{data['name']}\n${data['current']:,.0f} ({change_sign}{change:.1f}%)"
+        ax.set_title(title, fontsize=9, fontweight='bold', color=color)
+
+    # 빈 축 숨기기
+    for ax in axes[len(chart_data):]:
+        ax.set_visible(False)
+
+    fig.tight_layout()
+    return _to_png(fig, dpi=MARKET_CHART_DPI, facecolor='white', edgecolor='none')
+
+
+def render_single_chart(data: Dict) -> bytes:
+    """
+    단일 종목 차트
+
+    Args:
+        data: MarketChartGenerator.get_chart_data 결과
+    """
+    fig = Figure(figsize=SINGLE_CHART_SIZE)
+    ax = fig.add_subplot()
+
+    dates, closes = downsample(data['dates'], data['closes'], SINGLE_CHART_SIZE[0] * SINGLE_CHART_DPI,
+                               x_values=mdates.date2num(data['dates']))
+    color = data['color']
+    current = data['current']
+    change = data['change_1y']
+
+    # 차트 그리기
+    ax.plot(dates, closes, color=color, linewidth=2)
+    ax.fill_between(dates, closes, alpha=0.15, color=color)
+
+    # 현재가 표시
+    ax.axhline(y=current, color=color, linestyle='--', alpha=0.5)
+
+    # 제목
+    change_sign = "+" if change >= 0 else ""
+    ax.set_title(f"{data['name']} - ${current:,.2f} ({change_sign}{change:.1f}% YTD)",
+                 fontsize=14, fontweight='bold')
+
+    # 축 설정 (1년 안팎은 2개월 간격, 더 길거나 짧은 시계열은 눈금 수를 제한한 자동 간격)
+    if 60 <= (dates[-1] - dates[0]).days <= LONG_SPAN_DAYS:
+        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    else:
+        locator = mdates.AutoDateLocator(minticks=3, maxticks=9)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    ax.tick_params(axis='x', rotation=45)
+    ax.grid(True, alpha=0.3)
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    fig.tight_layout()
+    return _to_png(fig, dpi=SINGLE_CHART_DPI, facecolor='white')
+
+
+class RenderService:
+    """렌더 함수를 워커 프로세스에서 실행"""
+
+    def __init__(self, workers: int = RENDER_WORKERS):
+        self.workers = max(1, workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+            logger.info(f"렌더링 워커 풀 시작: {self.workers}개")
+        return self._pool
+
+    async def warm_up(self) -> List[int]:
+        """워커를 모두 띄우고 준비시킴 (첫 렌더 지연 제거) - 워커 pid 목록"""
+        loop = asyncio.get_event_loop()
+        pool = self._get_pool()
+        pids = await asyncio.gather(*[loop.run_in_executor(pool, _ping, 0.2) for _ in range(self.workers)])
+        return sorted(set(pids))
+
+    async def render(self, func: Callable[..., bytes], *args, key_args: Sequence = None) -> Optional[bytes]:
+        """
+        렌더 함수를 워커에서 실행하고 PNG 바이트 반환 (캐시에 있으면 워커 없이 바로 반환)
+
+        Args:
+            func: 모듈 최상위 렌더 함수 (피클 가능해야 함)
+            args: 렌더 함수 입력 (피클 가능해야 함)
+            key_args: 캐시 키에 쓸 입력 (render_cache.render_cached 참고)
+        """
+        # 캐시 디스크 읽기/쓰기(정리 포함)도 이벤트 루프 밖에서
+        loop = asyncio.get_event_loop()
+        cache = get_render_cache()
+        key = cache_key(func.__name__, *(args if key_args is None else key_args))
+        png = await loop.run_in_executor(None, cache.get, key)
+        if png is not None:
+            return png
+
+        try:
+            png = await loop.run_in_executor(self._get_pool(), func, *args)
+            await loop.run_in_executor(None, cache.put, key, png)
+            return png
+        except BrokenProcessPool as e:
+            # 워커가 죽은 풀은 다음 호출에서 다시 만듦
+            logger.error(f"렌더링 워커 풀 오류 ({func.__name__}): {e}")
+            self.shutdown()
+            return None
+        except Exception as e:
+            logger.error(f"렌더링 오류 ({func.__name__}): {e}")
+            return None
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+_service: Optional[RenderService] = None
+
+
+def get_render_service() -> RenderService:
+    """프로세스 공용 렌더링 서비스"""
+    global _service
+    if _service is None:
+        _service = RenderService()
+    return _service
@@ -3,26 +3,40 @@
 
 기능:
 - 주가 변동 알림 (5분마다, 최소 10분 간격)
-- 오전 브리핑 (미국 장 마감 후 10분) - Fear & Greed + 미국 증시 + 3X ETF
+- 암호화폐 변동 알림 (Binance 웹소켓 업데이트마다, 끊기면 시세 틱 REST 조회로 폴백)
+- 오전 브리핑 (미국 장 종가 확정 직후) - Fear & Greed + 미국 증시 + 3X ETF
 - 오후 브리핑 (15:40 KST) - 한국 증시
 """
 import logging
 import asyncio
-import json
-import os
-from datetime import datetime
+import functools
+from datetime import datetime, timedelta
+import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from config import TELEGRAM_BOT_TOKEN, CHANNEL_ID, DIVIDEND_CHANNEL_ID, STOCK_CHECK_INTERVAL, UPSTASH_REDIS_URL, UPSTASH_REDIS_TOKEN, get_us_market_close_time_kst
+from config import TELEGRAM_BOT_TOKEN, CHANNEL_ID, DIVIDEND_CHANNEL_ID, STOCK_CHECK_INTERVAL, MARKET_TICK_INTERVAL, UPSTASH_REDIS_URL, UPSTASH_REDIS_TOKEN
+from config import CRYPTO_STREAM_ENABLED, CRYPTO_STREAM_SYMBOLS, BINANCE_WS_URL
 from telegram_bot import NewsChannelBot
-from stock_monitor import StockMonitor
-from market_holidays import is_us_market_holiday, is_us_extended_market_hours
+from stock_monitor import PriceChange, StockMonitor, WatchGroup
+from market_holidays import is_us_extended_market_hours
+from market_sessions import market_today
 from fear_greed_tracker import FearGreedTracker, NaverFinanceTracker
 from etf_tracker import ETFTracker
 from etf_table_generator import ETFTableGenerator
+from render_service import get_render_service
 from tqbus_tracker import TqBusTracker
-from dividend_monitor import DividendMonitor
+from dividend_monitor import DividendAlertMonitor, DividendMonitor
 from weekend_nasdaq_tracker import WeekendNasdaqTracker
 from earnings_monitor import EarningsMonitor
+from market_tick import MarketTickPipeline
+from poll_planner import PollPlanner
+from close_detector import CloseDetector
+from job_graph import JobGraph
+from close_snapshot import build_close_snapshot, get_close_snapshot, set_close_snapshot
+from coordination import Coordinator
+from alert_buffer import AlertBuffer
+from level_state import LevelState
+from crypto_stream import CryptoStream
+from symbol_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +50,7 @@ if UPSTASH_REDIS_URL and UPSTASH_REDIS_TOKEN:
     except Exception as e:
         logger.warning(f"Upstash Redis 연결 실패 (인메모리 사용): {e}")
 
-# 알림 기록 파일 경로 (Redis 미사용 시 폴백)
-ALERT_HISTORY_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'alert_history.json')
-
-# 알림 쿨다운 시간 (초) - 24시간
+# 알림 선점 키 TTL (초) - 키에 세션이 들어가므로 지난 세션 키 정리용
 ALERT_COOLDOWN_SECONDS = 24 * 60 * 60
 
 # 알림 최소 간격 (초) - 10분
@@ -48,6 +59,12 @@ MIN_ALERT_INTERVAL_SECONDS = 10 * 60
 # 브리핑 쿨다운 시간 (초) - 12시간 (하루 1회 보장)
 BRIEFING_COOLDOWN_SECONDS = 12 * 60 * 60
 
+# 실적 결과 조회 지연 (초) - 실적 발표는 장 마감 직후 나옴
+EARNINGS_RESULTS_DELAY_SECONDS = 10 * 60
+
+# 레벨 상태 스냅샷 저장 간격 (초)
+LEVEL_STATE_SNAPSHOT_SECONDS = 60
+
 # 마지막 알림 발송 시간 Redis 키
 LAST_ALERT_TIME_KEY = "last_alert_time"
 
@@ -67,6 +84,7 @@ class NewsScheduler:
         self.dividend_bot = NewsChannelBot(TELEGRAM_BOT_TOKEN, DIVIDEND_CHANNEL_ID)
         self.dividend_monitor = DividendMonitor()
         self.stock_monitor = StockMonitor()
+        self.coordinator = Coordinator(redis_client, on_elected=self._load_level_states)  # 리더 임대 + 발송 선점
         self.fear_greed_tracker = FearGreedTracker()
         self.naver_tracker = NaverFinanceTracker()
         self.etf_tracker = ETFTracker()
@@ -75,114 +93,68 @@ class NewsScheduler:
         self.weekend_nasdaq_tracker = WeekendNasdaqTracker()
         self.dividend_monitor = DividendMonitor()
         self.earnings_monitor = EarningsMonitor()
-        # self.dividend_alert_monitor = DividendAlertMonitor()  # TODO: 클래스 구현 필요
-        self.stock_alerted_today: dict = self._load_alert_history()
+        self.dividend_alert_monitor = DividendAlertMonitor()
+        # 세션별 알림 레벨 상태 (주가 / 배당주 채널)
+        self.level_state = LevelState('stock', redis_client)
+        self.dividend_level_state = LevelState('dividend', redis_client)
+        self._load_level_states()
         self.last_alert_time: datetime = None  # 마지막 알림 발송 시간
+        self.alert_buffer = AlertBuffer()  # 최소 간격 안에 생긴 알림 대기
+        self._tick_stock_groups = []  # 이번 틱의 주가 감시 그룹
+        self.crypto_stream = self._build_crypto_stream()
+        self._crypto_stream_task = None
+        self.market_tick = self._build_market_tick()
+        self.close_jobs = self._build_close_jobs()
+        self.close_detector = self._build_close_detector()
+
+    def _get_alert_key(self, state: LevelState, symbol: str, level: int, up: bool) -> str:
+        """Redis 키 생성: alert:{상태 이름}:{세션}:{symbol}:{+/-level} (세션이 바뀌면 새 키)"""
+        return f"alert:{state.name}:{state.session_of(symbol)}:{symbol}:{'+' if up else '-'}{level}"
+
+    def _claim_alert(self, state: LevelState, symbol: str, level: int, up: bool) -> bool:
+        """
+        해당 종목/레벨/방향 알림 발송 선점
+        - 레벨 상태(메모리): 이번 세션 같은 방향으로 이 레벨 이상 알림했으면 네트워크 없이 스킵
+        - 새 레벨이면 Redis SET NX EX로 선점 (여러 인스턴스 동시 실행 중복 차단, 키에 세션 포함)
 
-    def _get_alert_key(self, symbol: str, level: int) -> str:
-        """Redis 키 생성: alert:{symbol}:{level}"""
-        return f"alert:{symbol}:{level}"
-
-    def _check_alert_exists(self, symbol: str, level: int) -> bool:
-        """해당 종목/레벨의 알림이 24시간 내에 발송되었는지 확인"""
-        key = self._get_alert_key(symbol, level)
-
-        # Redis 사용 시
-        if redis_client:
-            try:
-                exists = redis_client.exists(key)
-                if exists:
-                    logger.info(f"Redis: {symbol} 레벨 {level} 알림 이미 존재 (24시간 내)")
-                return bool(exists)
-            except Exception as e:
-                logger.error(f"Redis 조회 오류: {e}")
-
-        # 인메모리 폴백
-        record = self.stock_alerted_today.get(symbol, {})
-        if isinstance(record, dict) and record.get("level", 0) >= level:
-            return True
-        return False
-
-    def _save_alert_record(self, symbol: str, level: int):
-        """알림 기록 저장 (24시간 TTL)"""
-        key = self._get_alert_key(symbol, level)
-
-        # Redis 사용 시 - 24시간 TTL로 저장
-        if redis_client:
-            try:
-                redis_client.setex(key, ALERT_COOLDOWN_SECONDS, "1")
-                logger.info(f"Redis: {symbol} 레벨 {level} 알림 기록 저장 (24시간 TTL)")
-            except Exception as e:
-                logger.error(f"Redis 저장 오류: {e}")
-
-        # 인메모리에도 저장
-        today = datetime.now().strftime("%Y-%m-%d")
-        self.stock_alerted_today[symbol] = {"date": today, "level": level}
-
-        # 즉시 파일에 저장 (Redis 미사용 시)
-        if not redis_client:
-            self._save_alert_history()
-
-    def _load_alert_history(self) -> dict:
-        """알림 기록 로드 (인메모리 초기화용)"""
-        # Redis 사용 시 인메모리는 비워둠 (Redis가 source of truth)
-        if redis_client:
-            logger.info("Redis 사용 중 - 인메모리 알림 기록 비움")
-            return {}
-
-        # 파일 폴백
-        try:
-            os.makedirs(os.path.dirname(ALERT_HISTORY_FILE), exist_ok=True)
-            if os.path.exists(ALERT_HISTORY_FILE):
-                with open(ALERT_HISTORY_FILE, 'r') as f:
-                    data = json.load(f)
-                    today = datetime.now().strftime("%Y-%m-%d")
-                    return {
-                        k: v for k, v in data.items()
-                        if isinstance(v, dict) and v.get("date") == today
-                    }
-            return {}
-        except Exception as e:
-            logger.error(f"알림 기록 로드 실패: {e}")
-            return {}
-
-    def _save_alert_history(self):
-        """알림 기록을 파일에 저장 (Redis 미사용 시 폴백)"""
-        if redis_client:
-            return  # Redis 사용 시 파일 저장 불필요
-
-        try:
-            os.makedirs(os.path.dirname(ALERT_HISTORY_FILE), exist_ok=True)
-            with open(ALERT_HISTORY_FILE, 'w') as f:
-                json.dump(self.stock_alerted_today, f)
-        except Exception as e:
-            logger.error(f"알림 기록 저장 실패: {e}")
-
-    def _check_briefing_sent(self, briefing_type: str) -> bool:
-        """브리핑이 이미 발송되었는지 확인 (Redis 기반)"""
-        key = f"briefing:{briefing_type}:{datetime.now().strftime('%Y-%m-%d')}"
-
-        if redis_client:
-            try:
-                exists = redis_client.exists(key)
-                if exists:
-                    logger.info(f"Redis: {briefing_type} 브리핑 이미 발송됨 (오늘)")
-                return bool(exists)
-            except Exception as e:
-                logger.error(f"Redis 조회 오류: {e}")
-
-        return False
-
-    def _mark_briefing_sent(self, briefing_type: str):
-        """브리핑 발송 기록 저장 (Redis 기반, 12시간 TTL)"""
-        key = f"briefing:{briefing_type}:{datetime.now().strftime('%Y-%m-%d')}"
+        Returns:
+            True면 이 호출자가 발송
+        """
+        if not state.should_alert(symbol, level, up):
+            return False
+
+        claimed = self.coordinator.claim(self._get_alert_key(state, symbol, level, up), ALERT_COOLDOWN_SECONDS)
+        # 선점 실패(다른 인스턴스가 이번 세션에 이미 발송)도 기록해서 다시 묻지 않음
+        state.record(symbol, level, up)
+        if not claimed:
+            logger.info(f"Redis: {symbol} 레벨 {level} 알림 이미 존재 (이번 세션)")
+        return claimed
+
+    def _load_level_states(self):
+        """레벨 상태 스냅샷 로드 (시작 시 / 리더 인계 시)"""
+        self.level_state.load()
+        self.dividend_level_state.load()
+
+    def save_level_states(self, force: bool = False):
+        """레벨 상태 스냅샷 저장 (변경분이 있을 때만, 주기 작업)"""
+        self.level_state.save(force)
+        self.dividend_level_state.save(force)
+
+    def _briefing_key(self, briefing_type: str) -> str:
+        """Redis 키 생성: briefing:{type}:{날짜}"""
+        return f"briefing:{briefing_type}:{datetime.now().strftime('%Y-%m-%d')}"
+
+    def _claim_briefing(self, briefing_type: str) -> bool:
+        """
+        브리핑 발송 선점 (SET NX EX, 12시간 TTL)
 
-        if redis_client:
-            try:
-                redis_client.setex(key, BRIEFING_COOLDOWN_SECONDS, "1")
-                logger.info(f"Redis: {briefing_type} 브리핑 발송 기록 저장")
-            except Exception as e:
-                logger.error(f"Redis 저장 오류: {e}")
+        Returns:
+            True면 오늘 처음 선점 (이 호출자가 발송), False면 이미 발송됨
+        """
+        claimed = self.coordinator.claim(self._briefing_key(briefing_type), BRIEFING_COOLDOWN_SECONDS)
+        if not claimed:
+            logger.info(f"{briefing_type} 브리핑 이미 발송됨 (오늘)")
+        return claimed
 
     def _get_last_alert_time(self):
         """마지막 알림 발송 시간 조회 (Redis 기반)"""
@@ -218,138 +190,296 @@ class NewsScheduler:
         else:
             return int(abs_change // 5) * 5
 
-    async def check_stock_alerts(self):
+    def _build_market_tick(self) -> MarketTickPipeline:
         """
-        주가 변동 알림 체크
-        - 지수/암호화폐: 1%, 2%, 3%... 각 구간 돌파 시 알림
-        - 개별주/레버리지 ETF: 5%, 10%, 15%... 각 구간 돌파 시 알림
-        - 같은 종목/레벨은 24시간 내 재알림 안 함 (Redis TTL)
-        - 주말: 나스닥 선물 + 비트코인만 체크
+        공용 틱 파이프라인 구성 (주가 레벨 → 주말 → 배당주 → TQ버스 순서)
+        - 틱은 MARKET_TICK_INTERVAL마다, 종목별 조회 주기는 PollPlanner가 분류/변동성/레벨 거리로 결정
+        - 주말 나스닥 / TQ버스 단계별 알림은 STOCK_CHECK_INTERVAL 간격 유지
         """
-        try:
-            # 주말 여부 확인 (미국 동부시간 기준)
-            import pytz
-            us_eastern = pytz.timezone('America/New_York')
-            us_now = datetime.now(us_eastern)
-            is_weekend = us_now.weekday() >= 5  # 미국 기준 토(5), 일(6)
-
-            if is_weekend:
-                logger.info("주말 모드: Weekend Nasdaq + BTC 체크...")
-
-                # Weekend Nasdaq (IG US Tech 100) 체크
-                weekend_data = await self.weekend_nasdaq_tracker.fetch_price_data()
-                alerts = []
-
-                if weekend_data and self.weekend_nasdaq_tracker.should_alert(weekend_data, threshold=1.0):
-                    # Weekend Nasdaq 알림 발송
-                    msg = self.weekend_nasdaq_tracker.format_alert_message(weekend_data)
-                    if msg:
-                        await self.bot.send_news(msg)
-                        logger.info("Weekend Nasdaq 알림 발송 완료")
-
-                # 비트코인 체크
-                btc_alerts = self.stock_monitor.check_symbols(
-                    self.stock_monitor.CRYPTO,
-                    'crypto',
-                    self.stock_monitor.INDEX_THRESHOLD
-                )
-                alerts.extend(btc_alerts)
-            else:
-                logger.info("주가 변동 체크 시작...")
-                alerts = self.stock_monitor.check_all()
-
-            if not alerts:
-                logger.info("변동 임계값을 초과한 항목 없음")
+        pipeline = MarketTickPipeline(self.stock_monitor, PollPlanner(), MARKET_TICK_INTERVAL)
+        pipeline.register('stock_levels', self._evaluate_stock_levels,
+                          symbols=self._plan_stock_groups)
+        pipeline.register('weekend', self._evaluate_weekend_nasdaq,
+                          enabled=self._is_us_weekend,
+                          interval=STOCK_CHECK_INTERVAL)
+        pipeline.register('dividend_levels', self._evaluate_dividend_levels,
+                          symbols=lambda: self.dividend_monitor.DIVIDEND_ETFS.keys(),
+                          enabled=lambda: not self._is_us_weekend() and self.stock_monitor.is_us_market_hours())
+        pipeline.register('tqbus_levels', self._evaluate_tqbus_levels,
+                          symbols=lambda: ('TQQQ',),
+                          enabled=is_us_extended_market_hours,
+                          interval=STOCK_CHECK_INTERVAL)
+        return pipeline
+
+    def _build_close_jobs(self) -> JobGraph:
+        """
+        미국 장 마감 후 작업 그래프
+        - 입력(Fear & Greed, TQQQ 3년, 배당 정보, 실적 결과)은 실행당 1회만 조회
+        - 전 종목 종가는 장 마감 스냅샷으로 한 번 저장하고 브리핑은 스냅샷만 사용
+        - 작업은 필요한 입력이 준비되는 대로 서로 독립적으로 실행
+        """
+        graph = JobGraph('장 마감 작업')
+
+        # 입력
+        graph.add('fear_greed', self.fear_greed_tracker.fetch_fear_greed_data)
+        graph.add('tqqq_history', self.tqbus_tracker.get_tqqq_data)
+        graph.add('dividend_data', self.dividend_monitor.fetch_dividend_data)
+        graph.add('earnings_results', self._fetch_earnings_results_after_close)
+        graph.add('close_snapshot', self._take_close_snapshot, deps=('fear_greed', 'tqqq_history', 'dividend_data'))
+
+        # 작업
+        graph.add('morning_briefing', self.send_morning_briefing, deps=('close_snapshot',))
+        graph.add('tqbus_crossover', self.check_tqbus_crossover, deps=('close_snapshot',))
+        graph.add('earnings_results_briefing', self.send_earnings_results, deps=('earnings_results',))
+        return graph
+
+    def _take_close_snapshot(self, inputs: dict):
+        """장 마감 스냅샷 생성 및 저장 (레지스트리 전 종목 + TQQQ 3년 + 배당 + Fear & Greed)"""
+        snapshot = build_close_snapshot(
+            self.stock_monitor.get_daily_chart,
+            histories={'TQQQ': inputs.get('tqqq_history')},
+            dividends=inputs.get('dividend_data'),
+            extras={'fear_greed': inputs.get('fear_greed')},
+        )
+        snapshot.save()
+        set_close_snapshot(snapshot)
+        return snapshot
+
+    async def _fetch_earnings_results_after_close(self):
+        """실적 결과 조회 (장 마감 직후 발표분까지 기다렸다가)"""
+        await asyncio.sleep(EARNINGS_RESULTS_DELAY_SECONDS)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.earnings_monitor.fetch_earnings_results)
+
+    async def run_close_jobs(self):
+        """장 마감 작업 그래프 실행 (종가 확정 시)"""
+        await self.close_jobs.run()
+
+    def _build_close_detector(self) -> CloseDetector:
+        """미국 장 종가 확정 후 실행할 작업 등록 (리더만 감시)"""
+        detector = CloseDetector(self.scheduler, self.stock_monitor, 'US',
+                                 is_active=lambda: self.coordinator.is_leader)
+        detector.on_close('close_jobs', self.run_close_jobs)
+        return detector
+
+    def _leader_only(self, func):
+        """
+        리더 인스턴스에서만 실행되는 작업으로 감싸기 (대기 인스턴스는 스킵)
+        동기 함수는 기존처럼 스레드에서 실행 (이벤트 루프를 막지 않게)
+        """
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not self.coordinator.is_leader:
+                logger.debug(f"대기 인스턴스 - {func.__name__} 스킵")
                 return
+            if not asyncio.iscoroutinefunction(func):
+                loop = asyncio.get_event_loop()
+                return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+            return await func(*args, **kwargs)
+        return wrapper
+
+    async def _warm_up_render_workers(self):
+        """렌더링 워커 프로세스 시작 + 준비 (폰트/rcParams)"""
+        try:
+            pids = await get_render_service().warm_up()
+            logger.info(f"렌더링 워커 준비 완료: {len(pids)}개")
+        except Exception as e:
+            logger.error(f"렌더링 워커 준비 오류: {e}")
 
-            # 24시간 내 중복 알림 필터링 (Redis 기반)
-            new_alerts = []
-            for alert in alerts:
-                current_level = self._get_threshold_level(alert.change_percent, alert.category)
+    def _is_us_weekend(self) -> bool:
+        """주말 여부 (미국 동부시간 기준)"""
+        return market_today('US').weekday() >= 5  # 미국 기준 토(5), 일(6)
 
-                # 24시간 내 같은 레벨 알림이 있는지 확인
-                if self._check_alert_exists(alert.symbol, current_level):
-                    logger.info(f"스킵: {alert.symbol} 레벨 {current_level} (24시간 내 알림 발송됨)")
-                    continue
+    def _plan_stock_groups(self) -> list:
+        """
+        이번 틱의 주가 감시 그룹 결정 후 필요한 심볼 반환
+        - 웹소켓 스트림이 최신인 암호화폐는 스트림 업데이트에서 판단하므로 틱에서 제외
+        """
+        if self._is_us_weekend():
+            # 주말: 비트코인만 (나스닥은 IG Weekend로 별도 체크)
+            groups = self.stock_monitor.get_weekend_groups()[1:]
+        else:
+            groups = self.stock_monitor.get_watch_groups()
+
+        if self.crypto_stream is not None:
+            groups = [
+                WatchGroup({s: n for s, n in group.symbols.items() if not self.crypto_stream.is_live(s)},
+                           group.category, group.threshold)
+                if group.category == 'crypto' else group
+                for group in groups
+            ]
+        self._tick_stock_groups = [group for group in groups if group.symbols]
+        return [symbol for group in self._tick_stock_groups for symbol in group.symbols]
+
+    def _build_crypto_stream(self):
+        """암호화폐 웹소켓 스트림 (비활성화면 None)"""
+        if not CRYPTO_STREAM_ENABLED:
+            return None
+        symbols = CRYPTO_STREAM_SYMBOLS or list(self.stock_monitor.CRYPTO)
+        stream = CryptoStream(symbols, on_update=self._on_crypto_update, url=BINANCE_WS_URL)
+        self.stock_monitor.crypto_stream = stream
+        return stream
+
+    async def _on_crypto_update(self, symbol: str, price: float, day_open: float):
+        """
+        암호화폐 스트림 업데이트마다 레벨 돌파 판단 (폴링 없음)
+        - 임계값 미만이거나 이번 세션에 이미 알림한 레벨이면 메모리 비교만 하고 종료
+        """
+        if not self.coordinator.is_leader:
+            return
+        change = self.stock_monitor.calculate_change_percent(price, day_open)
+        if abs(change) < self.stock_monitor.INDEX_THRESHOLD:
+            return
+
+        level = self._get_threshold_level(change, 'crypto')
+        up = change > 0
+        signed_level = level if up else -level
+        buffered = self.alert_buffer.level_of(symbol) == signed_level
+        if not buffered and not self.level_state.should_alert(symbol, level, up):
+            return
+
+        info = get_registry().info(symbol)
+        alert = PriceChange(
+            symbol=symbol,
+            name=info.name if info else symbol,
+            current_price=price,
+            previous_close=day_open,
+            change_percent=change,
+            category='crypto'
+        )
+        if buffered:
+            self.alert_buffer.add(alert, signed_level)  # 발송 예약된 알림 - 최신 가격으로만 갱신
+            return
+        await self._queue_stock_alerts([alert])
 
-                new_alerts.append(alert)
-                logger.info(f"알림 후보: {alert.symbol} ({alert.change_percent:+.2f}%, 레벨 {current_level})")
+    async def run_market_tick(self):
+        """공용 시세 틱 (MARKET_TICK_INTERVAL 간격)"""
+        await self.market_tick.run_tick()
 
-            if not new_alerts:
-                logger.info("새로운 알림 없음 (24시간 내 중복 필터링)")
+    async def _evaluate_stock_levels(self, snapshot):
+        """
+        주가 변동 알림 체크
+        - 지수/암호화폐: 1%, 2%, 3%... 각 구간 돌파 시 알림
+        - 개별주/레버리지 ETF: 5%, 10%, 15%... 각 구간 돌파 시 알림
+        - 같은 종목/방향은 이번 세션에 알림한 최대 레벨 이하로 재알림 안 함 (레벨 상태 + Redis 선점)
+        - 최소 간격(10분) 안에 생긴 알림은 버퍼에 모아 간격이 열리는 시각에 한 메시지로 발송
+        - 주말: 비트코인만 체크
+        """
+        alerts = self.stock_monitor.check_groups(self._tick_stock_groups, snapshot)
+        logger.info(f"주가 변동 체크: {len(alerts)}개 알림 항목 발견")
+
+        if not alerts:
+            logger.info("변동 임계값을 초과한 항목 없음")
+            return
+
+        await self._queue_stock_alerts(alerts)
+
+    async def _queue_stock_alerts(self, alerts: list):
+        """임계값을 넘은 알림을 선점 후 대기 버퍼에 넣고, 최소 간격이 열려 있으면 바로 발송"""
+        # 종목/레벨별 발송 선점 (SET NX EX, 24시간 내 중복 + 동시 실행 중복 모두 차단) 후 대기 버퍼에 추가
+        for alert in alerts:
+            current_level = self._get_threshold_level(alert.change_percent, alert.category)
+            up = alert.change_percent > 0
+            signed_level = current_level if up else -current_level
+            if self.alert_buffer.level_of(alert.symbol) == signed_level:
+                self.alert_buffer.add(alert, signed_level)  # 이미 대기 중 - 최신 가격으로 갱신
+            elif self._claim_alert(self.level_state, alert.symbol, current_level, up):
+                self.alert_buffer.add(alert, signed_level)
+                logger.info(f"알림 선점: {alert.symbol} ({alert.change_percent:+.2f}%, 레벨 {current_level})")
+            else:
+                logger.debug(f"스킵: {alert.symbol} 레벨 {signed_level:+d} (이번 세션 알림 발송됨)")
+
+        if not len(self.alert_buffer):
+            logger.info("새로운 알림 없음 (24시간 내 중복 필터링)")
+            return
+
+        # 10분 최소 간격 (Redis 기반) - 간격이 열리는 시각에 대기 알림을 한 번에 발송
+        last_time = self._get_last_alert_time()
+        if last_time:
+            opens_at = last_time + timedelta(seconds=MIN_ALERT_INTERVAL_SECONDS)
+            if datetime.now() < opens_at:
+                self._schedule_alert_flush(opens_at)
                 return
 
-            # 10분 최소 간격 체크 (Redis 기반)
-            now = datetime.now()
-            last_time = self._get_last_alert_time()
-            if last_time:
-                elapsed = (now - last_time).total_seconds()
-                if elapsed < MIN_ALERT_INTERVAL_SECONDS:
-                    remaining = int((MIN_ALERT_INTERVAL_SECONDS - elapsed) / 60)
-                    logger.info(f"알림 발송 대기 중 (최소 간격 10분, {remaining}분 남음)")
-                    return
-
-            # 파일 백업 저장 (Redis 미사용 시 폴백)
-            self._save_alert_history()
-
-            # 발송 직전 이중 체크 (Render 동시 실행 방지)
-            final_alerts = []
-            for alert in new_alerts:
-                current_level = self._get_threshold_level(alert.change_percent, alert.category)
-                if not self._check_alert_exists(alert.symbol, current_level):
-                    final_alerts.append(alert)
-                    self._save_alert_record(alert.symbol, current_level)  # 즉시 저장
-                else:
-                    logger.info(f"이중 체크 스킵: {alert.symbol} 레벨 {current_level}")
-
-            if not final_alerts:
-                logger.info("발송 직전 이중 체크: 모든 알림 이미 발송됨")
-                return
+        await self.flush_stock_alerts()
+
+    def _schedule_alert_flush(self, opens_at: datetime):
+        """최소 간격이 열리는 시각에 대기 알림 발송 예약 (이미 예약돼 있으면 유지)"""
+        if self.scheduler.get_job('alert_flush'):
+            return
+        remaining = int((opens_at - datetime.now()).total_seconds())
+        logger.info(f"알림 {len(self.alert_buffer)}개 대기 (최소 간격 10분, {remaining}초 후 발송)")
+        self.scheduler.add_job(
+            self.flush_stock_alerts,
+            'date',
+            run_date=datetime.fromtimestamp(opens_at.timestamp(), pytz.utc),
+            id='alert_flush',
+            name='대기 알림 발송',
+            replace_existing=True
+        )
 
-            # 알림 메시지 생성 및 전송
-            message = self.stock_monitor.format_alert_message(final_alerts)
+    async def flush_stock_alerts(self):
+        """대기 중인 주가 변동 알림을 한 메시지로 발송"""
+        waited = self.alert_buffer.waiting_seconds()
+        alerts = self.alert_buffer.drain()
+        if not alerts:
+            return
 
-            if message:
-                success = await self.bot.send_news(message)
+        message = self.stock_monitor.format_alert_message(alerts)
+        if message:
+            now = datetime.now()
+            success = await self.bot.send_news(message)
 
-                if success:
-                    self._set_last_alert_time(now)  # 발송 시간 기록 (Redis)
-                    logger.info(f"주가 변동 알림 발송 성공 ({len(final_alerts)}개 항목)")
-                else:
-                    logger.error("주가 변동 알림 발송 실패")
+            if success:
+                self._set_last_alert_time(now)  # 발송 시간 기록 (Redis)
+                logger.info(f"주가 변동 알림 발송 성공 ({len(alerts)}개 항목, 최대 {waited:.0f}초 대기)")
+            else:
+                logger.error("주가 변동 알림 발송 실패")
 
-            # 배당주 리스트 별도 체크 (SCHD, VYM, HDV, JEPI, JEPQ, DIVO, O)
-            await self._check_dividend_stocks()
+    async def _evaluate_weekend_nasdaq(self, snapshot):
+        """주말 모드: Weekend Nasdaq (IG US Tech 100) 체크"""
+        logger.info("주말 모드: Weekend Nasdaq 체크...")
 
-        except Exception as e:
-            logger.error(f"주가 변동 체크 오류: {e}")
+        weekend_data = await self.weekend_nasdaq_tracker.fetch_price_data()
+        if weekend_data and self.weekend_nasdaq_tracker.should_alert(weekend_data, threshold=1.0):
+            msg = self.weekend_nasdaq_tracker.format_alert_message(weekend_data)
+            if msg:
+                await self.bot.send_news(msg)
+                logger.info("Weekend Nasdaq 알림 발송 완료")
 
-    async def send_morning_briefing(self, force: bool = False):
+    async def send_morning_briefing(self, force: bool = False, inputs: dict = None):
         """
-        오전 브리핑 발송 (08:00 KST)
+        오전 브리핑 발송 (미국 장 종가 확정 직후)
         - Fear & Greed 스크린샷
         - 미국 증시 스크린샷
 
         Args:
             force: True면 중복 체크 무시 (수동 트리거용)
+            inputs: 장 마감 작업 그래프 입력 {'close_snapshot': ...} (없으면 저장된 스냅샷, 그것도 없으면 직접 조회)
         """
         try:
-            # 중복 발송 방지 (Redis) - force=True면 스킵
-            if not force and self._check_briefing_sent("morning"):
+            # 발송 선점 (Redis SET NX) - force=True면 이미 발송됐어도 발송
+            if not self._claim_briefing("morning") and not force:
                 logger.info("오전 브리핑 스킵 (이미 발송됨)")
                 return
 
             logger.info("오전 브리핑 발송 시작...")
 
+            # 장 마감 스냅샷이 있으면 네트워크 조회 없이 포맷만
+            snapshot = (inputs or {}).get('close_snapshot') or get_close_snapshot()
+
             # 1. Fear & Greed (텍스트)
-            fg_data = self.fear_greed_tracker.fetch_fear_greed_data()
+            if snapshot is not None and snapshot.extras.get('fear_greed'):
+                fg_data = snapshot.extras['fear_greed']
+            else:
+                fg_data = self.fear_greed_tracker.fetch_fear_greed_data()
             if fg_data:
                 msg = self.fear_greed_tracker.format_text_message(fg_data)
                 await self.bot.send_news(msg)
                 logger.info("Fear & Greed 텍스트 발송 완료")
 
             # 2. 미국 증시 (텍스트)
-            us_data = self.naver_tracker.fetch_us_market_data()
+            us_data = self.naver_tracker.fetch_us_market_data(snapshot)
             if us_data:
                 msg = self.naver_tracker.format_text_message(us_data)
                 await self.bot.send_news(msg)
@@ -357,16 +487,13 @@ class NewsScheduler:
 
             # 3. 3X ETF 리스트 (텍스트)
             try:
-                etf_data = self.etf_tracker.get_all_etf_data()
+                etf_data = self.etf_tracker.get_all_etf_data(snapshot)
                 if etf_data:
                     etf_msg = self.etf_tracker.format_etf_report(etf_data)
                     await self.bot.send_news(etf_msg)
                     logger.info("3X ETF 텍스트 발송 완료")
             except Exception as etf_err:
                 logger.error(f"3X ETF 발송 오류: {etf_err}")
-
-            # 발송 완료 기록 (Redis)
-            self._mark_briefing_sent("morning")
             logger.info("오전 브리핑 발송 완료")
 
             # 배당주 채널로 Fear & Greed + 미국 증시 + 3X ETF 전송
@@ -395,24 +522,21 @@ class NewsScheduler:
             force: True면 중복 체크 무시 (수동 트리거용)
         """
         try:
-            # 중복 발송 방지 (Redis) - force=True면 스킵
-            if not force and self._check_briefing_sent("afternoon"):
+            # 발송 선점 (Redis SET NX) - force=True면 이미 발송됐어도 발송
+            if not self._claim_briefing("afternoon") and not force:
                 logger.info("오후 브리핑 스킵 (이미 발송됨)")
                 return
 
             logger.info("오후 브리핑 발송 시작...")
 
             # 한국 증시 (텍스트)
-            kr_data = self.naver_tracker.fetch_kr_market_data()
+            kr_data = self.naver_tracker.fetch_kr_market_data(get_close_snapshot())
             if kr_data:
                 msg = self.naver_tracker.format_kr_text_message(kr_data)
                 await self.bot.send_news(msg)
                 logger.info("한국 증시 텍스트 발송 완료")
             else:
                 logger.warning("한국 증시 데이터 가져오기 실패")
-
-            # 발송 완료 기록 (Redis)
-            self._mark_briefing_sent("afternoon")
             logger.info("오후 브리핑 발송 완료")
 
             # 배당주 채널로도 한국 증시 전송
@@ -432,8 +556,8 @@ class NewsScheduler:
         try:
             logger.info('배당주 리포트 전송 시작')
 
-            # 배당 데이터 수집 (동기 함수)
-            dividend_data = self.dividend_monitor.fetch_dividend_data()
+            # 배당 데이터 수집 (장 마감 스냅샷 우선, 동기 함수)
+            dividend_data = self.dividend_monitor.fetch_dividend_data(get_close_snapshot())
 
             if dividend_data:
                 # 배당 정보 포맷팅 (동기 함수)
@@ -441,6 +565,11 @@ class NewsScheduler:
 
                 # 배당 채널로 전송
                 await self.dividend_bot.send_news(message)
+
+                # 배당 현황 테이블 이미지 (실패해도 텍스트 리포트는 이미 발송)
+                table = await self.dividend_monitor.create_dividend_table_image(dividend_data)
+                if table is not None:
+                    await self.dividend_bot.send_photo_buffer(table, kind="graphic")
                 logger.info('배당주 리포트 전송 완료')
             else:
                 logger.warning('배당 데이터 수집 실패')
@@ -449,37 +578,33 @@ class NewsScheduler:
             logger.error(f'배당주 리포트 전송 오류: {e}')
 
 
-    async def _check_dividend_stocks(self):
+    async def _evaluate_dividend_levels(self, snapshot):
         """
         배당주 리스트 가격 변동 체크 (SCHD, VYM, HDV, JEPI, JEPQ, DIVO, O)
         배당주 채널로만 알림 전송
         """
-        try:
-            # 배당주 심볼 리스트
-            dividend_symbols = list(self.dividend_monitor.DIVIDEND_ETFS.keys())
-            
-            # 배당주만 체크
-            alerts = self.stock_monitor.check_symbols(dividend_symbols)
-            
-            if not alerts:
-                return
-            
-            # 중복 필터링 (DIV_ 접두사로 기존 채널과 분리)
-            new_alerts = []
-            for alert in alerts:
-                current_level = self._get_threshold_level(alert.change_percent, alert.category)
-                if not self._check_alert_exists(f"DIV_{alert.symbol}", current_level):
-                    new_alerts.append(alert)
-                    self._save_alert_record(f"DIV_{alert.symbol}", current_level)
-            
-            if new_alerts:
-                message = self.stock_monitor.format_alert_message(new_alerts)
-                if message:
-                    await self.dividend_bot.send_news(message)
-                    logger.info(f"배당주 가격 변동 알림 발송 ({len(new_alerts)}개)")
-        
-        except Exception as e:
-            logger.error(f"배당주 가격 변동 체크 오류: {e}")
+        alerts = self.stock_monitor.check_symbols(
+            self.dividend_monitor.DIVIDEND_ETFS,
+            'stock',
+            self.stock_monitor.STOCK_THRESHOLD,
+            snapshot
+        )
+
+        if not alerts:
+            return
+
+        # 중복 필터링 (배당주 채널 전용 레벨 상태로 기존 채널과 분리)
+        new_alerts = []
+        for alert in alerts:
+            current_level = self._get_threshold_level(alert.change_percent, alert.category)
+            if self._claim_alert(self.dividend_level_state, alert.symbol, current_level, alert.change_percent > 0):
+                new_alerts.append(alert)
+
+        if new_alerts:
+            message = self.stock_monitor.format_alert_message(new_alerts)
+            if message:
+                await self.dividend_bot.send_news(message)
+                logger.info(f"배당주 가격 변동 알림 발송 ({len(new_alerts)}개)")
 
     async def send_tqbus_status(self, force: bool = False):
         """
@@ -489,21 +614,21 @@ class NewsScheduler:
             force: True면 중복 체크 무시 (수동 트리거용)
         """
         try:
-            # 중복 발송 방지 (Redis) - force=True면 스킵
-            if not force and self._check_briefing_sent("tqbus_status"):
+            # 발송 선점 (Redis SET NX) - force=True면 이미 발송됐어도 발송
+            if not self._claim_briefing("tqbus_status") and not force:
                 logger.info("TQ버스 상태 스킵 (이미 발송됨)")
                 return
 
             logger.info("TQ버스 상태 발송 시작...")
 
-            msg = self.tqbus_tracker.format_status_message()
+            # 장 마감 스냅샷의 TQQQ 3년 종가 재사용 (없으면 직접 조회)
+            snapshot = get_close_snapshot()
+            tqqq_data = snapshot.history('TQQQ') if snapshot is not None else None
+            msg = self.tqbus_tracker.format_status_message(tqqq_data)
             if msg:
                 await self.bot.send_news(msg)
                 logger.info("TQ버스 상태 발송 완료")
 
-            # 발송 완료 기록 (Redis)
-            self._mark_briefing_sent("tqbus_status")
-
         except Exception as e:
             logger.error(f"TQ버스 상태 발송 오류: {e}")
 
@@ -512,15 +637,15 @@ class NewsScheduler:
         배당주 브리핑 발송 (09:00 KST)
         """
         try:
-            # 중복 발송 방지 (Redis) - force=True면 스킵
-            if not force and self._check_briefing_sent("dividend"):
+            # 발송 선점 (Redis SET NX) - force=True면 이미 발송됐어도 발송
+            if not self._claim_briefing("dividend") and not force:
                 logger.info("배당 브리핑 스킵 (이미 발송됨)")
                 return
 
             logger.info("배당 브리핑 발송 시작...")
 
-            # 배당 데이터 수집 (동기 함수)
-            dividend_data = self.dividend_monitor.fetch_dividend_data()
+            # 배당 데이터 (장 마감 스냅샷 우선, 없으면 yfinance 조회)
+            dividend_data = self.dividend_monitor.fetch_dividend_data(get_close_snapshot())
             if dividend_data:
                 msg = self.dividend_monitor.format_dividend_briefing(dividend_data)
 
@@ -530,38 +655,24 @@ class NewsScheduler:
             else:
                 logger.warning("배당 데이터 수집 실패 또는 데이터 없음")
 
-            # 발송 완료 기록 (Redis)
-            self._mark_briefing_sent("dividend")
-
         except Exception as e:
             logger.error(f"배당 브리핑 발송 오류: {e}")
 
-    async def check_dividend_price_alerts(self):
-        """
-        배당 포트폴리오 가격 변동 알림 (5분 간격)
-        """
-        try:
-            # 가격 알림 확인 - TODO: DividendAlertMonitor 구현 필요
-            # alerts = self.dividend_alert_monitor.check_price_alerts()
-            # for msg in alerts:
-            #      await self.dividend_bot.send_news(msg)
-            #      logger.info(f"배당 가격 알림 발송: {msg.splitlines()[0]}")
-            pass
-
-        except Exception as e:
-            logger.error(f"배당 가격 알림 체크 오류: {e}")
-
     async def check_dividend_news_alerts(self):
         """
         배당 포트폴리오 뉴스 알림 (1시간 간격)
         """
         try:
-            # 뉴스 알림 확인 - TODO: DividendAlertMonitor 구현 필요
-            # alerts = self.dividend_alert_monitor.check_news_alerts()
-            # for msg in alerts:
-            #      await self.dividend_bot.send_news(msg)
-            #      logger.info(f"배당 뉴스 알림 발송: {msg.splitlines()[0]}")
-            pass
+            # 뉴스 조회/번역은 동기 I/O라 스레드에서 실행
+            loop = asyncio.get_event_loop()
+            alerts = await loop.run_in_executor(None, self.dividend_alert_monitor.check_news_alerts)
+            for alert in alerts:
+                # 발송에 성공한 알림만 보낸 헤드라인으로 등록 (실패하면 다음 실행에서 다시 발송)
+                if not await self.dividend_bot.send_news(alert.message):
+                    logger.warning(f"배당 뉴스 알림 발송 실패: {alert.symbol}")
+                    continue
+                await loop.run_in_executor(None, self.dividend_alert_monitor.mark_sent, alert)
+                logger.info(f"배당 뉴스 알림 발송: {alert.message.splitlines()[0]}")
 
         except Exception as e:
             logger.error(f"배당 뉴스 알림 체크 오류: {e}")
@@ -571,16 +682,14 @@ class NewsScheduler:
         배당 포트폴리오 마감 브리핑 (장 마감 후)
         """
         try:
-            if not force and self._check_briefing_sent("dividend_closing"):
+            if not self._claim_briefing("dividend_closing") and not force:
                 logger.info("배당 마감 브리핑 스킵 (이미 발송됨)")
                 return
 
-            # TODO: DividendAlertMonitor 구현 필요
+            # TODO: DividendAlertMonitor.format_closing_briefing 구현 필요
             # msg = self.dividend_alert_monitor.format_closing_briefing()
             # await self.dividend_bot.send_news(msg)
             logger.info("배당 마감 브리핑 스킵 (DividendAlertMonitor 미구현)")
-            
-            self._mark_briefing_sent("dividend_closing")
 
         except Exception as e:
             logger.error(f"배당 마감 브리핑 오류: {e}")
@@ -590,7 +699,7 @@ class NewsScheduler:
         S&P 100 실적 발표 일정 발송 (08:00 KST, 화~토)
         """
         try:
-            if not force and self._check_briefing_sent("earnings_calendar"):
+            if not self._claim_briefing("earnings_calendar") and not force:
                 logger.info("실적 일정 스킵 (이미 발송됨)")
                 return
 
@@ -607,23 +716,28 @@ class NewsScheduler:
             else:
                 logger.info("이번 주 S&P 100 실적 발표 예정 없음")
 
-            self._mark_briefing_sent("earnings_calendar")
-
         except Exception as e:
             logger.error(f"실적 일정 발송 오류: {e}")
 
-    async def send_earnings_results(self, force: bool = False):
+    async def send_earnings_results(self, force: bool = False, inputs: dict = None):
         """
         S&P 100 실적 발표 결과 발송 (장 마감 후, 화~토)
+
+        Args:
+            inputs: 장 마감 작업 그래프에서 미리 조회한 입력 (없으면 직접 조회)
         """
         try:
-            if not force and self._check_briefing_sent("earnings_results"):
+            if not self._claim_briefing("earnings_results") and not force:
                 logger.info("실적 결과 스킵 (이미 발송됨)")
                 return
 
             logger.info("S&P 100 실적 결과 발송 시작...")
 
-            results_data = self.earnings_monitor.fetch_earnings_results()
+            inputs = inputs or {}
+            if 'earnings_results' in inputs:
+                results_data = inputs['earnings_results']
+            else:
+                results_data = self.earnings_monitor.fetch_earnings_results()
             if results_data:
                 msg = self.earnings_monitor.format_earnings_results(results_data)
                 if msg:
@@ -632,104 +746,115 @@ class NewsScheduler:
             else:
                 logger.info("오늘 발표된 S&P 100 실적 없음")
 
-            self._mark_briefing_sent("earnings_results")
-
         except Exception as e:
             logger.error(f"실적 결과 발송 오류: {e}")
 
-    async def check_tqbus_crossover(self):
+    async def check_tqbus_crossover(self, inputs: dict = None):
         """
         TQ버스 이평선 돌파 체크 (종가 기준, 미국 장 마감 시간)
         승차(상향 돌파) / 하차(하향 돌파) 신호
+
+        Args:
+            inputs: 장 마감 작업 그래프 입력 {'close_snapshot': ...} (없으면 저장된 스냅샷, 그것도 없으면 직접 조회)
         """
         try:
-            # 중복 발송 방지 (Redis)
-            if self._check_briefing_sent("tqbus_crossover"):
-                return  # 오늘 이미 발송됨
+            snapshot = (inputs or {}).get('close_snapshot') or get_close_snapshot()
+            tqqq_data = snapshot.history('TQQQ') if snapshot is not None else None
+            if tqqq_data is None:
+                tqqq_data = self.tqbus_tracker.get_tqqq_data()
+            if not tqqq_data:
+                return
 
-            crossover = self.tqbus_tracker.detect_crossover()
+            crossover = self.tqbus_tracker.detect_crossover(tqqq_data)
             if crossover:
-                msg = self.tqbus_tracker.format_crossover_message(crossover)
-                if msg:
+                msg = self.tqbus_tracker.format_crossover_message(crossover, tqqq_data)
+                # 발송 선점 (Redis SET NX) - 오늘 이미 발송됐으면 스킵
+                if msg and self._claim_briefing("tqbus_crossover"):
                     await self.bot.send_news(msg)
                     logger.info(f"TQ버스 {crossover} 신호 발송 완료")
 
-                    # 발송 완료 기록 (Redis)
-                    self._mark_briefing_sent("tqbus_crossover")
-
         except Exception as e:
             logger.error(f"TQ버스 돌파 체크 오류: {e}")
 
-    async def check_tqbus_alert(self):
+    async def _evaluate_tqbus_levels(self, snapshot):
         """
         TQ버스 이평선 단계별 알림 (실시간 가격 기준, 프리+정규+애프터 시간대)
         레벨: +7%, +5%, +3%, -3%, -5%, -7% (각 레벨당 하루 1회)
         """
-        try:
-            # 주말 체크
-            if is_us_market_holiday():
-                return  # 주말 또는 휴장일
-
-            # 미국 확장 시간대(프리+정규+애프터) 체크
-            if not is_us_extended_market_hours():
-                return  # 장 시간 외
-
-            # 현재 알림 레벨 확인
-            alert_level = self.tqbus_tracker.should_alert()
-            if alert_level is None:
-                return  # 알림 범위 밖
-
-            # 레벨별 중복 발송 방지 (Redis)
-            level_key = f"tqbus_alert_{alert_level:+.1f}"  # 예: tqbus_alert_+7.0, tqbus_alert_-3.0
-            if self._check_briefing_sent(level_key):
-                return  # 해당 레벨 오늘 이미 발송됨
-
-            # 알림 메시지 생성 및 발송
-            msg = self.tqbus_tracker.format_alert_message(alert_level)
-            if msg:
-                await self.bot.send_news(msg)
-                logger.info(f"TQ버스 {alert_level:+.1f}% 레벨 알림 발송 완료")
-
-                # 발송 완료 기록 (Redis, 24시간 TTL)
-                self._mark_briefing_sent(level_key)
-
-        except Exception as e:
-            logger.error(f"TQ버스 알림 체크 오류: {e}")
+        price_data = snapshot.get('TQQQ')
+        if not price_data:
+            return
+
+        # 스냅샷 가격 + 하루 한 번 조회한 확정 종가로 상태 계산
+        loop = asyncio.get_event_loop()
+        status = await loop.run_in_executor(None, self.tqbus_tracker.get_live_status, price_data[0])
+
+        # 현재 알림 레벨 확인
+        alert_level = self.tqbus_tracker.should_alert(status) if status else None
+        if alert_level is None:
+            return  # 알림 범위 밖
+
+        # 알림 메시지 생성 후 레벨별 발송 선점 (Redis SET NX, 해당 레벨 오늘 이미 발송됐으면 스킵)
+        level_key = f"tqbus_alert_{alert_level:+.1f}"  # 예: tqbus_alert_+7.0, tqbus_alert_-3.0
+        msg = self.tqbus_tracker.format_alert_message(alert_level, status)
+        if msg and self._claim_briefing(level_key):
+            await self.bot.send_news(msg)
+            logger.info(f"TQ버스 {alert_level:+.1f}% 레벨 알림 발송 완료")
 
     def start(self):
         """스케줄러 시작"""
         try:
             logger.info("스케줄러 시작...")
 
-            # 주가 변동 알림 체크 (주기적 - 5분마다)
+            # 리더 임대 (여러 인스턴스 중 하나만 폴링 작업 실행, 리더 중단 시 임대 만료 후 인계)
+            self.coordinator.heartbeat()
             self.scheduler.add_job(
-                self.check_stock_alerts,
+                self.coordinator.heartbeat,
                 'interval',
-                seconds=STOCK_CHECK_INTERVAL,
-                id='check_stock_alerts',
-                name='주가 변동 알림',
+                seconds=self.coordinator.heartbeat_interval,
+                id='leader_heartbeat',
+                name='리더 임대 갱신',
+                max_instances=1,
                 replace_existing=True
             )
 
-            # 오전 브리핑 (미국 장 마감 후 10분, 평일만)
-            # 서머타임: 05:10 KST, 일반: 06:10 KST
-            close_hour, close_minute = get_us_market_close_time_kst()
-            briefing_hour = close_hour
-            briefing_minute = close_minute
+            # 공용 시세 틱 (30초마다) - 주가 변동/주말/배당주/TQ버스 단계별 알림
+            # 조회 시각이 된 종목만 조회 (지수 30초 ~ 조용한 개별주 10분), 이전 틱과 겹치지 않음
             self.scheduler.add_job(
-                self.send_morning_briefing,
-                'cron',
-                hour=briefing_hour,
-                minute=briefing_minute,
-                day_of_week='tue-sat',  # 미국 월~금 마감 = 한국 화~토
-                id='morning_briefing',
-                name='오전 브리핑 (장마감 후 10분)',
+                self._leader_only(self.run_market_tick),
+                'interval',
+                seconds=MARKET_TICK_INTERVAL,
+                id='market_tick',
+                name='시세 틱 (주가/배당/TQ버스 알림)',
+                max_instances=1,
                 replace_existing=True
             )
 
+            # 암호화폐 웹소켓 스트림 (업데이트마다 레벨 판단, 끊기면 자동 재연결 + 시세 틱 REST 폴백)
+            if self.crypto_stream is not None:
+                self._crypto_stream_task = asyncio.get_event_loop().create_task(self.crypto_stream.run())
+
+            # 렌더링 워커 미리 준비 (배당 테이블 첫 렌더 지연 제거)
+            asyncio.get_event_loop().create_task(self._warm_up_render_workers())
+
+            # 레벨 상태 스냅샷 (변경분이 있을 때만 Redis/파일 저장, 리더만 - 대기 인스턴스의 상태로 덮어쓰지 않게)
+            self.scheduler.add_job(
+                self._leader_only(self.save_level_states),
+                'interval',
+                seconds=LEVEL_STATE_SNAPSHOT_SECONDS,
+                id='level_state_snapshot',
+                name='레벨 상태 스냅샷',
+                max_instances=1,
+                replace_existing=True
+            )
+
+            # 미국 장 종가 확정 감지 → 오전 브리핑 / TQ버스 돌파 / 실적 결과
+            # 세션 캘린더의 마감 시각(서머타임/조기 마감/휴장일 반영)부터 폴링, 확정 즉시 실행
+            self.close_detector.start()
+
             # 오후 브리핑 (한국 장 마감 후 10분, 15:40 KST)
             self.scheduler.add_job(
-                self.send_afternoon_briefing,
+                self._leader_only(self.send_afternoon_briefing),
                 'cron',
                 hour=15,
                 minute=40,
@@ -741,7 +866,7 @@ class NewsScheduler:
 
             # TQ버스 현재 상태 (18:00 KST, 화~토 = 미국 장 다음날)
             self.scheduler.add_job(
-                self.send_tqbus_status,
+                self._leader_only(self.send_tqbus_status),
                 'cron',
                 hour=18,
                 minute=0,
@@ -751,33 +876,9 @@ class NewsScheduler:
                 replace_existing=True
             )
 
-            # TQ버스 이평선 돌파 체크 (미국 장 마감 시간, 종가 기준)
-            close_hour, close_minute = get_us_market_close_time_kst()
-            self.scheduler.add_job(
-                self.check_tqbus_crossover,
-                'cron',
-                hour=close_hour,
-                minute=close_minute,
-                day_of_week='tue-sat',  # 미국 월~금 마감 = 한국 화~토
-                id='tqbus_crossover',
-                name='TQ버스 돌파 체크 (종가)',
-                replace_existing=True
-            )
-
-            # TQ버스 이평선 단계별 알림 (5분마다, 프리+정규+애프터)
-            # 레벨: +7%, +5%, +3%, -3%, -5%, -7%
-            self.scheduler.add_job(
-                self.check_tqbus_alert,
-                'interval',
-                seconds=STOCK_CHECK_INTERVAL,
-                id='tqbus_alert',
-                name='TQ버스 단계별 알림',
-                replace_existing=True
-            )
-
             # 배당주 리포트 (매주 월요일 08:30 KST)
             self.scheduler.add_job(
-                self.send_dividend_report,
+                self._leader_only(self.send_dividend_report),
                 'cron',
                 hour=8,
                 minute=30,
@@ -789,7 +890,7 @@ class NewsScheduler:
 
             # 배당 브리핑 (09:00 KST, 화~토 = 미국 장 다음날)
             self.scheduler.add_job(
-                self.send_dividend_briefing,
+                self._leader_only(self.send_dividend_briefing),
                 'cron',
                 hour=9,
                 minute=0,
@@ -799,19 +900,9 @@ class NewsScheduler:
                 replace_existing=True
             )
 
-            # 배당 가격 알림 (5분 간격)
-            self.scheduler.add_job(
-                self.check_dividend_price_alerts,
-                'interval',
-                seconds=STOCK_CHECK_INTERVAL,
-                id='dividend_price_alert',
-                name='배당 가격 알림',
-                replace_existing=True
-            )
-
             # 배당 뉴스 알림 (1시간 간격)
             self.scheduler.add_job(
-                self.check_dividend_news_alerts,
+                self._leader_only(self.check_dividend_news_alerts),
                 'interval',
                 minutes=60,
                 id='dividend_news_alert',
@@ -821,7 +912,7 @@ class NewsScheduler:
 
             # 배당 마감 브리핑 (09:05 KST - 기존 배당 브리핑 직후)
             self.scheduler.add_job(
-                self.send_dividend_closing_briefing,
+                self._leader_only(self.send_dividend_closing_briefing),
                 'cron',
                 hour=9,
                 minute=5,
@@ -833,7 +924,7 @@ class NewsScheduler:
 
             # S&P 100 실적 일정 (08:00 KST, 화~토 = 미국 월~금)
             self.scheduler.add_job(
-                self.send_earnings_calendar,
+                self._leader_only(self.send_earnings_calendar),
                 'cron',
                 hour=8,
                 minute=0,
@@ -843,28 +934,17 @@ class NewsScheduler:
                 replace_existing=True
             )
 
-            # S&P 100 실적 결과 (장마감 후 20분, 화~토)
-            self.scheduler.add_job(
-                self.send_earnings_results,
-                'cron',
-                hour=close_hour,
-                minute=close_minute + 10,
-                day_of_week='tue-sat',
-                id='earnings_results',
-                name='S&P 100 실적 결과',
-                replace_existing=True
-            )
-
             self.scheduler.start()
             logger.info("스케줄러 시작 완료")
-            logger.info(f"  - 주가 변동 알림 ({STOCK_CHECK_INTERVAL}초 간격)")
-            logger.info(f"  - 오전 브리핑 ({briefing_hour:02d}:{briefing_minute:02d} KST, 화~토 = 미국 장마감 후 10분)")
+            logger.info(f"  - 리더 임대: {'리더' if self.coordinator.is_leader else '대기'} ({self.coordinator.instance_id}, {self.coordinator.lease_ttl}초 임대)")
+            logger.info(f"  - 시세 틱: 주가 변동/배당주/TQ버스 단계별 알림 ({MARKET_TICK_INTERVAL}초 틱, 종목별 적응형 조회 주기)")
+            if self.crypto_stream is not None:
+                logger.info(f"  - 암호화폐 스트림: {', '.join(self.crypto_stream.symbols)} (Binance 웹소켓, 업데이트마다 알림 판단)")
+            logger.info("  - 오전 브리핑 / TQ버스 돌파 체크 / S&P 100 실적 결과 (미국 장 종가 확정 직후)")
             logger.info("  - 오후 브리핑 (15:40 KST, 월~금 = 한국 장마감 후 10분)")
             logger.info("  - TQ버스 상태 (18:00 KST, 화~토)")
-            logger.info(f"  - TQ버스 돌파 체크 ({STOCK_CHECK_INTERVAL}초 간격)")
             logger.info("  - 배당주 리포트 (매주 월요일 08:30 KST)")
             logger.info("  - S&P 100 실적 일정 (08:00 KST, 화~토)")
-            logger.info(f"  - S&P 100 실적 결과 ({close_hour}:{close_minute+10:02d} KST, 화~토)")
 
         except Exception as e:
             logger.error(f"스케줄러 시작 오류: {e}")
@@ -873,6 +953,13 @@ class NewsScheduler:
         """스케줄러 중지"""
         try:
             self.scheduler.shutdown()
+            if self._crypto_stream_task is not None:
+                self._crypto_stream_task.cancel()
+            # 리더만 마지막 상태 저장 (release 전에 - 인계받는 인스턴스가 최신 상태를 로드)
+            if self.coordinator.is_leader:
+                self.save_level_states(force=True)
+            self.coordinator.release()  # 대기 인스턴스가 즉시 인계
+            get_render_service().shutdown()
             logger.info("스케줄러 중지됨")
         except Exception as e:
             logger.error(f"스케줄러 중지 오류: {e}")
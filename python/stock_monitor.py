@@ -6,9 +6,15 @@
 """
 import logging
 import requests
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from symbol_registry import get_registry
+from http_client import http_get
+from circuit_breaker import CircuitOpenError
+from quote_providers import QuoteAggregator, QuoteProvider
+from market_sessions import is_market_open
 
 logger = logging.getLogger(__name__)
 
@@ -24,178 +30,77 @@ class PriceChange:
     category: str  # 'index', 'stock', 'etf', 'crypto'
 
 
+@dataclass
+class WatchGroup:
+    """같은 카테고리/임계값으로 감시하는 종목 묶음"""
+    symbols: Dict[str, str]
+    category: str
+    threshold: float
+
+
+# Yahoo Finance API 호스트 (query2는 같은 API의 미러)
+YAHOO_HOST = 'query1.finance.yahoo.com'
+YAHOO_FALLBACK_HOST = 'query2.finance.yahoo.com'
+
+# 스냅샷 조회 스레드 수 (호스트별 동시성 한도는 http_client가 조절)
+SNAPSHOT_WORKERS = 8
+
+
+class QuoteSnapshot:
+    """
+    한 번에 조회한 (현재가, 전일종가) 스냅샷
+    - 레지스트리 ID로 인덱싱하는 배열에 저장
+    - 같은 틱의 여러 평가기가 공유 (중복 조회 방지)
+    """
+
+    def __init__(self):
+        self.registry = get_registry()
+        self.taken_at = datetime.now()
+        self.current = self.registry.new_array()
+        self.previous = self.registry.new_array()
+        self._extra: Dict[str, Tuple[float, float]] = {}  # 레지스트리 미등록 심볼
+
+    def put(self, symbol: str, price_data: Optional[Tuple[float, float]]):
+        """조회 결과 저장 (None이면 조회 실패로 남김)"""
+        if price_data is None:
+            return
+        sid = self.registry.id_of(symbol)
+        if sid is None:
+            self._extra[symbol] = price_data
+            return
+        self.current[sid], self.previous[sid] = price_data
+
+    def get(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """(현재가, 전일종가) 또는 None"""
+        sid = self.registry.id_of(symbol)
+        if sid is None:
+            return self._extra.get(symbol)
+        if self.current[sid] is None:
+            return None
+        return (self.current[sid], self.previous[sid])
+
+    def __len__(self) -> int:
+        return sum(1 for c in self.current if c is not None) + len(self._extra)
+
+
 class StockMonitor:
     """주가 변동 모니터링 클래스"""
 
+    # 감시 종목은 data/symbols.json 레지스트리에서 로드
     # 지수 (1% 이상 변동 시 알림)
-    INDICES = {
-        "^KS11": "코스피 (KOSPI)",
-        "^KQ11": "코스닥 (KOSDAQ)",
-        "^IXIC": "나스닥 (NASDAQ)",
-        "^GSPC": "S&P 500",
-        "NQ=F": "나스닥 선물",
-    }
+    INDICES = get_registry().names('monitor_indices')
 
     # 비트코인만 감시 (2% 이상 변동 시 알림)
-    CRYPTO = {
-        "BTC-USD": "비트코인 (Bitcoin)",
-    }
+    CRYPTO = get_registry().names('crypto')
 
     # 환율
-    CURRENCIES = {
-        "KRW=X": "원/달러 환율",
-    }
+    CURRENCIES = get_registry().names('currencies')
 
     # S&P 100 종목 (5% 이상 변동 시 알림)
-    US_TOP_STOCKS = {
-        # Technology
-        "AAPL": "Apple",
-        "MSFT": "Microsoft",
-        "GOOGL": "Alphabet (Google)",
-        "NVDA": "NVIDIA",
-        "META": "Meta (Facebook)",
-        "AVGO": "Broadcom",
-        "CSCO": "Cisco",
-        "ADBE": "Adobe",
-        "CRM": "Salesforce",
-        "ORCL": "Oracle",
-        "ACN": "Accenture",
-        "IBM": "IBM",
-        "INTC": "Intel",
-        "AMD": "AMD",
-        "QCOM": "Qualcomm",
-        "TXN": "Texas Instruments",
-        # Consumer
-        "AMZN": "Amazon",
-        "TSLA": "Tesla",
-        "HD": "Home Depot",
-        "MCD": "McDonald's",
-        "NKE": "Nike",
-        "SBUX": "Starbucks",
-        "LOW": "Lowe's",
-        "TGT": "Target",
-        "COST": "Costco",
-        "WMT": "Walmart",
-        "PG": "Procter & Gamble",
-        "KO": "Coca-Cola",
-        "PEP": "PepsiCo",
-        "MDLZ": "Mondelez",
-        "CL": "Colgate-Palmolive",
-        "KHC": "Kraft Heinz",
-        # Communication
-        "NFLX": "Netflix",
-        "DIS": "Disney",
-        "CMCSA": "Comcast",
-        "CHTR": "Charter",
-        "T": "AT&T",
-        "VZ": "Verizon",
-        "TMUS": "T-Mobile",
-        # Healthcare
-        "UNH": "UnitedHealth",
-        "JNJ": "Johnson & Johnson",
-        "LLY": "Eli Lilly",
-        "MRK": "Merck",
-        "ABBV": "AbbVie",
-        "PFE": "Pfizer",
-        "TMO": "Thermo Fisher",
-        "ABT": "Abbott",
-        "DHR": "Danaher",
-        "BMY": "Bristol-Myers Squibb",
-        "AMGN": "Amgen",
-        "GILD": "Gilead Sciences",
-        "MDT": "Medtronic",
-        "CVS": "CVS Health",
-        # Financial
-        "BRK-B": "Berkshire Hathaway",
-        "JPM": "JPMorgan Chase",
-        "V": "Visa",
-        "MA": "Mastercard",
-        "BAC": "Bank of America",
-        "WFC": "Wells Fargo",
-        "GS": "Goldman Sachs",
-        "MS": "Morgan Stanley",
-        "C": "Citigroup",
-        "SCHW": "Charles Schwab",
-        "BLK": "BlackRock",
-        "AXP": "American Express",
-        "BK": "Bank of New York",
-        "USB": "U.S. Bancorp",
-        "COF": "Capital One",
-        "MET": "MetLife",
-        "AIG": "AIG",
-        "SPG": "Simon Property",
-        # Industrial
-        "BA": "Boeing",
-        "HON": "Honeywell",
-        "UNP": "Union Pacific",
-        "RTX": "Raytheon",
-        "CAT": "Caterpillar",
-        "GE": "GE Aerospace",
-        "LMT": "Lockheed Martin",
-        "GD": "General Dynamics",
-        "UPS": "UPS",
-        "FDX": "FedEx",
-        "EMR": "Emerson Electric",
-        "MMM": "3M",
-        # Energy
-        "XOM": "Exxon Mobil",
-        "CVX": "Chevron",
-        "COP": "ConocoPhillips",
-        # Utilities
-        "NEE": "NextEra Energy",
-        "DUK": "Duke Energy",
-        "SO": "Southern Company",
-        "EXC": "Exelon",
-        # Materials
-        "LIN": "Linde",
-        "DOW": "Dow",
-        # Real Estate
-        "AMT": "American Tower",
-        # Travel
-        "BKNG": "Booking Holdings",
-        # Auto
-        "GM": "General Motors",
-        "F": "Ford",
-        # Other
-        "PM": "Philip Morris",
-        "MO": "Altria",
-        "WBA": "Walgreens",
-    }
+    US_TOP_STOCKS = get_registry().names('sp100')
 
     # 3x 레버리지 ETF (5% 이상 변동 시 알림) - 인버스 제외
-    LEVERAGED_ETFS = {
-        # 주요 지수
-        "TQQQ": "ProShares UltraPro QQQ (나스닥 3배)",
-        "UPRO": "ProShares UltraPro S&P500 (S&P 3배)",
-        "TNA": "Direxion Small Cap Bull 3X (소형주 3배)",
-        # 섹터
-        "SOXL": "Direxion Semiconductor Bull 3X (반도체 3배)",
-        "TECL": "Direxion Technology Bull 3X (기술 3배)",
-        "FNGU": "MicroSectors FANG+ 3X (빅테크 3배)",
-        "BULZ": "MicroSectors FANG & Innovation 3X (혁신 3배)",
-        "WEBL": "Direxion Internet Bull 3X (인터넷 3배)",
-        "UBOT": "Direxion Robotics AI Bull 3X (로봇/AI 3배)",
-        "FAS": "Direxion Financial Bull 3X (금융 3배)",
-        "DPST": "Direxion Regional Banks Bull 3X (지방은행 3배)",
-        "LABU": "Direxion Biotech Bull 3X (바이오 3배)",
-        "CURE": "Direxion Healthcare Bull 3X (헬스케어 3배)",
-        "PILL": "Direxion Pharmaceutical Bull 3X (제약 3배)",
-        "NAIL": "Direxion Homebuilders Bull 3X (주택건설 3배)",
-        "DFEN": "Direxion Aerospace Bull 3X (방산/항공 3배)",
-        "DUSL": "Direxion Industrials Bull 3X (산업 3배)",
-        "TPOR": "Direxion Transportation Bull 3X (운송 3배)",
-        "RETL": "Direxion Retail Bull 3X (리테일 3배)",
-        "WANT": "Direxion Consumer Bull 3X (소비재 3배)",
-        "DRN": "Direxion Real Estate Bull 3X (부동산 3배)",
-        "UTSL": "Direxion Utilities Bull 3X (유틸리티 3배)",
-        # 에너지/원자재
-        "ERX": "Direxion Energy Bull 3X (에너지 3배)",
-        "GUSH": "Direxion Oil & Gas Bull 3X (석유/가스 3배)",
-        "NUGT": "Direxion Gold Miners Bull 3X (금광주 3배)",
-        # 채권
-        "TMF": "Direxion Treasury Bull 3X (장기국채 3배)",
-        "TYD": "Direxion 7-10Y Treasury Bull 3X (중기국채 3배)",
-    }
+    LEVERAGED_ETFS = get_registry().names('leveraged_3x')
 
     # 변동률 임계값
     INDEX_THRESHOLD = 2.0    # 지수 및 암호화폐: 2%
@@ -205,15 +110,24 @@ class StockMonitor:
         self._headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        # 시세 데이터 소스 (테스트 시 로컬 대체 소스로 교체 가능)
+        self.quotes = self._build_quote_aggregator()
+        # 암호화폐 웹소켓 스트림 (연결돼 있으면 REST 대신 스트림 시세 사용)
+        self.crypto_stream = None
 
-    def get_kospi_realtime(self) -> Optional[Tuple[float, float]]:
-        """네이버 금융 API로 코스피 실시간 데이터 가져오기"""
+    def get_naver_index_realtime(self, code: str) -> Optional[Tuple[float, float]]:
+        """
+        네이버 금융 API로 국내 지수 실시간 데이터 가져오기
+
+        Args:
+            code: 네이버 지수 코드 (KOSPI, KOSDAQ)
+        """
         try:
-            url = 'https://m.stock.naver.com/api/index/KOSPI/basic'
-            response = requests.get(url, headers=self._headers, timeout=10)
+            url = f'https://m.stock.naver.com/api/index/{code}/basic'
+            response = http_get(url, headers=self._headers, timeout=10)
 
             if response.status_code != 200:
-                logger.warning(f"코스피: 네이버 API 오류 ({response.status_code})")
+                logger.warning(f"{code}: 네이버 API 오류 ({response.status_code})")
                 return None
 
             data = response.json()
@@ -222,111 +136,123 @@ class StockMonitor:
             previous_close = current_price - change
 
             if current_price and previous_close:
-                logger.debug(f"코스피(네이버): 현재가 {current_price}, 전일종가 {previous_close}")
+                logger.debug(f"{code}(네이버): 현재가 {current_price}, 전일종가 {previous_close}")
                 return (current_price, previous_close)
 
             return None
         except Exception as e:
-            logger.error(f"코스피 네이버 API 오류: {e}")
+            logger.error(f"{code} 네이버 API 오류: {e}")
             return None
 
+    def get_kospi_realtime(self) -> Optional[Tuple[float, float]]:
+        """네이버 금융 API로 코스피 실시간 데이터 가져오기"""
+        return self.get_naver_index_realtime('KOSPI')
+
     def get_kosdaq_realtime(self) -> Optional[Tuple[float, float]]:
         """네이버 금융 API로 코스닥 실시간 데이터 가져오기"""
-        try:
-            url = 'https://m.stock.naver.com/api/index/KOSDAQ/basic'
-            response = requests.get(url, headers=self._headers, timeout=10)
-
-            if response.status_code != 200:
-                logger.warning(f"코스닥: 네이버 API 오류 ({response.status_code})")
-                return None
-
-            data = response.json()
-            current_price = float(data.get('closePrice', '0').replace(',', ''))
-            change = float(data.get('compareToPreviousClosePrice', '0').replace(',', ''))
-            previous_close = current_price - change
-
-            if current_price and previous_close:
-                logger.debug(f"코스닥(네이버): 현재가 {current_price}, 전일종가 {previous_close}")
-                return (current_price, previous_close)
-
-            return None
-        except Exception as e:
-            logger.error(f"코스닥 네이버 API 오류: {e}")
-            return None
+        return self.get_naver_index_realtime('KOSDAQ')
 
     def get_bitcoin_realtime(self) -> Optional[Tuple[float, float]]:
+        """Binance API로 비트코인 실시간 데이터 가져오기"""
+        return self.get_binance_realtime('BTCUSDT')
+
+    def get_binance_realtime(self, pair: str) -> Optional[Tuple[float, float]]:
         """
-        Binance API로 비트코인 실시간 데이터 가져오기
+        Binance API로 암호화폐 실시간 데이터 가져오기
         - UTC 00:00 (한국시간 09:00) 기준 당일 시가 대비 변동률 계산
         - 당일 시가 = 전일 종가
+
+        Args:
+            pair: Binance 심볼 (예: BTCUSDT)
         """
         try:
             # 1. 현재가 조회
-            ticker_url = 'https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT'
-            ticker_resp = requests.get(ticker_url, timeout=10)
+            ticker_url = f'https://api.binance.com/api/v3/ticker/price?symbol={pair}'
+            ticker_resp = http_get(ticker_url, timeout=10)
 
             if ticker_resp.status_code != 200:
-                logger.warning(f"비트코인: Binance ticker API 오류 ({ticker_resp.status_code})")
+                logger.warning(f"{pair}: Binance ticker API 오류 ({ticker_resp.status_code})")
                 return None
 
             current_price = float(ticker_resp.json().get('price', 0))
 
             # 2. 일별 캔들 데이터로 당일 시가 조회 (UTC 00:00 기준)
-            klines_url = 'https://api.binance.com/api/v3/klines?symbol=BTCUSDT&interval=1d&limit=1'
-            klines_resp = requests.get(klines_url, timeout=10)
+            klines_url = f'https://api.binance.com/api/v3/klines?symbol={pair}&interval=1d&limit=1'
+            klines_resp = http_get(klines_url, timeout=10)
 
             if klines_resp.status_code != 200:
-                logger.warning(f"비트코인: Binance klines API 오류 ({klines_resp.status_code})")
+                logger.warning(f"{pair}: Binance klines API 오류 ({klines_resp.status_code})")
                 return None
 
             klines = klines_resp.json()
             if not klines:
-                logger.warning("비트코인: klines 데이터 없음")
+                logger.warning(f"{pair}: klines 데이터 없음")
                 return None
 
             # klines format: [open_time, open, high, low, close, volume, ...]
             today_open = float(klines[0][1])  # 당일 시가 (= 전일 종가)
 
             if current_price and today_open:
-                logger.debug(f"비트코인(Binance): 현재가 {current_price}, 당일시가 {today_open}")
+                logger.debug(f"{pair}(Binance): 현재가 {current_price}, 당일시가 {today_open}")
                 return (current_price, today_open)
 
             return None
         except Exception as e:
-            logger.error(f"비트코인 Binance API 오류: {e}")
+            logger.error(f"{pair} Binance API 오류: {e}")
             return None
 
     def get_price_data(self, symbol: str) -> Optional[Tuple[float, float]]:
         """
-        주가 데이터 가져오기
-        - 코스피: 네이버 금융 API (실시간)
-        - 비트코인: Binance API (실시간)
-        - 기타: Yahoo Finance API
+        주가 데이터 가져오기 (여러 데이터 소스 중 가장 빠른 유효 응답)
+        - 코스피/코스닥: 네이버 금융 API (실시간) → Yahoo 폴백
+        - 비트코인: Binance 웹소켓 스트림 (최신일 때) → Binance REST API → Yahoo 폴백
+        - 기타: Yahoo Finance API (query1 → query2)
+        - 1순위가 평소 응답 시간(p95) 안에 답하지 않으면 다음 소스에 동시 요청 (quote_providers)
 
         Returns:
             (현재가, 전일종가) 또는 None
         """
-        # 코스피는 네이버 실시간 데이터 사용
-        if symbol == "^KS11":
-            return self.get_kospi_realtime()
-
-        # 코스닥은 네이버 실시간 데이터 사용
-        if symbol == "^KQ11":
-            return self.get_kosdaq_realtime()
-
-        # 비트코인은 Binance 실시간 데이터 사용
-        if symbol == "BTC-USD":
-            return self.get_bitcoin_realtime()
+        if self.crypto_stream is not None:
+            quote = self.crypto_stream.quote(symbol)
+            if quote is not None:
+                return quote
+        return self.quotes.fetch(symbol)
+
+    def quote_sources(self, symbol: str) -> List[str]:
+        """심볼별 데이터 소스 후보 (레지스트리 provider 우선, Yahoo 미러 폴백)"""
+        info = get_registry().info(symbol)
+        primary = info.provider if info else 'yahoo'
+        return list(dict.fromkeys([primary, 'yahoo', 'yahoo2']))
+
+    def _build_quote_aggregator(self) -> QuoteAggregator:
+        """기본 데이터 소스 구성"""
+        def provider_symbol(symbol: str) -> str:
+            info = get_registry().info(symbol)
+            return info.provider_symbol if info else symbol
+
+        return QuoteAggregator([
+            QuoteProvider('naver', lambda symbol: self.get_naver_index_realtime(provider_symbol(symbol))),
+            QuoteProvider('binance', lambda symbol: self.get_binance_realtime(provider_symbol(symbol))),
+            QuoteProvider('yahoo', self.get_yahoo_price_data),
+            QuoteProvider('yahoo2', lambda symbol: self.get_yahoo_price_data(symbol, YAHOO_FALLBACK_HOST)),
+        ], routes=self.quote_sources)
+
+    def get_yahoo_price_data(self, symbol: str, host: str = YAHOO_HOST) -> Optional[Tuple[float, float]]:
+        """
+        Yahoo Finance Chart API v8 시세 (시장 상태별 현재가/전일종가)
 
+        Args:
+            host: query1 또는 query2 (같은 API의 미러)
+        """
         try:
             # Yahoo Finance Chart API v8
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+            url = f"https://{host}/v8/finance/chart/{symbol}"
             params = {
                 "interval": "1d",
                 "range": "5d"  # 5일 데이터로 확장 (휴일 대비)
             }
 
-            response = requests.get(url, params=params, headers=self._headers, timeout=10)
+            response = http_get(url, params=params, headers=self._headers, timeout=10)
 
             if response.status_code != 200:
                 logger.warning(f"{symbol}: API 응답 오류 ({response.status_code})")
@@ -389,6 +315,9 @@ class StockMonitor:
             logger.warning(f"{symbol}: 가격 데이터 불완전 (current={current_price}, prev={previous_close})")
             return None
 
+        except CircuitOpenError as e:
+            logger.debug(f"{symbol} 조회 생략: {e}")
+            return None
         except requests.RequestException as e:
             logger.error(f"{symbol} 요청 오류: {e}")
             return None
@@ -396,21 +325,84 @@ class StockMonitor:
             logger.error(f"{symbol} 데이터 조회 오류: {e}")
             return None
 
+    def get_daily_chart(self, symbol: str, period: str = "1y") -> Optional[Dict]:
+        """
+        Yahoo Finance 일봉 차트 (장 마감 스냅샷용)
+
+        Args:
+            period: 조회 기간 (1d, 5d, 1y, 3y ...)
+
+        Returns:
+            {'timestamps': [...], 'closes': [...], 'meta': {...}} 또는 None
+        """
+        try:
+            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+            params = {"interval": "1d", "range": period}
+
+            response = http_get(url, params=params, headers=self._headers, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"{symbol}: 차트 API 응답 오류 ({response.status_code})")
+                return None
+
+            result = response.json().get("chart", {}).get("result", [])
+            if not result:
+                return None
+
+            quotes = result[0].get("indicators", {}).get("quote", [{}])[0]
+            return {
+                'timestamps': result[0].get("timestamp", []) or [],
+                'closes': quotes.get("close", []) or [],
+                'meta': result[0].get("meta", {}),
+            }
+
+        except Exception as e:
+            logger.error(f"{symbol} 차트 조회 오류: {e}")
+            return None
+
+    def get_quote_meta(self, symbol: str) -> Optional[Dict]:
+        """
+        Yahoo Finance 시세 메타데이터 (marketState, regularMarketTime 등)
+
+        Returns:
+            meta 딕셔너리 또는 None
+        """
+        chart = self.get_daily_chart(symbol, "1d")
+        return chart['meta'] if chart else None
+
     def calculate_change_percent(self, current: float, previous: float) -> float:
         """변동률 계산"""
         if previous == 0:
             return 0.0
         return ((current - previous) / previous) * 100
 
-    def check_symbols(self, symbols_dict: Dict[str, str], category: str, threshold: float) -> List[PriceChange]:
+    def take_snapshot(self, symbols: Iterable[str]) -> QuoteSnapshot:
+        """
+        심볼 목록을 한 번씩만 조회해서 스냅샷 생성
+        - 동시에 조회하되 실제 요청 속도/동시성은 공용 HTTP 클라이언트의 호스트별 제한을 따름
+        """
+        snapshot = QuoteSnapshot()
+        unique = list(dict.fromkeys(symbols))
+        with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as pool:
+            for symbol, price_data in zip(unique, pool.map(self.get_price_data, unique)):
+                snapshot.put(symbol, price_data)
+        return snapshot
+
+    def check_symbols(self, symbols_dict: Dict[str, str], category: str, threshold: float,
+                      snapshot: Optional[QuoteSnapshot] = None) -> List[PriceChange]:
         """
         종목 체크 (임계값 초과 시 알림 대상 반환)
         중복 알림 방지는 scheduler.py에서 처리
+
+        Args:
+            snapshot: 주어지면 스냅샷 값 사용 (네트워크 조회 없음)
         """
         alerts = []
 
         for symbol, name in symbols_dict.items():
-            price_data = self.get_price_data(symbol)
+            if snapshot is not None:
+                price_data = snapshot.get(symbol)
+            else:
+                price_data = self.get_price_data(symbol)
             if price_data:
                 current, previous = price_data
                 change = self.calculate_change_percent(current, previous)
@@ -427,95 +419,82 @@ class StockMonitor:
 
         return alerts
 
+    def check_groups(self, groups: List[WatchGroup], snapshot: Optional[QuoteSnapshot] = None) -> List[PriceChange]:
+        """감시 그룹 전체 체크 (변동률 절대값 기준 정렬)"""
+        all_alerts = []
+        for group in groups:
+            all_alerts.extend(self.check_symbols(group.symbols, group.category, group.threshold, snapshot))
+
+        all_alerts.sort(key=lambda x: abs(x.change_percent), reverse=True)
+        return all_alerts
+
     def is_us_market_hours(self) -> bool:
         """
-        미국장 거래 시간인지 확인 (한국시간 기준, 프리마켓/애프터마켓 포함)
-        - 프리마켓: 18:00 ~ 23:30 (썸머타임 시 17:00 ~ 22:30)
-        - 정규장: 23:30 ~ 06:00 (썸머타임 시 22:30 ~ 05:00)
-        - 애프터마켓: 06:00 ~ 08:00 (썸머타임 시 05:00 ~ 07:00)
-        - 통합: 18:00 ~ 08:00 (다음날)
+        미국장 거래 시간인지 확인 (프리마켓/애프터마켓 포함, 세션 캘린더 기준)
+        - 프리마켓: 04:00 ~ 09:30 ET
+        - 정규장: 09:30 ~ 16:00 ET (조기 마감일 13:00)
+        - 애프터마켓: 16:00 ~ 20:00 ET
+        - 휴장일/주말은 닫힘
         """
-        now = datetime.now()
-        hour = now.hour
-
-        # 한국시간 18:00 ~ 08:00 (프리마켓 + 정규장 + 애프터마켓)
-        if hour >= 18 or hour < 8:
-            return True
-
-        return False
+        return is_market_open('US', extended=True)
 
     def is_kr_market_hours(self) -> bool:
-        """한국장 거래 시간인지 확인 (09:00 ~ 15:30)"""
-        now = datetime.now()
-        hour = now.hour
-        minute = now.minute
-
-        if hour < 9 or (hour == 15 and minute > 30) or hour > 15:
-            return False
-        return True
+        """한국장 거래 시간인지 확인 (09:00 ~ 15:30, 휴장일 제외)"""
+        return is_market_open('KR')
 
     def is_weekend(self) -> bool:
         """주말인지 확인"""
         return datetime.now().weekday() >= 5  # 토(5), 일(6)
 
-    def check_weekend(self) -> List[PriceChange]:
+    def get_weekend_groups(self) -> List[WatchGroup]:
         """
-        주말 전용 체크 (나스닥 선물 + 비트코인만)
+        주말 전용 감시 그룹 (나스닥 선물 + 비트코인만)
         - 나스닥 선물: 주말에도 일부 시간 거래
         - 비트코인: 24/7 거래
         """
-        all_alerts = []
-        logger.info("주말 모드: 나스닥 선물 + 비트코인만 체크")
-
-        # 나스닥 선물
-        nq_futures = {"NQ=F": self.INDICES["NQ=F"]}
-        all_alerts.extend(self.check_symbols(nq_futures, 'index', self.INDEX_THRESHOLD))
-
-        # 비트코인
-        all_alerts.extend(self.check_symbols(self.CRYPTO, 'crypto', self.INDEX_THRESHOLD))
+        return [
+            WatchGroup({"NQ=F": self.INDICES["NQ=F"]}, 'index', self.INDEX_THRESHOLD),
+            WatchGroup(self.CRYPTO, 'crypto', self.INDEX_THRESHOLD),
+        ]
 
-        all_alerts.sort(key=lambda x: abs(x.change_percent), reverse=True)
-        logger.info(f"주말 체크: {len(all_alerts)}개 알림 항목 발견")
-        return all_alerts
-
-    def check_all(self) -> List[PriceChange]:
-        """모든 항목 체크 (장 운영 시간에 따라 필터링)"""
-        all_alerts = []
+    def get_watch_groups(self) -> List[WatchGroup]:
+        """현재 장 운영 시간에 감시할 그룹 (닫힌 시장의 종목은 통째로 제외)"""
+        groups = []
 
         kr_market_open = self.is_kr_market_hours()
         us_market_open = self.is_us_market_hours()
 
         logger.info(f"시장 상태 - 한국장: {'열림' if kr_market_open else '닫힘'}, 미국장: {'열림' if us_market_open else '닫힘'}")
 
+        registry = get_registry()
+        kr_indices = {k: v for k, v in self.INDICES.items() if registry.info(k).market == 'KR'}
+        us_indices = {k: v for k, v in self.INDICES.items() if k not in kr_indices}
+
         # 코스피/코스닥은 한국장 시간에만 체크
         if kr_market_open:
-            kr_indices = {
-                "^KS11": self.INDICES["^KS11"],
-                "^KQ11": self.INDICES["^KQ11"],
-            }
-            kr_alerts = self.check_symbols(kr_indices, 'index', self.INDEX_THRESHOLD)
-            all_alerts.extend(kr_alerts)
+            groups.append(WatchGroup(kr_indices, 'index', self.INDEX_THRESHOLD))
 
-        # 미국 지수는 미국장 시간에만 체크
+        # 미국 지수/개별주/레버리지 ETF는 미국장 시간에만 체크
         if us_market_open:
-            us_indices = {k: v for k, v in self.INDICES.items() if k not in ("^KS11", "^KQ11")}
-            all_alerts.extend(self.check_symbols(us_indices, 'index', self.INDEX_THRESHOLD))
-
-            # 개별주 (10% 기준) - 미국장 시간에만
-            logger.info("개별주 변동 체크 중...")
-            all_alerts.extend(self.check_symbols(self.US_TOP_STOCKS, 'stock', self.STOCK_THRESHOLD))
-
-            # 레버리지 ETF (10% 기준) - 미국장 시간에만
-            logger.info("레버리지 ETF 변동 체크 중...")
-            all_alerts.extend(self.check_symbols(self.LEVERAGED_ETFS, 'etf', self.STOCK_THRESHOLD))
+            groups.append(WatchGroup(us_indices, 'index', self.INDEX_THRESHOLD))
+            groups.append(WatchGroup(self.US_TOP_STOCKS, 'stock', self.STOCK_THRESHOLD))
+            groups.append(WatchGroup(self.LEVERAGED_ETFS, 'etf', self.STOCK_THRESHOLD))
 
         # 암호화폐는 24시간 체크
-        logger.info("암호화폐 변동 체크 중...")
-        all_alerts.extend(self.check_symbols(self.CRYPTO, 'crypto', self.INDEX_THRESHOLD))
+        groups.append(WatchGroup(self.CRYPTO, 'crypto', self.INDEX_THRESHOLD))
 
-        # 변동률 절대값 기준으로 정렬
-        all_alerts.sort(key=lambda x: abs(x.change_percent), reverse=True)
+        return groups
+
+    def check_weekend(self, snapshot: Optional[QuoteSnapshot] = None) -> List[PriceChange]:
+        """주말 전용 체크 (나스닥 선물 + 비트코인만)"""
+        logger.info("주말 모드: 나스닥 선물 + 비트코인만 체크")
+        all_alerts = self.check_groups(self.get_weekend_groups(), snapshot)
+        logger.info(f"주말 체크: {len(all_alerts)}개 알림 항목 발견")
+        return all_alerts
 
+    def check_all(self, snapshot: Optional[QuoteSnapshot] = None) -> List[PriceChange]:
+        """모든 항목 체크 (장 운영 시간에 따라 필터링)"""
+        all_alerts = self.check_groups(self.get_watch_groups(), snapshot)
         logger.info(f"총 {len(all_alerts)}개 알림 항목 발견")
         return all_alerts
 
@@ -0,0 +1,169 @@
+"""
+종목 레지스트리 모듈
+
+- data/symbols.json 에서 전체 감시 종목을 한 번만 로드
+- 심볼마다 고정된 정수 ID 부여 (0 ~ N-1, 파일 순서)
+- 유니버스(감시 목록)별 멤버십을 비트맵(int)으로 보관
+- 캐시/스냅샷/중복 방지 상태는 ID로 배열 인덱싱해서 사용
+"""
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# 종목 데이터 파일
+SYMBOLS_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'symbols.json')
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """종목 메타데이터"""
+    id: int
+    symbol: str
+    name: str
+    short_name: str
+    category: str   # 'index', 'crypto', 'currency', 'stock', 'etf'
+    sector: str
+    market: str     # 'US', 'KR', 'CRYPTO', 'FX'
+    provider: str   # 'yahoo', 'naver', 'binance'
+    provider_symbol: str  # 데이터 소스에서 쓰는 심볼 (예: KOSPI, BTCUSDT)
+    aliases: Tuple[str, ...] = ()  # 뉴스 매칭용 별칭 (예: 애플, Google)
+
+
+SymbolKey = Union[int, str]
+
+
+class SymbolRegistry:
+    """심볼 ↔ 정수 ID 매핑 및 유니버스 비트맵"""
+
+    def __init__(self, entries: List[Dict], universes: Dict[str, List[str]]):
+        self._infos: List[SymbolInfo] = []
+        self._ids: Dict[str, int] = {}
+
+        for entry in entries:
+            symbol = sys.intern(entry['symbol'])
+            if symbol in self._ids:
+                raise ValueError(f"중복 심볼: {symbol}")
+
+            sid = len(self._infos)
+            self._ids[symbol] = sid
+            self._infos.append(SymbolInfo(
+                id=sid,
+                symbol=symbol,
+                name=entry.get('name', symbol),
+                short_name=entry.get('short_name') or entry.get('name', symbol),
+                category=entry.get('category', 'stock'),
+                sector=entry.get('sector', ''),
+                market=entry.get('market', 'US'),
+                provider=entry.get('provider', 'yahoo'),
+                provider_symbol=entry.get('provider_symbol') or symbol,
+                aliases=tuple(entry.get('aliases', ())),
+            ))
+
+        # 유니버스: 순서 있는 ID 목록 + 멤버십 비트맵
+        self._universe_ids: Dict[str, Tuple[int, ...]] = {}
+        self._universe_masks: Dict[str, int] = {}
+        for universe, symbols in universes.items():
+            ids = []
+            mask = 0
+            for symbol in symbols:
+                sid = self._ids.get(symbol)
+                if sid is None:
+                    raise ValueError(f"유니버스 {universe}: 등록되지 않은 심볼 {symbol}")
+                if not mask >> sid & 1:
+                    ids.append(sid)
+                    mask |= 1 << sid
+            self._universe_ids[universe] = tuple(ids)
+            self._universe_masks[universe] = mask
+
+    @classmethod
+    def load(cls, path: str = SYMBOLS_FILE) -> 'SymbolRegistry':
+        """JSON 파일에서 레지스트리 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        registry = cls(data.get('symbols', []), data.get('universes', {}))
+        logger.info(f"종목 레지스트리 로드: {len(registry)}개 심볼, {len(registry.universes())}개 유니버스")
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def id_of(self, symbol: str) -> Optional[int]:
+        """심볼 → ID (미등록이면 None)"""
+        return self._ids.get(symbol)
+
+    def symbol_of(self, sid: int) -> str:
+        """ID → 심볼"""
+        return self._infos[sid].symbol
+
+    def info(self, key: SymbolKey) -> Optional[SymbolInfo]:
+        """심볼 또는 ID로 메타데이터 조회"""
+        if isinstance(key, int):
+            return self._infos[key] if 0 <= key < len(self._infos) else None
+        sid = self._ids.get(key)
+        return self._infos[sid] if sid is not None else None
+
+    def universes(self) -> List[str]:
+        """등록된 유니버스 이름 목록"""
+        return list(self._universe_ids.keys())
+
+    def universe_ids(self, universe: str) -> Tuple[int, ...]:
+        """유니버스에 속한 ID 목록 (파일에 적힌 순서)"""
+        return self._universe_ids.get(universe, ())
+
+    def universe_mask(self, *universes: str) -> int:
+        """여러 유니버스의 합집합 비트맵"""
+        mask = 0
+        for universe in universes:
+            mask |= self._universe_masks.get(universe, 0)
+        return mask
+
+    def in_universe(self, key: SymbolKey, universe: str) -> bool:
+        """해당 유니버스 소속 여부 (비트 연산 O(1))"""
+        sid = key if isinstance(key, int) else self._ids.get(key)
+        if sid is None:
+            return False
+        return bool(self._universe_masks.get(universe, 0) >> sid & 1)
+
+    def ids_in_mask(self, mask: int) -> List[int]:
+        """비트맵에 켜진 ID 목록 (오름차순)"""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+    def symbols(self, universe: str) -> List[str]:
+        """유니버스의 심볼 목록"""
+        return [self._infos[sid].symbol for sid in self.universe_ids(universe)]
+
+    def names(self, universe: str, short: bool = False) -> Dict[str, str]:
+        """유니버스의 {심볼: 이름} 딕셔너리 (기존 모듈 상수 호환용)"""
+        result = {}
+        for sid in self.universe_ids(universe):
+            info = self._infos[sid]
+            result[info.symbol] = info.short_name if short else info.name
+        return result
+
+    def new_array(self, fill=None) -> list:
+        """ID로 인덱싱하는 상태 배열 생성"""
+        return [fill] * len(self._infos)
+
+
+_registry: Optional[SymbolRegistry] = None
+
+
+def get_registry() -> SymbolRegistry:
+    """프로세스 전역 레지스트리 (최초 호출 시 로드)"""
+    global _registry
+    if _registry is None:
+        _registry = SymbolRegistry.load()
+    return _registry
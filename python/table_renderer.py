@@ -0,0 +1,139 @@
+"""
+테이블 이미지 렌더러 (Pillow)
+
+- ETF / 배당 테이블 전용 - pandas / matplotlib 없이 Pillow 텍스트 그리기로 PNG 생성
+- 레이아웃: 제목 (가운데, 굵게) + 헤더 행 (파란 배경, 흰 굵은 글씨) + 교대 색상 행, 셀 가운데 정렬
+- 열 너비는 내용 폭에 맞춤 (최소 너비 지정 가능)
+- 폰트 / 글자 폭은 캐시 (같은 문자열 폭을 여러 번 재지 않음)
+"""
+import io
+import logging
+import os
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# 폰트 후보 (시스템 DejaVu → matplotlib 동봉 DejaVu 순)
+FONT_DIRS = [
+    '/usr/share/fonts/truetype/dejavu',
+    '/usr/share/fonts/dejavu',
+]
+FONT_FILES = {False: 'DejaVuSans.ttf', True: 'DejaVuSans-Bold.ttf'}
+
+# 크기 (픽셀)
+FONT_SIZE = 16
+TITLE_FONT_SIZE = 24
+ROW_HEIGHT = 36
+CELL_PADDING = 18
+MARGIN = 24
+TITLE_GAP = 16
+
+# 색상 (기존 matplotlib 테이블과 같은 색)
+BACKGROUND = '#FFFFFF'
+HEADER_COLOR = '#4472C4'
+HEADER_TEXT = '#FFFFFF'
+ROW_COLORS = ('#F2F2F2', '#E7E6E6')
+TEXT_COLOR = '#000000'
+GRID_COLOR = '#000000'
+HIGHLIGHT_TEXT = '#C00000'
+
+
+def _font_path(bold: bool) -> Optional[str]:
+    dirs = list(FONT_DIRS)
+    try:
+        import matplotlib
+        dirs.append(os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf'))
+    except ImportError:
+        pass
+    for directory in dirs:
+        path = os.path.join(directory, FONT_FILES[bold])
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """폰트 로드 (크기/굵기별 한 번)"""
+    path = _font_path(bold)
+    if path is None:
+        logger.warning("DejaVu 폰트를 찾지 못함 - 기본 폰트 사용")
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=4096)
+def text_width(text: str, size: int, bold: bool = False) -> int:
+    """문자열 폭 (픽셀)"""
+    return int(round(get_font(size, bold).getlength(text)))
+
+
+def render_table(columns: Sequence[str], rows: Sequence[Sequence[str]], title: str,
+                 min_widths: Sequence[int] = None, highlight_rows: Sequence[int] = ()) -> bytes:
+    """
+    테이블 PNG
+
+    Args:
+        columns: 헤더
+        rows: 셀 문자열 행 목록
+        title: 위쪽 제목
+        min_widths: 열별 최소 너비 (픽셀)
+        highlight_rows: 강조할 행 번호 (0부터, 글자를 빨간색으로)
+
+    Returns:
+        PNG 바이트
+    """
+    # 열 너비 = 헤더/셀 중 가장 긴 글자 폭 + 여백
+    widths: List[int] = []
+    for j, column in enumerate(columns):
+        width = text_width(column, FONT_SIZE, True)
+        for row in rows:
+            width = max(width, text_width(str(row[j]), FONT_SIZE))
+        width += CELL_PADDING * 2
+        if min_widths is not None:
+            width = max(width, min_widths[j])
+        widths.append(width)
+
+    title_height = TITLE_FONT_SIZE + TITLE_GAP
+    table_width = sum(widths)
+    image_width = max(table_width, text_width(title, TITLE_FONT_SIZE, True)) + MARGIN * 2
+    image_height = MARGIN * 2 + title_height + ROW_HEIGHT * (len(rows) + 1)
+
+    image = Image.new('RGB', (image_width, image_height), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+
+    # 제목
+    draw.text((image_width // 2, MARGIN), title, font=get_font(TITLE_FONT_SIZE, True), fill=TEXT_COLOR, anchor='mt')
+
+    left = (image_width - table_width) // 2
+    top = MARGIN + title_height
+    highlight = set(highlight_rows)
+    cells = [(columns, HEADER_COLOR, HEADER_TEXT, True)]
+    for i, row in enumerate(rows):
+        cells.append((row, ROW_COLORS[i % 2], HIGHLIGHT_TEXT if i in highlight else TEXT_COLOR, False))
+
+    for r, (values, fill, text_color, bold) in enumerate(cells):
+        y = top + r * ROW_HEIGHT
+        draw.rectangle([left, y, left + table_width, y + ROW_HEIGHT], fill=fill)
+        x = left
+        font = get_font(FONT_SIZE, bold)
+        for value, width in zip(values, widths):
+            draw.text((x + width // 2, y + ROW_HEIGHT // 2), str(value), font=font, fill=text_color, anchor='mm')
+            x += width
+
+    # 격자
+    bottom = top + ROW_HEIGHT * len(cells)
+    for r in range(len(cells) + 1):
+        y = top + r * ROW_HEIGHT
+        draw.line([left, y, left + table_width, y], fill=GRID_COLOR)
+    x = left
+    for width in [0] + widths:
+        x += width
+        draw.line([x, top, x, bottom], fill=GRID_COLOR)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
@@ -1,10 +1,13 @@
 """
 텔레그램 봇 메인 모듈
 """
+import asyncio
+import io
 import logging
 from telegram import Bot
 from telegram.error import TelegramError
 from config import TELEGRAM_BOT_TOKEN, CHANNEL_ID
+from image_encoder import encode_image
 
 # 로깅 설정
 logging.basicConfig(
@@ -76,13 +79,14 @@ class NewsChannelBot:
             logger.error(f"사진 전송 오류: {e}")
             return False
 
-    async def send_photo_buffer(self, photo_buffer, caption: str = "") -> bool:
+    async def send_photo_buffer(self, photo_buffer, caption: str = "", kind: str = "auto") -> bool:
         """
-        이미지 버퍼로 사진 전송
+        이미지 버퍼로 사진 전송 (업로드 전 포맷 선택 + 메타데이터 제거 + 바이트 예산 적용)
 
         Args:
             photo_buffer: BytesIO 이미지 버퍼
             caption: 캡션 (선택)
+            kind: 이미지 종류 - 'graphic'(차트/테이블/게이지), 'photo'(페이지 캡처), 'auto'(색 수로 판단)
 
         Returns:
             성공 여부
@@ -90,10 +94,20 @@ class NewsChannelBot:
         try:
             from telegram import InputFile
 
+            # 인코딩은 CPU 작업이라 스레드에서 (실패하면 원본 그대로 전송)
             photo_buffer.seek(0)
+            original = photo_buffer.read()
+            try:
+                loop = asyncio.get_event_loop()
+                data, ext = await loop.run_in_executor(None, encode_image, original, kind)
+                logger.info(f"이미지 인코딩: {len(original) // 1024}KB → {len(data) // 1024}KB ({ext})")
+            except Exception as e:
+                logger.warning(f"이미지 인코딩 실패 - 원본 전송: {e}")
+                data, ext = original, "png"
+
             await self.bot.send_photo(
                 chat_id=self.channel_id,
-                photo=InputFile(photo_buffer, filename="chart.png"),
+                photo=InputFile(io.BytesIO(data), filename=f"image.{ext}"),
                 caption=caption,
                 parse_mode="HTML"
             )
@@ -12,7 +12,8 @@ import os
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import requests
+import pytz
+from http_client import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,8 @@ class TqBusTracker:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.trades: List[Trade] = []
+        # (미국 날짜, 확정 종가 리스트) - 실시간 알림용 캐시
+        self._completed_closes: Optional[Tuple[str, List[float]]] = None
         self._load_trades()
 
     def _load_trades(self):
@@ -92,7 +95,7 @@ class TqBusTracker:
                 "range": "3y"  # 3년 데이터 (193일 SMA 정확한 계산용)
             }
 
-            response = requests.get(url, params=params, headers=self._headers, timeout=15)
+            response = http_get(url, params=params, headers=self._headers, timeout=15)
 
             if response.status_code != 200:
                 logger.error(f"TQQQ API 오류: {response.status_code}")
@@ -161,14 +164,17 @@ class TqBusTracker:
                 sma_series.append(sma)
         return sma_series
 
-    def find_last_entry_point(self) -> Optional[Dict]:
+    def find_last_entry_point(self, data: Optional[Tuple[List[float], List[int], float]] = None) -> Optional[Dict]:
         """
         마지막 승차 시점 찾기 (193 이평선 상향 돌파 지점)
 
+        Args:
+            data: 미리 조회한 get_tqqq_data() 결과 (없으면 직접 조회)
+
         Returns:
             {'date': 승차일, 'price': 승차가격} 또는 None
         """
-        result = self.get_tqqq_data()
+        result = data or self.get_tqqq_data()
         if not result:
             return None
 
@@ -214,23 +220,8 @@ class TqBusTracker:
             'price': round(entry_price, 2)
         }
 
-    def get_current_status(self) -> Optional[TqBusData]:
-        """
-        현재 TQ버스 상태 조회
-
-        Returns:
-            TqBusData 객체
-        """
-        result = self.get_tqqq_data()
-        if not result:
-            return None
-
-        closes, timestamps, current_price = result
-
-        sma = self.calculate_sma(closes, self.SMA_PERIOD)
-        if sma is None:
-            return None
-
+    def _make_status(self, current_price: float, sma: float) -> TqBusData:
+        """현재가/SMA로 TqBusData 생성 (포지션, 시그널, 이평선 대비 차이)"""
         # 현재 포지션 결정
         position = 'TQQQ' if current_price > sma else 'CASH'
 
@@ -259,6 +250,67 @@ class TqBusTracker:
             diff_percent=round(diff_percent, 2)
         )
 
+    def get_current_status(self, data: Optional[Tuple[List[float], List[int], float]] = None) -> Optional[TqBusData]:
+        """
+        현재 TQ버스 상태 조회
+
+        Args:
+            data: 미리 조회한 get_tqqq_data() 결과 (없으면 직접 조회)
+
+        Returns:
+            TqBusData 객체
+        """
+        result = data or self.get_tqqq_data()
+        if not result:
+            return None
+
+        closes, timestamps, current_price = result
+
+        sma = self.calculate_sma(closes, self.SMA_PERIOD)
+        if sma is None:
+            return None
+
+        return self._make_status(current_price, sma)
+
+    def _get_completed_closes(self) -> Optional[List[float]]:
+        """
+        미국 동부시간 기준 오늘 이전에 확정된 종가 리스트
+        (미국 날짜가 바뀔 때만 3년 데이터를 다시 조회)
+        """
+        us_eastern = pytz.timezone('America/New_York')
+        us_today = datetime.now(us_eastern).strftime('%Y-%m-%d')
+
+        if self._completed_closes and self._completed_closes[0] == us_today:
+            return self._completed_closes[1]
+
+        result = self.get_tqqq_data()
+        if not result:
+            return None
+
+        closes, timestamps, _ = result
+        completed = [
+            c for c, ts in zip(closes, timestamps)
+            if datetime.fromtimestamp(ts, us_eastern).strftime('%Y-%m-%d') < us_today
+        ]
+        self._completed_closes = (us_today, completed)
+        return completed
+
+    def get_live_status(self, current_price: float) -> Optional[TqBusData]:
+        """
+        실시간 가격 기준 TQ버스 상태 (틱 스냅샷용)
+        - SMA = 확정 종가 192일 + 현재가
+        - 3년 데이터는 하루 한 번만 조회
+        """
+        completed = self._get_completed_closes()
+        if not completed or not current_price:
+            return None
+
+        sma = self.calculate_sma(completed[-(self.SMA_PERIOD - 1):] + [current_price], self.SMA_PERIOD)
+        if sma is None:
+            return None
+
+        return self._make_status(current_price, sma)
+
     def record_trade(self, action: str, price: float, date: str = None):
         """
         거래 기록
@@ -312,14 +364,18 @@ class TqBusTracker:
 
         return None
 
-    def get_current_alert_level(self) -> Optional[float]:
+    def get_current_alert_level(self, status: Optional[TqBusData] = None) -> Optional[float]:
         """
         현재 가격이 속한 알림 레벨 반환
 
+        Args:
+            status: 미리 계산한 상태 (없으면 새로 조회)
+
         Returns:
             알림 레벨 (7.0, 5.0, 3.0, -3.0, -5.0, -7.0) 또는 None
         """
-        status = self.get_current_status()
+        if status is None:
+            status = self.get_current_status()
         if status is None:
             return None
 
@@ -350,23 +406,26 @@ class TqBusTracker:
 
         return None
 
-    def should_alert(self) -> Optional[float]:
+    def should_alert(self, status: Optional[TqBusData] = None) -> Optional[float]:
         """
         승하차 준비 알림 필요 여부
 
         Returns:
             알림 레벨 (7.0, 5.0, 3.0, -3.0, -5.0, -7.0) 또는 None
         """
-        return self.get_current_alert_level()
+        return self.get_current_alert_level(status)
 
-    def detect_crossover(self) -> Optional[str]:
+    def detect_crossover(self, data: Optional[Tuple[List[float], List[int], float]] = None) -> Optional[str]:
         """
         SMA 돌파 감지 (종가 기준)
 
+        Args:
+            data: 미리 조회한 get_tqqq_data() 결과 (없으면 직접 조회)
+
         Returns:
             'BUY' (상향 돌파), 'SELL' (하향 돌파), None (돌파 없음)
         """
-        result = self.get_tqqq_data()
+        result = data or self.get_tqqq_data()
         if not result:
             return None
 
@@ -396,17 +455,18 @@ class TqBusTracker:
 
         return None
 
-    def format_crossover_message(self, crossover_type: str) -> Optional[str]:
+    def format_crossover_message(self, crossover_type: str, data: Optional[Tuple[List[float], List[int], float]] = None) -> Optional[str]:
         """
         SMA 돌파 알림 메시지
 
         Args:
             crossover_type: 'BUY' or 'SELL'
+            data: 미리 조회한 get_tqqq_data() 결과 (없으면 직접 조회)
 
         Returns:
             알림 메시지
         """
-        status = self.get_current_status()
+        status = self.get_current_status(data)
         if status is None:
             return None
 
@@ -427,14 +487,19 @@ class TqBusTracker:
 
         return message
 
-    def format_status_message(self) -> str:
+    def format_status_message(self, data: Optional[Tuple[List[float], List[int], float]] = None) -> str:
         """
         현재 상태 메시지 포맷
 
+        Args:
+            data: 미리 조회한 get_tqqq_data() 결과 (없으면 직접 조회)
+
         Returns:
             포맷된 텔레그램 메시지
         """
-        status = self.get_current_status()
+        if data is None:
+            data = self.get_tqqq_data()
+        status = self.get_current_status(data)
         if status is None:
             return "TQ버스 데이터를 가져올 수 없습니다"
 
@@ -458,7 +523,7 @@ class TqBusTracker:
 
         # 승차 중인 경우 승차 정보 및 수익률 표시
         if status.position == 'TQQQ':
-            entry_point = self.find_last_entry_point()
+            entry_point = self.find_last_entry_point(data)
             if entry_point:
                 entry_profit = ((status.tqqq_price - entry_point['price']) / entry_point['price']) * 100
                 profit_emoji = "🟢" if entry_profit >= 0 else "🔴"
@@ -485,23 +550,25 @@ class TqBusTracker:
 
         return message
 
-    def format_alert_message(self, level: float = None) -> Optional[str]:
+    def format_alert_message(self, level: float = None, status: Optional[TqBusData] = None) -> Optional[str]:
         """
         승하차 준비 알림 메시지 포맷 (레벨별)
 
         Args:
             level: 알림 레벨 (7.0, 5.0, 3.0, -3.0, -5.0, -7.0)
+            status: 미리 계산한 상태 (없으면 새로 조회)
 
         Returns:
             알림 메시지 또는 None
         """
-        status = self.get_current_status()
+        if status is None:
+            status = self.get_current_status()
         if status is None:
             return None
 
         # 레벨이 지정되지 않았으면 현재 레벨 사용
         if level is None:
-            level = self.get_current_alert_level()
+            level = self.get_current_alert_level(status)
 
         if level is None:
             return None
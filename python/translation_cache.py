@@ -0,0 +1,179 @@
+"""
+영어 헤드라인 번역 (배치 요청 + 영구 LRU 캐시)
+
+- 한 번의 실행에서 번역할 제목을 모아 캐시에 없는 것만 한 번에 요청
+  (구글 번역은 줄바꿈으로 이어 붙여 1회 요청, 줄 수가 안 맞으면 건별 번역으로 폴백)
+- 캐시 키: 공백 정리한 원문 + 언어 쌍, 만료(7일) + 최대 개수 초과 시 오래 안 쓴 항목부터 제거
+- 캐시는 data/ 파일로 저장 (변경분이 있을 때만)
+- 번역기는 교체 가능: translate_batch(texts, src, dest) -> 번역 목록 을 가진 객체
+  (테스트용 LocalTranslator)
+"""
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'translation_cache.json')
+
+# 캐시 최대 항목 수 / 만료 (초)
+CACHE_MAX_ENTRIES = 5000
+CACHE_TTL = 7 * 24 * 60 * 60
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize(text: str) -> str:
+    """캐시 키용 원문 정리 (유니코드 정규화 + 공백 하나로)"""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class TranslationCache:
+    """만료 시간이 있는 LRU 캐시 (파일 저장)"""
+
+    def __init__(self, path: Optional[str] = CACHE_PATH, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, List]" = OrderedDict()  # 키 → [번역, 저장 epoch]
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[1] >= self.ttl:
+            if entry is not None:
+                del self._entries[key]
+                self._dirty = True
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: str):
+        self._entries[key] = [value, time.time()]
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self):
+        """변경분이 있으면 저장 (LRU 순서 유지)"""
+        if not self.path or not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(list(self._entries.items()), f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"번역 캐시 저장 오류: {e}")
+
+    def load(self):
+        """저장된 캐시 로드 (만료 항목 제외)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except Exception as e:
+            logger.error(f"번역 캐시 로드 오류: {e}")
+            return
+        now = time.time()
+        for key, (value, ts) in items:
+            if now - ts < self.ttl:
+                self._entries[key] = [value, ts]
+        logger.info(f"번역 캐시 로드: {len(self._entries)}개")
+
+
+class GoogleBatchTranslator:
+    """googletrans 배치 번역 (줄바꿈으로 이어 붙여 1회 요청)"""
+
+    def __init__(self, translator):
+        self.translator = translator
+
+    def translate_batch(self, texts: List[str], src: str, dest: str) -> List[str]:
+        joined = self.translator.translate('\n'.join(texts), src=src, dest=dest)
+        lines = (getattr(joined, 'text', '') or '').split('\n')
+        if len(lines) == len(texts):
+            return [line.strip() for line in lines]
+
+        # 줄 수가 안 맞으면 (줄이 합쳐지거나 나뉨) 건별 번역
+        logger.debug(f"배치 번역 줄 수 불일치 ({len(lines)}/{len(texts)}) - 건별 번역")
+        return [getattr(self.translator.translate(text, src=src, dest=dest), 'text', None) or text
+                for text in texts]
+
+
+class LocalTranslator:
+    """테스트용 로컬 번역기 ({원문: 번역} 또는 원문 → 번역 함수)"""
+
+    def __init__(self, mapping: Union[Dict[str, str], Callable[[str], str]]):
+        self.lookup = mapping if callable(mapping) else (lambda text: mapping.get(text, text))
+        self.calls = 0
+
+    def translate_batch(self, texts: List[str], src: str, dest: str) -> List[str]:
+        self.calls += 1
+        return [self.lookup(text) for text in texts]
+
+
+class BatchTranslator:
+    """캐시를 거쳐 캐시에 없는 원문만 한 번에 번역"""
+
+    def __init__(self, backend=None, cache: TranslationCache = None, src: str = 'en', dest: str = 'ko'):
+        """
+        Args:
+            backend: translate_batch(texts, src, dest)를 가진 번역기 (None이면 원문 그대로)
+            cache: 번역 캐시 (None이면 메모리 전용)
+        """
+        self.backend = backend
+        self.cache = cache if cache is not None else TranslationCache(path=None)
+        self.src = src
+        self.dest = dest
+
+    def _key(self, text: str) -> str:
+        return f"{self.src}>{self.dest}:{normalize(text)}"
+
+    def translate_many(self, texts: List[str]) -> List[str]:
+        """
+        여러 원문 번역 (입력 순서대로, 실패한 원문은 그대로)
+        """
+        results: Dict[str, str] = {}       # 캐시 키 → 번역
+        missing: Dict[str, str] = {}       # 캐시 키 → 정리한 원문 (같은 키는 한 번만 요청)
+        for text in texts:
+            if not text:
+                continue
+            key = self._key(text)
+            if key in results or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing[key] = normalize(text)
+
+        cached_count = len(results)
+        if missing and self.backend is not None:
+            try:
+                translated = self.backend.translate_batch(list(missing.values()), self.src, self.dest)
+                for key, value in zip(missing, translated):
+                    if value:
+                        results[key] = value
+                        self.cache.put(key, value)
+                logger.info(f"번역: {len(missing)}개 요청 1회 (캐시 적중 {cached_count}개)")
+            except Exception as e:
+                logger.debug(f"번역 오류: {e}")
+            self.cache.save()
+
+        return [results.get(self._key(text), text) if text else text for text in texts]
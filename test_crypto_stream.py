@@ -0,0 +1,68 @@
+"""
+암호화폐 웹소켓 스트림 테스트 (LocalBinanceStream 로컬 서버 사용, 네트워크 없음)
+"""
+import asyncio
+import sys
+import os
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from crypto_stream import CryptoStream, LocalBinanceStream
+
+
+async def _wait_for(condition, timeout: float = 5.0):
+    """조건이 참이 될 때까지 대기 (시간 초과 시 실패)"""
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "시간 초과"
+        await asyncio.sleep(0.02)
+
+
+async def run_stream_test():
+    server = LocalBinanceStream()
+    await server.start()
+    updates = []
+
+    async def on_update(symbol, price, day_open):
+        updates.append((symbol, price, day_open))
+
+    stream = CryptoStream(['BTC-USD', 'AAPL'], on_update, url=server.url)
+    assert stream.symbols == ['BTC-USD']  # Binance 종목만 구독
+    assert 'btcusdt@miniTicker' in stream.stream_url() and 'btcusdt@kline_1d' in stream.stream_url()
+
+    task = asyncio.get_event_loop().create_task(stream.run())
+    try:
+        await _wait_for(lambda: stream.connects == 1 and server._clients)
+
+        # 당일 시가를 받기 전에는 콜백/시세 없음
+        await server.push('BTCUSDT', 100000.0)
+        await _wait_for(lambda: stream.messages == 1)
+        assert updates == [] and stream.quote('BTC-USD') is None
+
+        await server.push('BTCUSDT', 101000.0, day_open=99000.0)
+        await _wait_for(lambda: len(updates) == 2)
+        assert updates[-1] == ('BTC-USD', 101000.0, 99000.0)
+        assert stream.quote('BTC-USD') == (101000.0, 99000.0)
+
+        # 서버가 끊으면 자동 재연결, 시가는 유지
+        await server.disconnect_all()
+        await _wait_for(lambda: stream.connects == 2 and server._clients)
+        await server.push('BTCUSDT', 102000.0)
+        await _wait_for(lambda: len(updates) == 3)
+        assert stream.quote('BTC-USD') == (102000.0, 99000.0)
+        assert stream.stats()['live'] == ['BTC-USD']
+    finally:
+        await stream.stop()
+        await asyncio.wait_for(task, timeout=5.0)
+        await server.stop()
+
+
+def test_crypto_stream():
+    asyncio.run(run_stream_test())
+
+
+if __name__ == "__main__":
+    test_crypto_stream()
+    print("암호화폐 스트림 테스트 통과")
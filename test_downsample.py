@@ -0,0 +1,55 @@
+"""
+차트 시계열 다운샘플링 (LTTB) 테스트
+"""
+import sys
+import os
+from datetime import date, timedelta
+
+import numpy as np
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from downsample import downsample, lttb_indices
+
+
+def test_lttb_keeps_shape():
+    """끝점 유지 + 오름차순 + 고점/저점 유지"""
+    n = 5000
+    x = np.arange(n)
+    rng = np.random.RandomState(7)
+    y = np.cumsum(rng.normal(0, 1, n)) + 100
+    y[1234] = y.max() + 50   # 급등
+    y[3456] = y.min() - 50   # 급락
+
+    for threshold in (800, 240, 50):
+        indices = lttb_indices(x, y, threshold)
+        assert len(indices) == threshold, (threshold, len(indices))
+        assert indices[0] == 0 and indices[-1] == n - 1
+        assert all(a < b for a, b in zip(indices, indices[1:]))
+        assert int(y.argmax()) in indices and int(y.argmin()) in indices, threshold
+
+
+def test_short_series_unchanged():
+    """점 수가 threshold 이하이거나 threshold가 3 미만이면 그대로"""
+    assert lttb_indices([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+    assert lttb_indices(range(10), range(10), 2) == list(range(10))
+    assert downsample([1, 2, 3], [4, 5, 6], 3) == ([1, 2, 3], [4, 5, 6])
+
+
+def test_downsample_dates():
+    """날짜 x는 숫자 x_values로 넓이 계산, 결과는 원래 날짜"""
+    start = date(2020, 1, 1)
+    dates = [start + timedelta(days=i) for i in range(1500)]
+    closes = [100 + 10 * np.sin(i / 40) for i in range(1500)]
+    xs, ys = downsample(dates, closes, 300, x_values=[d.toordinal() for d in dates])
+    assert len(xs) == len(ys) == 300
+    assert xs[0] == dates[0] and xs[-1] == dates[-1]
+    assert all(closes[dates.index(d)] == v for d, v in zip(xs[::50], ys[::50]))
+
+
+if __name__ == "__main__":
+    test_lttb_keeps_shape()
+    test_short_series_unchanged()
+    test_downsample_dates()
+    print("LTTB 다운샘플링 테스트 통과")
@@ -0,0 +1,144 @@
+"""
+공용 HTTP 클라이언트 테스트 (AIMD 동시성, 재시도, 서킷 브레이커 - 네트워크 없음)
+"""
+import io
+import sys
+import os
+import time
+
+import requests
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from http_client import HostLimiter, HostPolicy, HttpClient, endpoint_key
+
+# 토큰 대기 없이 AIMD만 보는 정책
+TEST_POLICY = HostPolicy(rate=100.0, max_rate=101.0, burst=100, max_concurrency=4, latency_target=1.0)
+
+
+def _response(status: int, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(b'')
+    response.headers.update(headers or {})
+    return response
+
+
+def _client(results) -> HttpClient:
+    """results 순서대로 응답(상태 코드) 또는 예외를 돌려주는 클라이언트 (백오프 대기 없음)"""
+    client = HttpClient()
+    results = list(results)
+
+    def fake_request(method, url, **kwargs):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return _response(result)
+
+    client.session.request = fake_request
+    client._sleep_backoff = lambda attempt, retry_after=None: None
+    return client
+
+
+def test_endpoint_key():
+    assert endpoint_key('https://query1.finance.yahoo.com/v8/finance/chart/AAPL?x=1') == \
+        'query1.finance.yahoo.com/v8/finance'
+    assert endpoint_key('https://example.com/') == 'example.com'
+
+
+def test_aimd():
+    """성공하면 한도 +1/한도, 429면 절반 (쿨다운 안에서는 1회), Retry-After 동안 차단"""
+    limiter = HostLimiter('example.com', TEST_POLICY)
+    start = limiter.limit
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release(200, 0.1)
+    assert start < limiter.limit == TEST_POLICY.max_concurrency
+    assert limiter.rate == TEST_POLICY.max_rate
+
+    # 응답 지연이 목표를 넘으면 0.75배
+    limiter.acquire()
+    limiter.release(200, 2.0)
+    assert limiter.limit == TEST_POLICY.max_concurrency * 0.75
+    time.sleep(1.0)  # 감소 쿨다운
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.release(429, 0.1, retry_after=0.2)
+    limiter.release(429, 0.1)
+    assert limiter.limit == TEST_POLICY.max_concurrency * 0.75 / 2, limiter.limit  # 쿨다운 → 한 번만 감소
+    assert limiter.in_flight == 0 and limiter.throttled == 2
+
+    # Retry-After 동안은 토큰이 있어도 대기
+    begin = time.monotonic()
+    limiter.acquire()
+    limiter.release(200, 0.1)
+    assert time.monotonic() - begin >= 0.15
+
+
+def test_circuit_breaker():
+    """연속 실패 → open, 대기 후 확인 요청 1개, 실패하면 대기 2배, 성공하면 닫힘"""
+    breaker = CircuitBreaker('test', failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+    try:
+        breaker.check()
+        assert False, "서킷이 열려 있으면 CircuitOpenError"
+    except CircuitOpenError:
+        pass
+
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()  # 확인 요청은 1개만
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.reset_timeout == 0.1
+
+    time.sleep(0.11)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.reset_timeout == 0.05 and breaker.trips == 2
+
+
+def test_retries():
+    """5xx/연결 오류는 재시도, 재시도 후에도 실패하면 마지막 응답/예외"""
+    client = _client([503, 500, 200])
+    assert client.get('https://example.com/a').status_code == 200
+
+    client = _client([503, 503, 503])
+    assert client.get('https://example.com/a').status_code == 503
+
+    client = _client([requests.ConnectionError('reset'), 200])
+    assert client.get('https://example.com/a').status_code == 200
+
+    client = _client([requests.ConnectionError('reset')] * 3)
+    try:
+        client.get('https://example.com/a')
+        assert False, "재시도 후에도 연결 실패면 예외"
+    except requests.ConnectionError:
+        pass
+    assert client.limiter('example.com').in_flight == 0
+
+
+def test_slot_released_on_unexpected_error():
+    """요청 외 예외도 동시성 슬롯 반환 (재시도/서킷 기록 없음)"""
+    client = _client([ValueError('bad argument')] * 5)
+    for _ in range(5):
+        try:
+            client.get('https://example.com/a')
+        except ValueError:
+            pass
+    assert client.limiter('example.com').in_flight == 0
+    assert client.breaker(endpoint_key('https://example.com/a')).failures == 0
+
+
+if __name__ == "__main__":
+    test_endpoint_key()
+    test_aimd()
+    test_circuit_breaker()
+    test_retries()
+    test_slot_released_on_unexpected_error()
+    print("HTTP 클라이언트 테스트 통과")
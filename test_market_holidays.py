@@ -0,0 +1,149 @@
+"""
+증시 휴장일 규칙 / 세션 캘린더 테스트 (NYSE, KRX 2024~2028 공식 휴장일과 비교)
+"""
+import sys
+import os
+from datetime import date, datetime
+
+import pytz
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from holiday_rules import easter_sunday, holidays_between, is_closed, is_early_close, holiday_name
+from market_sessions import SessionCalendar
+
+
+def _days(*items):
+    return {date(*item) for item in items}
+
+
+# NYSE 평일 휴장일
+US_HOLIDAYS = {
+    2024: _days((2024, 1, 1), (2024, 1, 15), (2024, 2, 19), (2024, 3, 29), (2024, 5, 27), (2024, 6, 19),
+                (2024, 7, 4), (2024, 9, 2), (2024, 11, 28), (2024, 12, 25)),
+    2025: _days((2025, 1, 1), (2025, 1, 9), (2025, 1, 20), (2025, 2, 17), (2025, 4, 18), (2025, 5, 26),
+                (2025, 6, 19), (2025, 7, 4), (2025, 9, 1), (2025, 11, 27), (2025, 12, 25)),
+    2026: _days((2026, 1, 1), (2026, 1, 19), (2026, 2, 16), (2026, 4, 3), (2026, 5, 25), (2026, 6, 19),
+                (2026, 7, 3), (2026, 9, 7), (2026, 11, 26), (2026, 12, 25)),
+    # 2028-01-01이 토요일이라 2027-12-31은 정상 거래
+    2027: _days((2027, 1, 1), (2027, 1, 18), (2027, 2, 15), (2027, 3, 26), (2027, 5, 31), (2027, 6, 18),
+                (2027, 7, 5), (2027, 9, 6), (2027, 11, 25), (2027, 12, 24)),
+    2028: _days((2028, 1, 17), (2028, 2, 21), (2028, 4, 14), (2028, 5, 29), (2028, 6, 19), (2028, 7, 4),
+                (2028, 9, 4), (2028, 11, 23), (2028, 12, 25)),
+}
+
+# NYSE 조기 마감일 (13:00 ET)
+US_EARLY_CLOSES = {
+    2024: _days((2024, 7, 3), (2024, 11, 29), (2024, 12, 24)),
+    2025: _days((2025, 7, 3), (2025, 11, 28), (2025, 12, 24)),
+    2026: _days((2026, 11, 27), (2026, 12, 24)),
+    2027: _days((2027, 11, 26)),
+    2028: _days((2028, 7, 3), (2028, 11, 24)),
+}
+
+# KRX 평일 휴장일 (선거일 / 임시공휴일 / 대체공휴일 / 연말 폐장일 포함)
+KR_HOLIDAYS = {
+    2024: _days((2024, 1, 1), (2024, 2, 9), (2024, 2, 12), (2024, 3, 1), (2024, 4, 10), (2024, 5, 1),
+                (2024, 5, 6), (2024, 5, 15), (2024, 6, 6), (2024, 8, 15), (2024, 9, 16), (2024, 9, 17),
+                (2024, 9, 18), (2024, 10, 1), (2024, 10, 3), (2024, 10, 9), (2024, 12, 25), (2024, 12, 31)),
+    2025: _days((2025, 1, 1), (2025, 1, 27), (2025, 1, 28), (2025, 1, 29), (2025, 1, 30), (2025, 3, 3),
+                (2025, 5, 1), (2025, 5, 5), (2025, 5, 6), (2025, 6, 3), (2025, 6, 6), (2025, 8, 15),
+                (2025, 10, 3), (2025, 10, 6), (2025, 10, 7), (2025, 10, 8), (2025, 10, 9), (2025, 12, 25),
+                (2025, 12, 31)),
+    2026: _days((2026, 1, 1), (2026, 2, 16), (2026, 2, 17), (2026, 2, 18), (2026, 3, 2), (2026, 5, 1),
+                (2026, 5, 5), (2026, 5, 25), (2026, 6, 3), (2026, 8, 17), (2026, 9, 24), (2026, 9, 25),
+                (2026, 10, 5), (2026, 10, 9), (2026, 12, 25), (2026, 12, 31)),
+    2027: _days((2027, 1, 1), (2027, 2, 8), (2027, 2, 9), (2027, 3, 1), (2027, 5, 5), (2027, 5, 13),
+                (2027, 8, 16), (2027, 9, 14), (2027, 9, 15), (2027, 9, 16), (2027, 10, 4), (2027, 10, 11),
+                (2027, 12, 27), (2027, 12, 31)),
+    2028: _days((2028, 1, 26), (2028, 1, 27), (2028, 1, 28), (2028, 3, 1), (2028, 4, 12), (2028, 5, 1),
+                (2028, 5, 2), (2028, 5, 5), (2028, 6, 6), (2028, 8, 15), (2028, 10, 2), (2028, 10, 3),
+                (2028, 10, 4), (2028, 10, 5), (2028, 10, 9), (2028, 12, 25), (2028, 12, 29)),
+}
+
+KR_ELECTION_DAYS = _days((2024, 4, 10), (2025, 6, 3), (2026, 6, 3), (2028, 4, 12))
+
+
+def test_easter():
+    """부활절 (Good Friday 기준일)"""
+    expected = {2024: date(2024, 3, 31), 2025: date(2025, 4, 20), 2026: date(2026, 4, 5),
+                2027: date(2027, 3, 28), 2028: date(2028, 4, 16)}
+    for year, day in expected.items():
+        assert easter_sunday(year) == day, (year, easter_sunday(year))
+
+
+def test_us_holidays():
+    """NYSE 휴장일 / 조기 마감일 2024~2028"""
+    for year, expected in US_HOLIDAYS.items():
+        actual = set(holidays_between('US', date(year, 1, 1), date(year, 12, 31)))
+        assert actual == expected, (year, sorted(actual ^ expected))
+
+    for year, expected in US_EARLY_CLOSES.items():
+        first, last = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+        actual = {date.fromordinal(n) for n in range(first, last + 1) if is_early_close('US', date.fromordinal(n))}
+        assert actual == expected, (year, sorted(actual ^ expected))
+
+    # 카터 전 대통령 국장일 (특별 휴장)
+    assert is_closed('US', date(2025, 1, 9))
+    assert 'Carter' in holiday_name('US', date(2025, 1, 9))
+    assert not is_closed('KR', date(2025, 1, 9))
+    # 주말
+    assert is_closed('US', date(2025, 1, 11)) and not is_closed('US', date(2025, 1, 10))
+
+
+def test_kr_holidays():
+    """KRX 휴장일 2024~2028 (선거일 포함)"""
+    for year, expected in KR_HOLIDAYS.items():
+        actual = set(holidays_between('KR', date(year, 1, 1), date(year, 12, 31)))
+        assert actual == expected, (year, sorted(actual ^ expected))
+
+    for day in KR_ELECTION_DAYS:
+        assert is_closed('KR', day), day
+        assert '선거' in holiday_name('KR', day), (day, holiday_name('KR', day))
+        assert not is_closed('US', day), day
+
+
+def _ts(tz: str, *args) -> float:
+    return pytz.timezone(tz).localize(datetime(*args)).timestamp()
+
+
+def test_sessions():
+    """세션 캘린더 (bisect 조회, 조기 마감, 휴장일 건너뛰기)"""
+    us = SessionCalendar('US', 2024, 2026)
+    kr = SessionCalendar('KR', 2024, 2026)
+    et, kst = 'America/New_York', 'Asia/Seoul'
+
+    # 휴장일에는 세션 없음 → 다음 개장은 다음 거래일
+    assert not us.is_trading_day(date(2025, 1, 9))
+    assert us.phase(_ts(et, 2025, 1, 9, 11, 0)) is None
+    assert us.next_open(_ts(et, 2025, 1, 9, 11, 0)) == _ts(et, 2025, 1, 10, 9, 30)
+
+    # 조기 마감일: 13:00 ET 정규장 마감, 이후 애프터마켓
+    assert us.next_close(_ts(et, 2025, 11, 28, 10, 0)) == _ts(et, 2025, 11, 28, 13, 0)
+    assert us.phase(_ts(et, 2025, 11, 28, 12, 59)) == 'regular'
+    assert us.phase(_ts(et, 2025, 11, 28, 13, 30)) == 'post'
+    assert us.phase(_ts(et, 2025, 11, 28, 17, 30)) is None
+    # 평소에는 16:00 마감 (서머타임 전환 후에도 현지 시각 기준)
+    assert us.next_close(_ts(et, 2025, 3, 10, 10, 0)) == _ts(et, 2025, 3, 10, 16, 0)
+    assert us.phase(_ts(et, 2025, 3, 10, 5, 0)) == 'pre'
+    assert us.is_open(_ts(et, 2025, 3, 10, 5, 0), extended=True)
+    assert not us.is_open(_ts(et, 2025, 3, 10, 5, 0))
+
+    # 금요일 마감 후 → 월요일 개장, 직전 마감은 금요일
+    friday_night = _ts(et, 2025, 3, 7, 21, 0)
+    assert us.next_open(friday_night) == _ts(et, 2025, 3, 10, 9, 30)
+    assert us.last_close(friday_night) == _ts(et, 2025, 3, 7, 16, 0)
+
+    # 한국: 설 연휴 + 임시공휴일 건너뛰기, 선거일 휴장
+    assert kr.next_open(_ts(kst, 2025, 1, 24, 16, 0)) == _ts(kst, 2025, 1, 31, 9, 0)
+    assert not kr.is_trading_day(date(2025, 6, 3))
+    assert kr.phase(_ts(kst, 2025, 6, 4, 10, 0)) == 'regular'
+
+
+if __name__ == "__main__":
+    test_easter()
+    test_us_holidays()
+    test_kr_holidays()
+    test_sessions()
+    print("휴장일 / 세션 캘린더 테스트 통과")
@@ -0,0 +1,82 @@
+"""
+뉴스 헤드라인 종목 태깅 (Aho-Corasick) / 유사 중복 인덱스 (MinHash + LSH) 테스트
+"""
+import sys
+import os
+import tempfile
+import time
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from news_matcher import AhoCorasick, WatchlistMatcher, get_watchlist_matcher
+from headline_index import HeadlineIndex, jaccard, tokenize
+
+
+def test_aho_corasick():
+    """겹치는 패턴 / 접두사 패턴 모두 찾기"""
+    automaton = AhoCorasick(['he', 'she', 'his', 'hers'])
+    matches = {(start, automaton.patterns[index]) for start, index in automaton.iter_matches('ushers')}
+    assert matches == {(1, 'she'), (2, 'he'), (2, 'hers')}, matches
+    assert automaton.contains_any('this')
+    assert not automaton.contains_any('xyz')
+
+
+def test_word_boundaries():
+    """영문 단어 경계 / 한글 조사 / 일반 단어 티커"""
+    matcher = get_watchlist_matcher()
+    cases = {
+        'Dow Jones falls 300 points': ['^DJI'],
+        'Dow Inc cuts dividend': ['DOW'],
+        'Analysts raise price target on Nvidia': ['NVDA'],
+        'AMDOCS reports earnings': [],
+        'AMD shares jump': ['AMD'],
+        '인텔리전스 기업 약진': [],
+        '인텔이 신고가': ['INTC'],
+        '애플주가 급등': ['AAPL'],
+        '엔비디아, 애플 동반 상승': ['NVDA', 'AAPL'],
+        '': [],
+    }
+    for text, expected in cases.items():
+        assert matcher.match(text) == expected, (text, matcher.match(text))
+
+
+def test_custom_aliases():
+    """심볼 여러 개가 같은 패턴을 공유 / 번역 기사는 원문 제목도 태깅"""
+    matcher = WatchlistMatcher({'JEPI': ['JEPI'], 'JEPQ': ['JEPQ'], 'O': ['Realty Income', '리얼티인컴']})
+    assert matcher.match('JEPI and JEPQ see record inflows') == ['JEPI', 'JEPQ']
+    articles = matcher.tag([{'title': '월배당 리츠 배당 인상', 'original_title': 'Realty Income raises dividend'}])
+    assert articles[0]['symbols'] == ['O']
+
+
+def test_headline_index():
+    """유사 헤드라인 중복 판단 + 24시간 보관 + 저장/로드"""
+    assert tokenize('Apple Beats, Earnings!') == frozenset({'apple', 'beats', 'earnings'})
+    assert jaccard(frozenset('ab'), frozenset('bc')) == 1 / 3
+
+    index = HeadlineIndex()
+    assert index.check_and_add('비트코인 급등 10만 달러 돌파')
+    assert not index.check_and_add('비트코인 급등 10만 달러 돌파 전망')  # 유사 (포함관계)
+    assert index.check_and_add('엔비디아 실적 발표')
+    assert index.find_duplicate('엔비디아 실적 발표 앞두고 변동성') is not None
+    assert index.find_duplicate('코스피 상승 마감') is None
+    assert len(index) == 2
+
+    path = os.path.join(tempfile.mkdtemp(), 'headline_index.json')
+    saved = HeadlineIndex(path)
+    saved.add('오래된 헤드라인 하나', ts=time.time() - 2 * 24 * 60 * 60)
+    saved.add('Fed holds rates steady')
+    saved.save()
+    loaded = HeadlineIndex(path)
+    loaded.load()
+    assert len(loaded) == 1
+    assert loaded.find_duplicate('Fed holds rates steady again') is not None
+    assert loaded.find_duplicate('오래된 헤드라인 하나') is None
+
+
+if __name__ == "__main__":
+    test_aho_corasick()
+    test_word_boundaries()
+    test_custom_aliases()
+    test_headline_index()
+    print("뉴스 태깅 / 중복 인덱스 테스트 통과")
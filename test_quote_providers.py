@@ -0,0 +1,94 @@
+"""
+시세 데이터 소스 헤지 요청 테스트 (local_provider 지연 소스 사용, 네트워크 없음)
+"""
+import sys
+import os
+import time
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from quote_providers import HEDGE_DEFAULT_DELAY, QuoteAggregator, local_provider
+
+QUOTES = {'AAPL': (230.0, 228.0)}
+BACKUP_QUOTES = {'AAPL': (230.5, 228.0)}
+
+
+def _timed_fetch(aggregator: QuoteAggregator, symbol: str):
+    start = time.monotonic()
+    result = aggregator.fetch(symbol)
+    return result, time.monotonic() - start
+
+
+def test_fast_primary():
+    """1순위 소스가 빠르면 헤지 없이 1순위 응답"""
+    aggregator = QuoteAggregator([local_provider('primary', QUOTES), local_provider('backup', BACKUP_QUOTES, delay=0.5)])
+    result, elapsed = _timed_fetch(aggregator, 'AAPL')
+    assert result == QUOTES['AAPL'] and elapsed < 0.3, (result, elapsed)
+    assert aggregator.stats()['backup']['calls'] == 0
+
+
+def test_hedge_on_slow_primary():
+    """1순위 소스가 헤지 대기 시간 안에 답하지 않으면 2순위 응답 사용"""
+    aggregator = QuoteAggregator([local_provider('primary', QUOTES, delay=HEDGE_DEFAULT_DELAY + 1.0),
+                                  local_provider('backup', BACKUP_QUOTES)])
+    result, elapsed = _timed_fetch(aggregator, 'AAPL')
+    assert result == BACKUP_QUOTES['AAPL'], result
+    assert HEDGE_DEFAULT_DELAY - 0.05 <= elapsed < HEDGE_DEFAULT_DELAY + 0.5, elapsed
+    assert aggregator.stats()['backup']['wins'] == 1
+
+
+def test_hedge_delay_follows_p95():
+    """평소 빠른 소스는 p95 기준으로 짧게 기다렸다가 헤지"""
+    state = {'delay': 0.0}
+
+    def primary(symbol):
+        time.sleep(state['delay'])
+        return QUOTES.get(symbol)
+
+    aggregator = QuoteAggregator([local_provider('primary', primary), local_provider('backup', BACKUP_QUOTES)])
+    for _ in range(12):
+        assert aggregator.fetch('AAPL') == QUOTES['AAPL']
+
+    state['delay'] = 1.0
+    result, elapsed = _timed_fetch(aggregator, 'AAPL')
+    assert result == BACKUP_QUOTES['AAPL'] and elapsed < 0.5, (result, elapsed)
+
+
+def test_failover_and_ranking():
+    """실패/예외 응답은 즉시 다음 소스, 계속 실패하는 소스는 뒤로"""
+    def broken(symbol):
+        raise RuntimeError('down')
+
+    aggregator = QuoteAggregator([local_provider('empty', {}), local_provider('broken', broken),
+                                  local_provider('good', QUOTES)])
+    result, elapsed = _timed_fetch(aggregator, 'AAPL')
+    assert result == QUOTES['AAPL'] and elapsed < 0.3, (result, elapsed)
+
+    for _ in range(10):
+        aggregator.fetch('AAPL')
+    assert [p.name for p in aggregator.rank('AAPL')][0] == 'good'
+    assert aggregator.stats()['broken']['failures'] >= 1
+
+    # 모든 소스 실패 / 잘못된 값 (0원)
+    assert aggregator.fetch('MSFT') is None
+    zero = QuoteAggregator([local_provider('zero', {'AAPL': (0.0, 228.0)})])
+    assert zero.fetch('AAPL') is None
+
+
+def test_routes():
+    """심볼별 후보 소스만 사용"""
+    aggregator = QuoteAggregator([local_provider('us', QUOTES), local_provider('kr', {'005930.KS': (70000.0, 69000.0)})],
+                                 routes=lambda symbol: ['kr'] if symbol.endswith('.KS') else ['us'])
+    assert aggregator.fetch('005930.KS') == (70000.0, 69000.0)
+    assert aggregator.fetch('AAPL') == QUOTES['AAPL']
+    assert aggregator.stats()['kr']['calls'] == 1
+
+
+if __name__ == "__main__":
+    test_fast_primary()
+    test_hedge_on_slow_primary()
+    test_hedge_delay_follows_p95()
+    test_failover_and_ranking()
+    test_routes()
+    print("시세 소스 헤지 요청 테스트 통과")
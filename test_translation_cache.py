@@ -0,0 +1,69 @@
+"""
+제목 번역 배치 + 캐시 테스트 (LocalTranslator 사용, 네트워크 없음)
+"""
+import sys
+import os
+import tempfile
+import time
+
+# python/ 폴더를 path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+
+from translation_cache import BatchTranslator, LocalTranslator, TranslationCache
+
+
+def test_batch_and_cache():
+    """캐시에 없는 원문만 1회 배치 요청, 같은 원문(공백 차이 포함)은 한 번만"""
+    backend = LocalTranslator({'Apple beats earnings': '애플 실적 상회', 'Fed holds rates': '연준 금리 동결'})
+    translator = BatchTranslator(backend)
+
+    result = translator.translate_many(['Apple beats earnings', 'Apple  beats earnings ', 'Fed holds rates', ''])
+    assert result == ['애플 실적 상회', '애플 실적 상회', '연준 금리 동결', ''], result
+    assert backend.calls == 1
+
+    # 두 번째 실행은 캐시만 사용
+    assert translator.translate_many(['Fed holds rates']) == ['연준 금리 동결']
+    assert backend.calls == 1 and translator.cache.hits >= 1
+
+
+def test_backend_failure():
+    """번역기 오류면 원문 그대로 (캐시에 저장 안 함)"""
+    def broken(text):
+        raise RuntimeError('quota')
+
+    translator = BatchTranslator(LocalTranslator(broken))
+    assert translator.translate_many(['Oil prices rise']) == ['Oil prices rise']
+    assert len(translator.cache) == 0
+    assert BatchTranslator(None).translate_many(['No backend']) == ['No backend']
+
+
+def test_cache_lru_ttl_and_persistence():
+    """LRU 최대 개수 / 만료 / 저장 후 로드"""
+    cache = TranslationCache(path=None, max_entries=2)
+    cache.put('a', '가')
+    cache.put('b', '나')
+    assert cache.get('a') == '가'   # a가 최근 사용 → b가 밀려남
+    cache.put('c', '다')
+    assert cache.get('b') is None and cache.get('a') == '가' and len(cache) == 2
+
+    expiring = TranslationCache(path=None, ttl=0.05)
+    expiring.put('a', '가')
+    time.sleep(0.06)
+    assert expiring.get('a') is None
+
+    path = os.path.join(tempfile.mkdtemp(), 'translation_cache.json')
+    saved = TranslationCache(path)
+    BatchTranslator(LocalTranslator(lambda text: f"[번역] {text}"), saved).translate_many(['Gold hits record'])
+    saved.save()
+    loaded = TranslationCache(path)
+    loaded.load()
+    backend = LocalTranslator(lambda text: 'X')
+    assert BatchTranslator(backend, loaded).translate_many(['Gold hits record']) == ['[번역] Gold hits record']
+    assert backend.calls == 0
+
+
+if __name__ == "__main__":
+    test_batch_and_cache()
+    test_backend_failure()
+    test_cache_lru_ttl_and_persistence()
+    print("번역 캐시 테스트 통과")